@@ -6,7 +6,10 @@ from agriwebb.core.client import (
     AgriWebbAPIError,
     ExternalAPIError,
     GraphQLError,
+    RateLimitedError,
     RetryableError,
+    close_graphql_client,
+    close_http_client,
     get_farm,
     get_farm_location,
     get_farm_timezone,
@@ -42,9 +45,12 @@ __all__ = [
     "to_timestamp_ms",
     "graphql",
     "graphql_with_retry",
+    "close_graphql_client",
+    "close_http_client",
     "http_get_with_retry",
     "GraphQLError",
     "RetryableError",
+    "RateLimitedError",
     "AgriWebbAPIError",
     "ExternalAPIError",
     "get_farm",
@@ -1,7 +1,12 @@
 """AgriWebb API client - core functions only."""
 
+import asyncio
+import contextlib
+import json
 import re
-from datetime import date, datetime
+import time
+from datetime import UTC, date, datetime
+from email.utils import parsedate_to_datetime
 from zoneinfo import ZoneInfo
 
 import httpx
@@ -12,7 +17,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
-from agriwebb.core.config import settings
+from agriwebb.core.config import get_cache_dir, settings
 
 API_URL = "https://api.agriwebb.com/v2"
 
@@ -23,6 +28,17 @@ API_URL = "https://api.agriwebb.com/v2"
 MAX_RETRIES = 3
 MIN_WAIT_SECONDS = 1
 MAX_WAIT_SECONDS = 10
+# Upper bound on a server-requested Retry-After delay for HTTP 429 responses
+MAX_RETRY_AFTER_SECONDS = 60
+
+# =============================================================================
+# Connection Pool Configuration
+# =============================================================================
+
+# Shared GraphQL and external-API clients keep connections alive so repeated
+# requests skip the TCP/TLS handshake
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 20
 
 
 # =============================================================================
@@ -61,6 +77,14 @@ class RetryableError(Exception):
     pass
 
 
+class RateLimitedError(RetryableError):
+    """HTTP 429 response; carries the server's Retry-After delay, if it sent one."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class AgriWebbAPIError(Exception):
     """Non-retryable error from AgriWebb API."""
 
@@ -78,10 +102,116 @@ class ExternalAPIError(Exception):
 # =============================================================================
 
 
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    """Return the Retry-After delay in seconds (delta-seconds or HTTP-date form)."""
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+_backoff_wait = wait_exponential_jitter(initial=MIN_WAIT_SECONDS, max=MAX_WAIT_SECONDS, jitter=2)
+
+
+def _wait_retry_after_or_backoff(retry_state) -> float:
+    """Wait as long as a 429 asked us to, otherwise use exponential backoff."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimitedError) and exc.retry_after is not None:
+        return min(exc.retry_after, MAX_RETRY_AFTER_SECONDS)
+    return _backoff_wait(retry_state)
+
+
+_graphql_client: httpx.AsyncClient | None = None
+_graphql_client_loop: asyncio.AbstractEventLoop | None = None
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+_request_semaphore: asyncio.Semaphore | None = None
+_request_semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding in-flight AgriWebb requests for this event loop.
+
+    Every `graphql_with_retry()` call shares it, so pagination, record fetches
+    and pushes all count against one AGRIWEBB_MAX_CONCURRENT_REQUESTS limit.
+    """
+    global _request_semaphore, _request_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _request_semaphore is None or _request_semaphore_loop is not loop:
+        _request_semaphore = asyncio.Semaphore(settings.agriwebb_max_concurrent_requests)
+        _request_semaphore_loop = loop
+    return _request_semaphore
+
+
+def _get_graphql_client() -> httpx.AsyncClient:
+    """Return the shared AgriWebb client, creating it on first use.
+
+    The client is bound to the event loop it was created on, so a new one is
+    built if a later `asyncio.run()` call starts a fresh loop.
+    """
+    global _graphql_client, _graphql_client_loop
+    loop = asyncio.get_running_loop()
+    if _graphql_client is None or _graphql_client.is_closed or _graphql_client_loop is not loop:
+        _graphql_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _graphql_client_loop = loop
+    return _graphql_client
+
+
+async def close_graphql_client() -> None:
+    """Close the shared AgriWebb client and release its pooled connections."""
+    global _graphql_client, _graphql_client_loop
+    if _graphql_client is not None:
+        await _graphql_client.aclose()
+    _graphql_client = None
+    _graphql_client_loop = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared client for external APIs (NOAA, Open-Meteo, ...).
+
+    Like the GraphQL client, it is rebuilt if the event loop changes.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared external-API client and release its pooled connections."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
 @retry(
     retry=retry_if_exception_type(RetryableError),
     stop=stop_after_attempt(MAX_RETRIES),
-    wait=wait_exponential_jitter(initial=MIN_WAIT_SECONDS, max=MAX_WAIT_SECONDS, jitter=2),
+    wait=_wait_retry_after_or_backoff,
     reraise=True,
 )
 async def http_get_with_retry(
@@ -94,6 +224,7 @@ async def http_get_with_retry(
     Retries on:
     - Timeouts (connect and read)
     - Connection errors
+    - HTTP 429 (rate limited), waiting for Retry-After when the server sends it
     - HTTP 5xx errors (server overload)
 
     Args:
@@ -108,15 +239,16 @@ async def http_get_with_retry(
         ExternalAPIError: If all retries fail or non-retryable error occurs
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=timeout)
-            response.raise_for_status()
-            return response
+        response = await _get_http_client().get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response
     except httpx.TimeoutException as e:
         raise RetryableError(f"Request timed out: {e}") from e
     except httpx.ConnectError as e:
         raise RetryableError(f"Connection failed: {e}") from e
     except httpx.HTTPStatusError as e:
+        if e.response.status_code == 429:
+            raise RateLimitedError("HTTP 429", _parse_retry_after(e.response)) from e
         if e.response.status_code >= 500:
             raise RetryableError(f"HTTP {e.response.status_code}") from e
         raise ExternalAPIError(f"HTTP {e.response.status_code}: {e.response.text}") from e
@@ -199,30 +331,41 @@ async def graphql(query: str, variables: dict | None = None) -> dict:
     if variables:
         payload["variables"] = variables
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            API_URL,
-            headers={
-                "x-api-key": settings.agriwebb_api_key,
-                "Content-Type": "application/json",
-            },
-            json=payload,
-            timeout=30,
-        )
-        response.raise_for_status()
+    client = _get_graphql_client()
+    response = await client.post(
+        API_URL,
+        headers={
+            "x-api-key": settings.agriwebb_api_key,
+            "Content-Type": "application/json",
+        },
+        json=payload,
+        timeout=30,
+    )
+    response.raise_for_status()
+
+    result = response.json()
+
+    if "errors" in result:
+        raise GraphQLError(result["errors"], query)
 
-        result = response.json()
+    return result
 
-        if "errors" in result:
-            raise GraphQLError(result["errors"], query)
 
-        return result
+async def graphql_once(query: str, variables: dict | None = None) -> dict:
+    """Execute a GraphQL request exactly once, holding the shared request semaphore.
+
+    For mutations that are not safe to resend (e.g. aliased bulk inserts, where
+    a retry would duplicate every alias that already committed). Errors are
+    raised as from `graphql()`; callers decide how to recover.
+    """
+    async with _get_request_semaphore():
+        return await graphql(query, variables)
 
 
 @retry(
     retry=retry_if_exception_type(RetryableError),
     stop=stop_after_attempt(MAX_RETRIES),
-    wait=wait_exponential_jitter(initial=MIN_WAIT_SECONDS, max=MAX_WAIT_SECONDS, jitter=2),
+    wait=_wait_retry_after_or_backoff,
     reraise=True,
 )
 async def graphql_with_retry(query: str, variables: dict | None = None) -> dict:
@@ -231,9 +374,14 @@ async def graphql_with_retry(query: str, variables: dict | None = None) -> dict:
     Retries on:
     - Timeouts
     - Connection errors
+    - HTTP 429 (rate limited), waiting for Retry-After when the server sends it
     - HTTP 5xx errors (server overload)
     - GraphQL errors with "Internal Server Error"
 
+    Each attempt holds the shared request semaphore, so at most
+    AGRIWEBB_MAX_CONCURRENT_REQUESTS calls are in flight at once; backoff
+    waits between retries do not hold a slot.
+
     After MAX_RETRIES failures, raises AgriWebbAPIError.
 
     Args:
@@ -247,7 +395,8 @@ async def graphql_with_retry(query: str, variables: dict | None = None) -> dict:
         AgriWebbAPIError: If all retries fail or non-retryable error occurs
     """
     try:
-        return await graphql(query, variables)
+        async with _get_request_semaphore():
+            return await graphql(query, variables)
     except httpx.TimeoutException as e:
         raise RetryableError(f"Request timed out: {e}") from e
     except httpx.ConnectError as e:
@@ -259,6 +408,9 @@ async def graphql_with_retry(query: str, variables: dict | None = None) -> dict:
         except Exception:
             body = "(unable to read response body)"
 
+        if e.response.status_code == 429:
+            # Rate limited - retry after the server's Retry-After, if given
+            raise RateLimitedError(f"HTTP 429: {body}", _parse_retry_after(e.response)) from e
         if e.response.status_code >= 500:
             # Server error - retry with backoff
             raise RetryableError(f"HTTP {e.response.status_code}: {body}") from e
@@ -293,12 +445,32 @@ async def get_farm_location() -> tuple[float, float]:
 
 _cached_farm_tz: ZoneInfo | None = None
 
+# The farm timezone rarely changes, so keep it on disk between CLI runs and
+# skip the farm lookup until the file is older than this
+FARM_TZ_CACHE_FILE = "farm_timezone.json"
+FARM_TZ_CACHE_MAX_AGE_DAYS = 30
+
+
+def _read_cached_farm_tz_name() -> str | None:
+    """Return the farm timezone name from the disk cache, if fresh and for this farm."""
+    try:
+        cache_path = get_cache_dir() / FARM_TZ_CACHE_FILE
+        if time.time() - cache_path.stat().st_mtime > FARM_TZ_CACHE_MAX_AGE_DAYS * 86400:
+            return None
+        cached = json.loads(cache_path.read_bytes())
+    except OSError, ValueError:
+        return None
+    if cached.get("farm_id") != settings.agriwebb_farm_id:
+        return None
+    return cached.get("time_zone")
+
 
 async def get_farm_timezone() -> ZoneInfo:
     """Get farm timezone from settings or AgriWebb.
 
-    Returns ZoneInfo object, cached for the session.
-    Checks TZ environment variable first, falls back to AgriWebb farm data.
+    Returns ZoneInfo object, cached for the session and on disk for
+    FARM_TZ_CACHE_MAX_AGE_DAYS. Checks TZ environment variable first,
+    then the disk cache, and falls back to AgriWebb farm data.
     """
     global _cached_farm_tz
     if _cached_farm_tz is not None:
@@ -307,8 +479,14 @@ async def get_farm_timezone() -> ZoneInfo:
     if settings.tz:
         tz_name = settings.tz
     else:
-        farm = await get_farm()
-        tz_name = farm.get("timeZone", "UTC")
+        tz_name = _read_cached_farm_tz_name()
+        if tz_name is None:
+            farm = await get_farm()
+            tz_name = farm.get("timeZone", "UTC")
+            # Best effort: an unwritable cache dir just means looking it up again next run
+            with contextlib.suppress(OSError):
+                cache_path = get_cache_dir() / FARM_TZ_CACHE_FILE
+                cache_path.write_text(json.dumps({"farm_id": settings.agriwebb_farm_id, "time_zone": tz_name}))
 
     _cached_farm_tz = ZoneInfo(tz_name)
     return _cached_farm_tz
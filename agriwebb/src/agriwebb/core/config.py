@@ -45,8 +45,12 @@ class Settings(BaseSettings):
     agriwebb_farm_id: str
     agriwebb_weather_sensor_id: str | None = None  # Created via setup command
 
+    # Max AgriWebb API requests in flight at once, across all callers
+    agriwebb_max_concurrent_requests: int = 5
+
     # Google Earth Engine
     gee_project_id: str | None = None  # GEE Cloud Project ID
+    gee_max_concurrent_requests: int = 8  # Parallel getInfo() calls per sync
 
     # Farm timezone (IANA format, e.g., "America/Los_Angeles")
     # If not set, will be fetched from AgriWebb farm data
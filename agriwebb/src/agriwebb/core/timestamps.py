@@ -1,8 +1,12 @@
 """Shared timestamp conversion utilities."""
 
 from datetime import UTC, date, datetime
+from functools import lru_cache
 
 
+# Pure function of the date; syncs and backfills convert the same few hundred
+# dates on every run, so memoize the parse + epoch math.
+@lru_cache(maxsize=4096)
 def to_timestamp_ms(d: str | date) -> int:
     """Convert a date string or date object to milliseconds timestamp (noon UTC).
 
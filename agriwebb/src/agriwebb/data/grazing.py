@@ -12,6 +12,7 @@ Then aggregates consumption by paddock to estimate grazing pressure.
 
 import json
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict
 
@@ -96,13 +97,30 @@ class PaddockConsumption(TypedDict):
     animals: list[str]  # Animal names for reference
 
 
+@lru_cache(maxsize=2)
+def _read_cache_json(cache_path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse a cache file; keyed on mtime/size so a rewritten file is re-read."""
+    with open(cache_path) as f:
+        return json.load(f)
+
+
+def _load_cache_json(cache_path: Path) -> dict:
+    """Load a cache file, reusing the previous parse if it is unchanged."""
+    stat = cache_path.stat()
+    return _read_cache_json(cache_path, stat.st_mtime_ns, stat.st_size)
+
+
 def load_farm_data(cache_path: Path | None = None) -> dict:
-    """Load cached farm data."""
+    """
+    Load cached farm data.
+
+    The parsed file is memoized until animals.json changes on disk, so the
+    returned dict is shared between callers and must not be mutated.
+    """
     if cache_path is None:
         cache_path = get_cache_dir() / "animals.json"
 
-    with open(cache_path) as f:
-        return json.load(f)
+    return _load_cache_json(cache_path)
 
 
 def load_fields(cache_path: Path | None = None) -> dict[str, dict]:
@@ -110,8 +128,7 @@ def load_fields(cache_path: Path | None = None) -> dict[str, dict]:
     if cache_path is None:
         cache_path = get_cache_dir() / "animals.json"
 
-    with open(cache_path) as f:
-        data = json.load(f)
+    data = _load_cache_json(cache_path)
 
     fields = data.get("fields", [])
     # Also try field_names for quick lookup
@@ -188,7 +205,7 @@ def get_wean_date(animal: dict) -> date | None:
             else:
                 birth = datetime.fromisoformat(birth_date_str.replace("Z", "")).date()
             return birth + timedelta(days=DEFAULT_WEANING_DAYS)
-        except (ValueError, TypeError):
+        except ValueError, TypeError:
             pass
 
     return None
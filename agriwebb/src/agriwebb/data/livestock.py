@@ -10,14 +10,18 @@ Provides functions to fetch and analyze animal data including:
 """
 
 import asyncio
-import contextlib
 import json
+import sys
 from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict
 
 from agriwebb.core import (
+    AgriWebbAPIError,
+    RetryableError,
+    close_graphql_client,
     get_cache_dir,
     graphql_with_retry,
     settings,
@@ -33,8 +37,9 @@ DEFAULT_CACHE_FILE = "animals.json"
 # Cache freshness threshold - skip re-fetch if cache is younger than this
 CACHE_FRESHNESS_HOURS = 24
 
-# Concurrency control: max parallel API requests
-MAX_CONCURRENT_REQUESTS = 5
+# Concurrency control: max parallel API requests. graphql_with_retry enforces
+# this limit for every caller; here it sizes the page waves and worker pool.
+MAX_CONCURRENT_REQUESTS = settings.agriwebb_max_concurrent_requests
 
 # Small delay between paginated requests (seconds)
 PAGINATION_DELAY = 0.1
@@ -42,6 +47,9 @@ PAGINATION_DELAY = 0.1
 # Circuit breaker - stop everything after too many consecutive failures
 MAX_CONSECUTIVE_FAILURES = 5
 
+# Animals per records request (aliased root fields in one GraphQL query)
+RECORDS_BATCH_SIZE = 25
+
 # =============================================================================
 # GraphQL Query Fragments (for individual queries)
 # =============================================================================
@@ -99,6 +107,72 @@ MANAGEMENT_GROUP_FIELDS = """
     }
 """
 
+# Common selection set for all find_animal lookup queries
+_FIND_ANIMAL_FIELDS = f"""
+        animalId
+        {ANIMAL_IDENTITY_FIELDS}
+        {ANIMAL_CHARACTERISTICS_FIELDS}
+        {ANIMAL_STATE_FIELDS}
+        {PARENTAGE_FIELDS}
+        {MANAGEMENT_GROUP_FIELDS}
+"""
+
+FIND_ANIMAL_BY_ID_QUERY = f"""
+query FindAnimalById($farmId: String!, $identifier: String!) {{
+  animals(farmId: $farmId, filter: {{ animalId: {{ _eq: $identifier }} }}) {{
+    {_FIND_ANIMAL_FIELDS}
+  }}
+}}
+"""
+
+FIND_ANIMAL_BY_NAME_QUERY = f"""
+query FindAnimalByName($farmId: String!, $identifier: String!) {{
+  animals(farmId: $farmId, filter: {{ identity: {{ name: {{ _eq: $identifier }} }} }}) {{
+    {_FIND_ANIMAL_FIELDS}
+  }}
+}}
+"""
+
+FIND_ANIMAL_BY_VID_QUERY = f"""
+query FindAnimalByVid($farmId: String!, $identifier: String!) {{
+  animals(farmId: $farmId, filter: {{ identity: {{ vid: {{ _eq: $identifier }} }} }}) {{
+    {_FIND_ANIMAL_FIELDS}
+  }}
+}}
+"""
+
+FIND_ANIMAL_BY_EID_QUERY = f"""
+query FindAnimalByEid($farmId: String!, $identifier: String!) {{
+  animals(farmId: $farmId, filter: {{ identity: {{ eid: {{ _eq: $identifier }} }} }}) {{
+    {_FIND_ANIMAL_FIELDS}
+  }}
+}}
+"""
+
+OFFSPRING_QUERY = f"""
+query GetAnimalsWithParentage($farmId: String!) {{
+  animals(farmId: $farmId) {{
+    animalId
+    {ANIMAL_IDENTITY_FIELDS}
+    {ANIMAL_CHARACTERISTICS_FIELDS}
+    {ANIMAL_STATE_FIELDS}
+    {PARENTAGE_FIELDS}
+  }}
+}}
+"""
+
+MOBS_QUERY = """
+query GetMobs($farmId: String!) {
+  managementGroups(farmId: $farmId) {
+    id
+    name
+    speciesCommonName
+    animalCount
+    currentLocationId
+  }
+}
+"""
+
 # =============================================================================
 # GraphQL Queries for Cache Download (using variables)
 # =============================================================================
@@ -167,10 +241,9 @@ query GetAnimals($farmId: String!, $limit: Int!, $skip: Int!) {
 }
 """
 
-# Records query for animal history - includes all record type fragments
-RECORDS_QUERY_FULL = """
-query GetRecords($farmId: String!, $animalId: String) {
-  records(options: {farmId: $farmId, animalId: $animalId}) {
+# Selection set shared by the single-animal and batched records queries -
+# includes all record type fragments
+RECORD_FIELDS = """
     recordId
     recordType
     observationDate
@@ -201,9 +274,18 @@ query GetRecords($farmId: String!, $animalId: String) {
         amount { value unit }
       }
     }
-  }
+"""
+
+# Records query for animal history
+RECORDS_QUERY_FULL = (
+    """
+query GetRecords($farmId: String!, $animalId: String) {
+  records(options: {farmId: $farmId, animalId: $animalId}) {"""
+    + RECORD_FIELDS
+    + """  }
 }
 """
+)
 
 
 CACHE_FIELDS_QUERY = """
@@ -263,6 +345,41 @@ class CircuitBreaker:
 # Normalization Helpers
 # =============================================================================
 
+# Enum-like fields repeated across thousands of animals/records. Interning them
+# keeps one shared string per distinct value instead of one per occurrence.
+_INTERNED_KEYS = frozenset(
+    {
+        "recordType",
+        "unit",
+        "locationId",
+        "currentLocationId",
+        "feedType",
+        "parentType",
+        "species",
+        "speciesCommonName",
+        "breedAssessed",
+        "sex",
+        "ageClass",
+        "fate",
+        "reproductiveStatus",
+    }
+)
+
+
+def _intern_strings[T](obj: T) -> T:
+    """Intern enum-like string values (see _INTERNED_KEYS) in parsed API data, in place."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, str):
+                if key in _INTERNED_KEYS:
+                    obj[key] = sys.intern(value)
+            elif isinstance(value, dict | list):
+                _intern_strings(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            _intern_strings(item)
+    return obj
+
 
 def _normalize_animal(animal: dict) -> dict:
     """
@@ -354,25 +471,8 @@ async def find_animal(identifier: str) -> dict:
     farm_id = settings.agriwebb_farm_id
     variables = {"farmId": farm_id, "identifier": identifier}
 
-    # Common selection set for all lookup queries
-    _fields = f"""
-        animalId
-        {ANIMAL_IDENTITY_FIELDS}
-        {ANIMAL_CHARACTERISTICS_FIELDS}
-        {ANIMAL_STATE_FIELDS}
-        {PARENTAGE_FIELDS}
-        {MANAGEMENT_GROUP_FIELDS}
-    """
-
     # Try by animalId first
-    query = f"""
-    query FindAnimalById($farmId: String!, $identifier: String!) {{
-      animals(farmId: $farmId, filter: {{ animalId: {{ _eq: $identifier }} }}) {{
-        {_fields}
-      }}
-    }}
-    """
-    result = await graphql_with_retry(query, variables)
+    result = await graphql_with_retry(FIND_ANIMAL_BY_ID_QUERY, variables)
 
     animals = result.get("data", {}).get("animals", [])
 
@@ -380,14 +480,7 @@ async def find_animal(identifier: str) -> dict:
         return _normalize_animal(animals[0])
 
     # Try by name (case-insensitive search via _ilike if supported, otherwise _eq)
-    query = f"""
-    query FindAnimalByName($farmId: String!, $identifier: String!) {{
-      animals(farmId: $farmId, filter: {{ identity: {{ name: {{ _eq: $identifier }} }} }}) {{
-        {_fields}
-      }}
-    }}
-    """
-    result = await graphql_with_retry(query, variables)
+    result = await graphql_with_retry(FIND_ANIMAL_BY_NAME_QUERY, variables)
 
     animals = result.get("data", {}).get("animals", [])
 
@@ -401,14 +494,7 @@ async def find_animal(identifier: str) -> dict:
         return _normalize_animal(animals[0])
 
     # Try by vid (visual tag)
-    query = f"""
-    query FindAnimalByVid($farmId: String!, $identifier: String!) {{
-      animals(farmId: $farmId, filter: {{ identity: {{ vid: {{ _eq: $identifier }} }} }}) {{
-        {_fields}
-      }}
-    }}
-    """
-    result = await graphql_with_retry(query, variables)
+    result = await graphql_with_retry(FIND_ANIMAL_BY_VID_QUERY, variables)
 
     animals = result.get("data", {}).get("animals", [])
 
@@ -422,14 +508,7 @@ async def find_animal(identifier: str) -> dict:
         return _normalize_animal(animals[0])
 
     # Try by eid
-    query = f"""
-    query FindAnimalByEid($farmId: String!, $identifier: String!) {{
-      animals(farmId: $farmId, filter: {{ identity: {{ eid: {{ _eq: $identifier }} }} }}) {{
-        {_fields}
-      }}
-    }}
-    """
-    result = await graphql_with_retry(query, variables)
+    result = await graphql_with_retry(FIND_ANIMAL_BY_EID_QUERY, variables)
 
     animals = result.get("data", {}).get("animals", [])
 
@@ -475,9 +554,9 @@ async def get_animals(
     Returns:
         List of animal records (normalized)
     """
-    farm_id = settings.agriwebb_farm_id
+    variables = {"farmId": settings.agriwebb_farm_id}
 
-    # Build filter
+    # Build filter (species is a schema enum, so it stays an inline literal)
     filters = []
     if status == "onFarm":
         filters.append("state: { onFarm: { _eq: true } }")
@@ -489,8 +568,8 @@ async def get_animals(
     lineage_fields = PARENTAGE_FIELDS if include_lineage else ""
 
     query = f"""
-    {{
-      animals(farmId: "{farm_id}"{filter_str}) {{
+    query GetAnimals($farmId: String!) {{
+      animals(farmId: $farmId{filter_str}) {{
         animalId
         {ANIMAL_IDENTITY_FIELDS}
         {ANIMAL_CHARACTERISTICS_FIELDS}
@@ -500,7 +579,7 @@ async def get_animals(
       }}
     }}
     """
-    result = await graphql_with_retry(query)
+    result = await graphql_with_retry(query, variables)
 
     animals = result.get("data", {}).get("animals", [])
     return [_normalize_animal(a) for a in animals]
@@ -575,23 +654,12 @@ async def get_offspring(identifier: str) -> list[dict]:
     """
     parent = await find_animal(identifier)
     parent_id = parent["id"]
-    farm_id = settings.agriwebb_farm_id
 
     # Query for animals where this animal is in sires or dams
     # We need to fetch all animals and filter client-side since
     # the parentage filter structure may vary
-    query = f"""
-    {{
-      animals(farmId: "{farm_id}") {{
-        animalId
-        {ANIMAL_IDENTITY_FIELDS}
-        {ANIMAL_CHARACTERISTICS_FIELDS}
-        {ANIMAL_STATE_FIELDS}
-        {PARENTAGE_FIELDS}
-      }}
-    }}
-    """
-    result = await graphql_with_retry(query)
+    variables = {"farmId": settings.agriwebb_farm_id}
+    result = await graphql_with_retry(OFFSPRING_QUERY, variables)
 
     all_animals = result.get("data", {}).get("animals", [])
 
@@ -619,20 +687,8 @@ async def get_mobs() -> list[dict]:
     Returns:
         List of mob records with animal counts
     """
-    farm_id = settings.agriwebb_farm_id
-
-    query = f"""
-    {{
-      managementGroups(farmId: "{farm_id}") {{
-        id
-        name
-        speciesCommonName
-        animalCount
-        currentLocationId
-      }}
-    }}
-    """
-    result = await graphql_with_retry(query)
+    variables = {"farmId": settings.agriwebb_farm_id}
+    result = await graphql_with_retry(MOBS_QUERY, variables)
 
     groups = result.get("data", {}).get("managementGroups", [])
     return [
@@ -647,6 +703,25 @@ async def get_mobs() -> list[dict]:
     ]
 
 
+def _animal_record_filter(animal_id: str | None) -> tuple[str, str, dict]:
+    """Build variable definitions, filter clause and variables for farm record queries.
+
+    Args:
+        animal_id: Filter to specific animal (optional)
+
+    Returns:
+        Tuple of (variable definitions, filter clause, variables dict)
+    """
+    var_defs = ["$farmId: String!"]
+    filter_str = ""
+    variables = {"farmId": settings.agriwebb_farm_id}
+    if animal_id:
+        var_defs.append("$animalId: String!")
+        filter_str = ", filter: { animalId: { _eq: $animalId } }"
+        variables["animalId"] = animal_id
+    return ", ".join(var_defs), filter_str, variables
+
+
 async def get_weights(
     animal_id: str | None = None,
     start_date: str | None = None,
@@ -663,17 +738,11 @@ async def get_weights(
     Returns:
         List of weight records
     """
-    farm_id = settings.agriwebb_farm_id
-
-    filters = []
-    if animal_id:
-        filters.append(f'animalId: {{ _eq: "{animal_id}" }}')
-
-    filter_str = f", filter: {{ {', '.join(filters)} }}" if filters else ""
+    var_defs, filter_str, variables = _animal_record_filter(animal_id)
 
     query = f"""
-    {{
-      weightRecords(farmId: "{farm_id}"{filter_str}) {{
+    query GetWeights({var_defs}) {{
+      weightRecords(farmId: $farmId{filter_str}) {{
         id
         recordedAt
         weight
@@ -682,7 +751,7 @@ async def get_weights(
       }}
     }}
     """
-    result = await graphql_with_retry(query)
+    result = await graphql_with_retry(query, variables)
 
     return result.get("data", {}).get("weightRecords", [])
 
@@ -701,17 +770,11 @@ async def get_treatments(
     Returns:
         List of treatment records
     """
-    farm_id = settings.agriwebb_farm_id
-
-    filters = []
-    if animal_id:
-        filters.append(f'animalId: {{ _eq: "{animal_id}" }}')
-
-    filter_str = f", filter: {{ {', '.join(filters)} }}" if filters else ""
+    var_defs, filter_str, variables = _animal_record_filter(animal_id)
 
     query = f"""
-    {{
-      treatmentRecords(farmId: "{farm_id}"{filter_str}) {{
+    query GetTreatments({var_defs}) {{
+      treatmentRecords(farmId: $farmId{filter_str}) {{
         id
         recordedAt
         treatmentType
@@ -722,7 +785,7 @@ async def get_treatments(
       }}
     }}
     """
-    result = await graphql_with_retry(query)
+    result = await graphql_with_retry(query, variables)
 
     return result.get("data", {}).get("treatmentRecords", [])
 
@@ -737,17 +800,11 @@ async def get_pregnancies(animal_id: str | None = None) -> list[dict]:
     Returns:
         List of pregnancy records
     """
-    farm_id = settings.agriwebb_farm_id
-
-    filters = []
-    if animal_id:
-        filters.append(f'animalId: {{ _eq: "{animal_id}" }}')
-
-    filter_str = f", filter: {{ {', '.join(filters)} }}" if filters else ""
+    var_defs, filter_str, variables = _animal_record_filter(animal_id)
 
     query = f"""
-    {{
-      pregnancyRecords(farmId: "{farm_id}"{filter_str}) {{
+    query GetPregnancies({var_defs}) {{
+      pregnancyRecords(farmId: $farmId{filter_str}) {{
         id
         recordedAt
         pregnancyStatus
@@ -758,7 +815,7 @@ async def get_pregnancies(animal_id: str | None = None) -> list[dict]:
       }}
     }}
     """
-    result = await graphql_with_retry(query)
+    result = await graphql_with_retry(query, variables)
 
     return result.get("data", {}).get("pregnancyRecords", [])
 
@@ -775,35 +832,47 @@ async def _fetch_all_animals_for_cache(
     """
     Fetch all animals with full details using pagination.
 
+    The API does not report a total count, so after the first page comes back
+    full the following pages are requested in concurrent waves of
+    MAX_CONCURRENT_REQUESTS, stopping at the first short page.
+
     Args:
         page_size: Number of animals per page (default 200)
         on_progress: Optional callback for progress updates, called with (message: str)
 
     Returns:
-        List of all animal records
+        List of all animal records, in API order
     """
     farm_id = settings.agriwebb_farm_id
-    all_animals = []
-    skip = 0
-
-    if on_progress:
-        on_progress("Fetching animals from AgriWebb...")
 
-    while True:
+    async def fetch_page(skip: int) -> list[dict]:
         variables = {"farmId": farm_id, "limit": page_size, "skip": skip}
         result = await graphql_with_retry(ANIMALS_QUERY, variables)
-        animals = result.get("data", {}).get("animals", [])
-        all_animals.extend(animals)
+        return _intern_strings(result.get("data", {}).get("animals", []))
 
-        if len(animals) < page_size:
-            # Last page - no more animals
-            break
+    if on_progress:
+        on_progress("Fetching animals from AgriWebb...")
 
-        skip += page_size
+    all_animals = await fetch_page(0)
+    skip = page_size
+    more = len(all_animals) == page_size
+
+    while more:
         if on_progress:
             on_progress(f"  Fetched {len(all_animals)} animals so far...")
         await asyncio.sleep(PAGINATION_DELAY)
 
+        skips = [skip + i * page_size for i in range(MAX_CONCURRENT_REQUESTS)]
+        pages = await asyncio.gather(*[fetch_page(s) for s in skips])
+        # gather preserves order, so pages line up with their skip offsets
+        for animals in pages:
+            all_animals.extend(animals)
+            if len(animals) < page_size:
+                # Last page - no more animals
+                more = False
+                break
+        skip += page_size * len(skips)
+
     if on_progress:
         on_progress(f"  Found {len(all_animals)} animals total")
     return all_animals
@@ -829,7 +898,40 @@ async def _fetch_animal_records(animal_id: str) -> list[dict]:
     farm_id = settings.agriwebb_farm_id
     variables = {"farmId": farm_id, "animalId": animal_id}
     result = await graphql_with_retry(RECORDS_QUERY_FULL, variables)
-    return result.get("data", {}).get("records", [])
+    return _intern_strings(result.get("data", {}).get("records", []))
+
+
+@lru_cache
+def _build_records_batch_query(count: int) -> str:
+    """Build a records query fetching `count` animals in one request.
+
+    Each animal gets an aliased root field (a0, a1, ...) bound to its own
+    $a<i> variable, so the IDs travel as variables rather than being
+    interpolated into the query text. Cached per batch size, so a cache run
+    builds at most two query strings (full batches and the final short one).
+    """
+    params = "".join(f", $a{i}: String" for i in range(count))
+    fields = "".join(
+        f"  a{i}: records(options: {{farmId: $farmId, animalId: $a{i}}}) {{{RECORD_FIELDS}  }}\n" for i in range(count)
+    )
+    return f"query GetRecordsBatch($farmId: String!{params}) {{\n{fields}}}\n"
+
+
+async def _fetch_animal_records_batch(animal_ids: list[str]) -> dict[str, list[dict]]:
+    """Fetch records for several animals in a single GraphQL request.
+
+    Args:
+        animal_ids: The animal IDs to fetch records for
+
+    Returns:
+        Dict mapping each animal ID to its list of records
+    """
+    variables = {"farmId": settings.agriwebb_farm_id}
+    for i, animal_id in enumerate(animal_ids):
+        variables[f"a{i}"] = animal_id
+    result = await graphql_with_retry(_build_records_batch_query(len(animal_ids)), variables)
+    data = _intern_strings(result.get("data") or {})
+    return {animal_id: data.get(f"a{i}") or [] for i, animal_id in enumerate(animal_ids)}
 
 
 async def _fetch_fields_for_cache(
@@ -861,9 +963,53 @@ async def _fetch_fields_for_cache(
     return fields
 
 
+def _write_cache_file(output_path: Path, data: dict, pretty: bool) -> None:
+    """Serialize the cache dict to disk (compact unless `pretty`)."""
+    with open(output_path, "w") as f:
+        if pretty:
+            json.dump(data, f, indent=2, default=str)
+        else:
+            json.dump(data, f, separators=(",", ":"), default=str)
+
+
+def build_animal_indices(animals: list[dict]) -> dict[str, dict[str, int]]:
+    """Build lookup indices mapping identifiers to positions in `animals`.
+
+    Names and visual tags are lower-cased for case-insensitive lookup.
+
+    Args:
+        animals: Raw animal records (as stored in animals.json)
+
+    Returns:
+        Dict with by_id, by_name, by_vid and by_eid index dicts
+    """
+    by_id: dict[str, int] = {}
+    by_name: dict[str, int] = {}
+    by_vid: dict[str, int] = {}
+    by_eid: dict[str, int] = {}
+    for i, a in enumerate(animals):
+        by_id[a["animalId"]] = i
+        identity = a.get("identity")
+        if not identity:
+            continue
+        name = identity.get("name")
+        vid = identity.get("vid")
+        eid = identity.get("eid")
+        if name:
+            by_name[name.lower()] = i
+        if vid:
+            by_vid[vid.lower()] = i
+        if eid:
+            by_eid[eid] = i
+
+    return {"by_id": by_id, "by_name": by_name, "by_vid": by_vid, "by_eid": by_eid}
+
+
 async def cache_all_animals(
     output_path: Path,
     on_progress: Callable[[str], None] | None = None,
+    with_indices: bool = False,
+    pretty: bool = False,
 ) -> dict:
     """Download all animal data to a local cache file.
 
@@ -873,6 +1019,9 @@ async def cache_all_animals(
     Args:
         output_path: Path to write the cache file
         on_progress: Optional callback for progress updates, called with (message: str)
+        with_indices: Embed by_id/by_name/by_vid/by_eid lookup indices in the file
+        pretty: Indent the JSON for human reading (compact by default, as the
+            file is normally read by code)
 
     Returns:
         The cached data dict
@@ -887,52 +1036,46 @@ async def cache_all_animals(
     log("=" * 60)
     log("")
 
-    # Fetch animals (without embedded records - we'll fetch those separately)
-    animals = await _fetch_all_animals_for_cache(on_progress=on_progress)
-
-    # Fetch fields for location name mapping
-    fields = await _fetch_fields_for_cache(on_progress=on_progress)
-    field_names = {f["id"]: f["name"] for f in fields}
+    # All API calls share one pooled client - release it once the download ends
+    try:
+        # Fetch animals (without embedded records - we'll fetch those separately)
+        animals = await _fetch_all_animals_for_cache(on_progress=on_progress)
+
+        # Fetch fields for location name mapping
+        fields = await _fetch_fields_for_cache(on_progress=on_progress)
+        field_names = {f["id"]: f["name"] for f in fields}
+
+        # Extract management groups from animals (since direct query may lack permissions)
+        groups_by_id = {
+            mg["managementGroupId"]: mg
+            for a in animals
+            if (mg := a.get("managementGroup")) and mg.get("managementGroupId")
+        }
+        groups = list(groups_by_id.values())
+        log(f"  Extracted {len(groups)} management groups from animals")
+
+        # Fetch complete records in batches of animals with concurrency control
+        batch_count = -(-len(animals) // RECORDS_BATCH_SIZE)
+        log("")
+        log(
+            f"Fetching records for {len(animals)} animals "
+            f"({batch_count} batches of {RECORDS_BATCH_SIZE}, {MAX_CONCURRENT_REQUESTS} concurrent)..."
+        )
 
-    # Extract management groups from animals (since direct query may lack permissions)
-    groups_by_id = {}
-    for a in animals:
-        mg = a.get("managementGroup")
-        if mg and mg.get("managementGroupId"):
-            groups_by_id[mg["managementGroupId"]] = mg
-    groups = list(groups_by_id.values())
-    log(f"  Extracted {len(groups)} management groups from animals")
+        circuit_breaker = CircuitBreaker()
+        progress = {"completed": 0, "records": 0, "errors": 0, "skipped": 0}
+        progress_lock = asyncio.Lock()
 
-    # Fetch complete records for each animal with concurrency control
-    log("")
-    log(f"Fetching records for {len(animals)} animals ({MAX_CONCURRENT_REQUESTS} concurrent)...")
-
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-    circuit_breaker = CircuitBreaker()
-    progress = {"completed": 0, "records": 0, "errors": 0, "skipped": 0}
-    progress_lock = asyncio.Lock()
-
-    async def fetch_with_semaphore(animal: dict) -> None:
-        """Fetch records for a single animal with semaphore control."""
-        # Check circuit breaker before attempting
-        try:
-            await circuit_breaker.check()
-        except CircuitBreakerOpen:
-            animal["records"] = []
-            async with progress_lock:
-                progress["skipped"] += 1
-            return
-
-        async with semaphore:
-            animal_id = animal["animalId"]
+        async def fetch_one(animal: dict) -> None:
+            """Fetch records for a single animal (fallback when a batch fails)."""
             try:
-                records = await _fetch_animal_records(animal_id)
+                records = await _fetch_animal_records(animal["animalId"])
                 animal["records"] = records
                 await circuit_breaker.record_success()
                 async with progress_lock:
                     progress["completed"] += 1
                     progress["records"] += len(records)
-            except RuntimeError as e:
+            except (AgriWebbAPIError, RetryableError) as e:
                 animal["records"] = []
                 await circuit_breaker.record_failure()
                 async with progress_lock:
@@ -942,15 +1085,53 @@ async def cache_all_animals(
                 if not circuit_breaker.is_open:
                     log(f"  Warning: {e}")
 
-            # Progress update every 25 animals
-            async with progress_lock:
-                if progress["completed"] % 25 == 0 or progress["completed"] == len(animals):
-                    log(f"  Progress: {progress['completed']}/{len(animals)} animals, {progress['records']} records")
+        async def fetch_batch(batch: list[dict]) -> None:
+            """Fetch records for a batch of animals."""
+            # Check circuit breaker before attempting
+            try:
+                await circuit_breaker.check()
+            except CircuitBreakerOpen:
+                for animal in batch:
+                    animal["records"] = []
+                async with progress_lock:
+                    progress["skipped"] += len(batch)
+                return
 
-    # Run all fetches concurrently with semaphore limiting
-    # Circuit breaker may have stopped some tasks - suppress any exceptions
-    with contextlib.suppress(Exception):
-        await asyncio.gather(*[fetch_with_semaphore(animal) for animal in animals])
+            try:
+                records_by_id = await _fetch_animal_records_batch([a["animalId"] for a in batch])
+            except AgriWebbAPIError, RetryableError:
+                # One bad animal can fail the whole batch - retry individually
+                for animal in batch:
+                    await fetch_one(animal)
+            else:
+                for animal in batch:
+                    animal["records"] = records_by_id[animal["animalId"]]
+                await circuit_breaker.record_success()
+                async with progress_lock:
+                    progress["completed"] += len(batch)
+                    progress["records"] += sum(len(a["records"]) for a in batch)
+
+            # Progress update after every batch - a plain read, as nothing
+            # awaits between the counter updates above and this line
+            log(f"  Progress: {progress['completed']}/{len(animals)} animals, {progress['records']} records")
+
+        # A fixed pool of workers pulls batches lazily, so only
+        # MAX_CONCURRENT_REQUESTS fetches (and their results) are in flight at
+        # once, rather than one pending task per batch
+        batches = (animals[i : i + RECORDS_BATCH_SIZE] for i in range(0, len(animals), RECORDS_BATCH_SIZE))
+
+        async def worker() -> None:
+            for batch in batches:
+                await fetch_batch(batch)
+
+        # Let every worker finish before the shared client is closed, then
+        # surface the first unexpected failure
+        results = await asyncio.gather(*[worker() for _ in range(MAX_CONCURRENT_REQUESTS)], return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+    finally:
+        await close_graphql_client()
 
     # Check if we stopped due to circuit breaker
     if circuit_breaker.is_open:
@@ -980,29 +1161,16 @@ async def cache_all_animals(
         "field_names": field_names,
     }
 
-    # Add some computed indices for easier lookup
-    data["indices"] = {
-        "by_id": {a["animalId"]: i for i, a in enumerate(animals)},
-        "by_name": {},
-        "by_vid": {},
-        "by_eid": {},
-    }
-
-    for i, a in enumerate(animals):
-        identity = a.get("identity") or {}
-        if identity.get("name"):
-            data["indices"]["by_name"][identity["name"].lower()] = i
-        if identity.get("vid"):
-            data["indices"]["by_vid"][identity["vid"].lower()] = i
-        if identity.get("eid"):
-            data["indices"]["by_eid"][identity["eid"]] = i
+    # Lookup indices are optional - consumers can rebuild them with build_animal_indices()
+    if with_indices:
+        data["indices"] = build_animal_indices(animals)
 
     # Write to file
     log("")
     log(f"Writing to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    # Encoding and writing a large cache takes a while - keep it off the event loop
+    await asyncio.to_thread(_write_cache_file, output_path, data, pretty)
 
     size_mb = output_path.stat().st_size / (1024 * 1024)
     log(f"  Wrote {size_mb:.2f} MB")
@@ -1144,6 +1312,10 @@ async def cli_main() -> None:
     cache_parser = subparsers.add_parser("cache", help="Download all animal data to local cache")
     cache_parser.add_argument("--output", "-o", type=str, help="Output file path")
     cache_parser.add_argument("--refresh", action="store_true", help="Force full re-fetch, ignoring cache age")
+    cache_parser.add_argument(
+        "--with-indices", action="store_true", help="Embed name/tag/EID lookup indices in the cache file"
+    )
+    cache_parser.add_argument("--pretty", action="store_true", help="Write indented, human-readable JSON")
 
     args = parser.parse_args()
 
@@ -1256,7 +1428,7 @@ async def cli_main() -> None:
                 print(f"File: {output_path}")
                 return
 
-        await cache_all_animals(output_path, on_progress=print)
+        await cache_all_animals(output_path, on_progress=print, with_indices=args.with_indices, pretty=args.pretty)
 
     else:
         parser.print_help()
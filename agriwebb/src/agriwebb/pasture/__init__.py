@@ -20,6 +20,7 @@ from agriwebb.pasture.biomass import (
     calculate_growth_rate,
     get_season,
     ndvi_to_standing_dry_matter,
+    select_sdm_model,
 )
 from agriwebb.pasture.cli import cli
 from agriwebb.pasture.growth import (
@@ -49,6 +50,7 @@ __all__ = [
     "load_weather_history",
     # biomass
     "ndvi_to_standing_dry_matter",
+    "select_sdm_model",
     "calculate_growth_rate",
     "get_season",
     "calculate_grazing_correction",
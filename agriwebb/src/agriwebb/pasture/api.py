@@ -1,8 +1,15 @@
 """AgriWebb API functions for pasture/growth data."""
 
+import asyncio
+
 from agriwebb.core.config import settings
 from agriwebb.core.timestamps import to_timestamp_ms
 
+# Max records per add-mutation. Larger pushes are split into chunks that are
+# sent concurrently (bounded by the shared request semaphore) and retried
+# independently, so one failure doesn't re-send the whole farm.
+MUTATION_BATCH_SIZE = 200
+
 # =============================================================================
 # GraphQL Queries
 # =============================================================================
@@ -67,6 +74,34 @@ mutation AddStandingDryMatter($input: [AddTotalStandingDryMatterInput!]!) {
 # =============================================================================
 
 
+async def _add_in_chunks(mutation: str, inputs: list[dict], field: str, items_key: str) -> dict:
+    """
+    Run an add-mutation over ``inputs`` in chunks of MUTATION_BATCH_SIZE.
+
+    Args:
+        mutation: GraphQL mutation taking an ``$input`` list
+        inputs: Mutation input objects
+        field: Mutation result field (e.g. "addFeedOnOffers")
+        items_key: List key under the result field (e.g. "feedOnOffers")
+
+    Returns:
+        The API response, or for multiple chunks a response of the same shape
+        with the created items concatenated in input order.
+    """
+    from agriwebb.core.client import graphql_with_retry
+
+    if len(inputs) <= MUTATION_BATCH_SIZE:
+        return await graphql_with_retry(mutation, {"input": inputs})
+
+    chunks = [inputs[i : i + MUTATION_BATCH_SIZE] for i in range(0, len(inputs), MUTATION_BATCH_SIZE)]
+    results = await asyncio.gather(*(graphql_with_retry(mutation, {"input": chunk}) for chunk in chunks))
+
+    items = []
+    for result in results:
+        items.extend(((result.get("data") or {}).get(field) or {}).get(items_key, []))
+    return {"data": {field: {items_key: items}}}
+
+
 async def add_pasture_growth_rates_batch(
     records: list[dict],
 ) -> dict:
@@ -79,8 +114,6 @@ async def add_pasture_growth_rates_batch(
     Returns:
         AgriWebb API response
     """
-    from agriwebb.core.client import graphql_with_retry
-
     inputs = []
     for rec in records:
         timestamp_ms = to_timestamp_ms(rec["record_date"])
@@ -93,8 +126,7 @@ async def add_pasture_growth_rates_batch(
             }
         )
 
-    variables = {"input": inputs}
-    return await graphql_with_retry(ADD_PASTURE_GROWTH_RATE_MUTATION, variables)
+    return await _add_in_chunks(ADD_PASTURE_GROWTH_RATE_MUTATION, inputs, "addPastureGrowthRates", "pastureGrowthRates")
 
 
 async def add_feed_on_offer_batch(
@@ -116,8 +148,6 @@ async def add_feed_on_offer_batch(
     Note:
         API only accepts records within the last 14 days.
     """
-    from agriwebb.core.client import graphql_with_retry
-
     inputs = []
     for rec in records:
         timestamp_ms = to_timestamp_ms(rec["record_date"])
@@ -131,8 +161,7 @@ async def add_feed_on_offer_batch(
             }
         )
 
-    variables = {"input": inputs}
-    return await graphql_with_retry(ADD_FEED_ON_OFFER_MUTATION, variables)
+    return await _add_in_chunks(ADD_FEED_ON_OFFER_MUTATION, inputs, "addFeedOnOffers", "feedOnOffers")
 
 
 async def add_standing_dry_matter_batch(
@@ -153,8 +182,6 @@ async def add_standing_dry_matter_batch(
     Note:
         API only accepts records within the last 14 days.
     """
-    from agriwebb.core.client import graphql_with_retry
-
     inputs = []
     for rec in records:
         timestamp_ms = to_timestamp_ms(rec["record_date"])
@@ -167,8 +194,7 @@ async def add_standing_dry_matter_batch(
             }
         )
 
-    variables = {"input": inputs}
-    return await graphql_with_retry(ADD_STANDING_DRY_MATTER_MUTATION, variables)
+    return await _add_in_chunks(ADD_STANDING_DRY_MATTER_MUTATION, inputs, "addTotalStandingDryMatters", "feedOnOffers")
 
 
 async def get_pasture_growth_rates(
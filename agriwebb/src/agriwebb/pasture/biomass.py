@@ -35,8 +35,10 @@ Seasonal Notes (from literature):
 - Peak growth typically spring when temperature + moisture are optimal
 """
 
+import math
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 
 from agriwebb.pasture.growth import Season
 from agriwebb.pasture.growth import get_season as _get_season_from_date
@@ -314,8 +316,6 @@ def ndre_to_lai(ndre: float) -> float:
     Returns:
         LAI (m² leaf / m² ground), clamped to [0, 6]
     """
-    import math
-
     if ndre <= NDRE_SOIL:
         return 0.0
 
@@ -360,6 +360,7 @@ def lai_to_standing_dry_matter(
     return round(sdm_total, 0)
 
 
+@lru_cache(maxsize=12)
 def get_season(month: int) -> Season:
     """Get season from month number (1-12).
 
@@ -368,6 +369,38 @@ def get_season(month: int) -> Season:
     return _get_season_from_date(date(2000, month, 15))
 
 
+def select_sdm_model(month: int | None = None, index: str = "NDVI") -> CalibrationModel:
+    """
+    Select the SDM calibration model for a vegetation index and month.
+
+    Batch callers converting many values for the same month should resolve the
+    model once here and pass it to ``ndvi_to_standing_dry_matter(model=...)``.
+
+    Args:
+        month: Month number (1-12) for seasonal model selection, or None for
+            the annual model.
+        index: Vegetation index — "NDVI" (default), "EVI", or "NDRE".
+
+    Returns:
+        The matching CalibrationModel.
+    """
+    if index == "EVI":
+        seasonal = SEASONAL_MODELS_EVI
+        annual = ANNUAL_MODEL_EVI
+    elif index == "NDVI":
+        seasonal = SEASONAL_MODELS
+        annual = ANNUAL_MODEL
+    elif index == "NDRE":
+        seasonal = SEASONAL_MODELS_NDRE
+        annual = ANNUAL_MODEL_NDRE
+    else:
+        raise ValueError(f"Unknown vegetation index: {index!r} (use 'NDVI', 'EVI', or 'NDRE')")
+
+    if month is not None:
+        return seasonal[get_season(month)]
+    return annual
+
+
 def ndvi_to_standing_dry_matter(
     ndvi: float,
     month: int | None = None,
@@ -395,26 +428,8 @@ def ndvi_to_standing_dry_matter(
         Accuracy is approximately ±260-350 kg DM/ha based on literature [4].
         Local calibration with harvest data can improve this significantly.
     """
-    import math
-
     if model is None:
-        if index == "EVI":
-            seasonal = SEASONAL_MODELS_EVI
-            annual = ANNUAL_MODEL_EVI
-        elif index == "NDVI":
-            seasonal = SEASONAL_MODELS
-            annual = ANNUAL_MODEL
-        elif index == "NDRE":
-            seasonal = SEASONAL_MODELS_NDRE
-            annual = ANNUAL_MODEL_NDRE
-        else:
-            raise ValueError(f"Unknown vegetation index: {index!r} (use 'NDVI', 'EVI', or 'NDRE')")
-
-        if month is not None:
-            season = get_season(month)
-            model = seasonal[season]
-        else:
-            model = annual
+        model = select_sdm_model(month, index)
 
     # Handle below-threshold index (bare soil / minimal vegetation)
     if ndvi < model.min_ndvi:
@@ -540,8 +555,6 @@ def calculate_grazing_correction(
         >>> calculate_grazing_correction(150)  # Very heavy
         0.35
     """
-    import math
-
     # Base exponential decay model
     # correction = base * exp(-decay * pressure)
     correction = GRAZING_BASE_CORRECTION * math.exp(-GRAZING_DECAY_RATE * grazing_pressure_kg_ha_day)
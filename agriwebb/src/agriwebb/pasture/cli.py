@@ -963,19 +963,22 @@ async def update_ndvi_cache_smart(refresh: bool = False) -> None:
     import json
 
     from agriwebb.satellite import gee as satellite
-    from agriwebb.satellite.ndvi_historical import fetch_paddock_history
+    from agriwebb.satellite.ndvi_historical import fetch_paddock_history, month_schedule
 
     cache_path = get_cache_dir() / "ndvi_historical.json"
     today = await get_farm_today()
 
     # Load existing cache
     existing_data = None
+    cached_at = None
     if not refresh and cache_path.exists():
         with open(cache_path) as f:
             existing_data = json.load(f)
         if existing_data:
             print(f"    Cache has data for {existing_data.get('paddock_count', 0)} paddocks")
             print(f"    Last fetched: {existing_data.get('fetched_at', 'unknown')}")
+            if existing_data.get("fetched_at"):
+                cached_at = date.fromisoformat(existing_data["fetched_at"])
 
     print("Initializing Google Earth Engine...")
     satellite.initialize(project=settings.gee_project_id)
@@ -985,6 +988,8 @@ async def update_ndvi_cache_smart(refresh: bool = False) -> None:
     print(f"Found {len(paddocks)} paddocks")
     print()
 
+    months = month_schedule(start_year=2018, today=today)
+
     all_data: NDVIHistoricalData = {
         "fetched_at": today.isoformat(),
         "start_year": 2018,
@@ -1002,23 +1007,14 @@ async def update_ndvi_cache_smart(refresh: bool = False) -> None:
             print("skipped (no geometry)")
             continue
 
-        # Check if we can skip (use cached data)
+        # Months that were already settled when the cache was fetched are
+        # reused; missing, failed, and recent months are fetched from GEE
+        cached_history = None
         if not refresh and existing_data and pid in existing_data.get("paddocks", {}):
-            cached_history = existing_data["paddocks"][pid].get("history", [])
-            if cached_history:
-                # Check if we need to update (last month might be incomplete)
-                last_month = cached_history[-1].get("month") if cached_history else None
-                current_month = f"{today.year}-{today.month:02d}"
-
-                if last_month and last_month >= current_month:
-                    # Cache is up to date
-                    all_data["paddocks"][pid] = existing_data["paddocks"][pid]
-                    valid_count = sum(1 for r in cached_history if r.get("ndvi_mean") is not None)
-                    print(f"{valid_count} months (cached)")
-                    continue
+            cached_history = existing_data["paddocks"][pid].get("history")
 
         try:
-            history = await fetch_paddock_history(paddock)
+            history = await fetch_paddock_history(paddock, months, cached=cached_history, cached_at=cached_at)
             valid_count = sum(1 for r in history if r["ndvi_mean"] is not None)
             print(f"{valid_count} months")
 
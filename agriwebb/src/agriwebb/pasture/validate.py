@@ -344,7 +344,7 @@ def load_paddock_history(paddock_id: str, limit: int = TEMPORAL_HISTORY_LIMIT) -
     try:
         with open(path) as f:
             records = json.load(f)
-    except (json.JSONDecodeError, OSError):
+    except json.JSONDecodeError, OSError:
         return []
     if not isinstance(records, list):
         return []
@@ -364,7 +364,7 @@ def append_paddock_history(paddock_id: str, record: dict) -> None:
                 loaded = json.load(f)
             if isinstance(loaded, list):
                 history = loaded
-        except (json.JSONDecodeError, OSError):
+        except json.JSONDecodeError, OSError:
             history = []
     history.append(record)
     history = history[-TEMPORAL_HISTORY_KEEP:]
@@ -36,6 +36,10 @@ HLS_S30 = "NASA/HLS/HLSS30/v002"  # Sentinel-2 harmonized
 # Sentinel-2 Surface Reflectance (L2A) — native band set including red-edge
 S2_SR_HARMONIZED = "COPERNICUS/S2_SR_HARMONIZED"
 
+# Index statistics are kept to 4 decimals (the ×10000 fixed-point precision of
+# the 16-bit HLS/MODIS products); more digits are noise and only bloat caches
+INDEX_DECIMALS = 4
+
 # NLCD for tree masking (2021 release covers CONUS)
 # Land cover classes 41, 42, 43 are forest types
 NLCD_LANDCOVER = "USGS/NLCD_RELEASES/2021_REL/NLCD"
@@ -388,17 +392,8 @@ def _get_tree_mask(geometry: ee.Geometry) -> ee.Image:
     return non_tree_mask
 
 
-def _calculate_tree_cover_pct(geometry: ee.Geometry, scale: int = 30) -> float | None:
-    """
-    Calculate the percentage of a geometry covered by trees.
-
-    Args:
-        geometry: Earth Engine geometry
-        scale: Resolution in meters (30m matches NLCD native resolution)
-
-    Returns:
-        Percentage of area covered by trees (0-100), or None if calculation fails
-    """
+def _reduce_tree_fraction(geometry: ee.Geometry, scale: int = 30) -> ee.Dictionary:
+    """Build the (lazy) reduction giving the tree-covered fraction of a geometry."""
     tree_mask = _get_tree_mask(geometry)
 
     # tree_mask is 1 for non-tree, 0 for tree
@@ -406,13 +401,27 @@ def _calculate_tree_cover_pct(geometry: ee.Geometry, scale: int = 30) -> float |
     tree_pixels = tree_mask.Not()
 
     # Calculate mean of tree pixels (gives fraction that is trees)
-    stats = tree_pixels.reduceRegion(
+    return tree_pixels.reduceRegion(
         reducer=ee.Reducer.mean(),
         geometry=geometry,
         scale=scale,
         maxPixels=int(1e8),
     )
 
+
+def _calculate_tree_cover_pct(geometry: ee.Geometry, scale: int = 30) -> float | None:
+    """
+    Calculate the percentage of a geometry covered by trees.
+
+    Args:
+        geometry: Earth Engine geometry
+        scale: Resolution in meters (30m matches NLCD native resolution)
+
+    Returns:
+        Percentage of area covered by trees (0-100), or None if calculation fails
+    """
+    stats = _reduce_tree_fraction(geometry, scale)
+
     try:
         result = stats.getInfo()
         if result:
@@ -525,19 +534,62 @@ def extract_paddock_ndvi(
     Returns:
         PaddockNDVI with statistics for the selected index.
     """
+    # Statistics and tree cover are reduced server-side and come back
+    # together in one getInfo() round-trip
+    return extract_paddock_ndvi_multi(paddock, [(start_date, end_date)], scale, mask_trees, index)[0]
+
+
+def extract_paddock_ndvi_multi(
+    paddock: dict,
+    windows: list[tuple[str, str]],
+    scale: int = 10,
+    mask_trees: bool = True,
+    index: str = "NDVI",
+) -> list[PaddockNDVI]:
+    """
+    Extract vegetation-index statistics for a paddock over several date windows.
+
+    Equivalent to calling ``extract_paddock_ndvi`` once per window, but every
+    composite is reduced server-side into a single ``ee.List`` and fetched
+    with one ``getInfo()`` round-trip. Tree cover is fetched separately so an
+    NLCD failure only leaves ``tree_cover_pct`` as None.
+
+    Args:
+        paddock: AgriWebb paddock dict with 'id', 'name', 'geometry'
+        windows: List of (start_date, end_date) tuples (YYYY-MM-DD)
+        scale: Resolution in meters
+        mask_trees: If True, mask out tree-covered pixels using NLCD
+        index: Vegetation index — "NDVI" (default) or "EVI"
+
+    Returns:
+        One PaddockNDVI per window, in the same order as ``windows``.
+    """
     if index not in ("NDVI", "EVI"):
         raise ValueError(f"Unknown vegetation index: {index!r} (use 'NDVI' or 'EVI')")
 
     geometry = _agriwebb_to_ee_geometry(paddock["geometry"])
 
-    # Calculate tree cover percentage before masking
+    reductions = [
+        _reduce_paddock_stats(
+            get_ndvi_composite(geometry, start, end, mask_trees=mask_trees, index=index),
+            geometry,
+            scale,
+        )
+        for start, end in windows
+    ]
+    results = ee.List(reductions).getInfo()
+
     tree_cover_pct = _calculate_tree_cover_pct(geometry) if mask_trees else None
 
-    # Get composite (with tree masking if enabled)
-    composite = get_ndvi_composite(geometry, start_date, end_date, mask_trees=mask_trees, index=index)
+    return [
+        _to_paddock_ndvi(paddock, start, end, stats_dict or {}, scale, index, tree_cover_pct)
+        for (start, end), stats_dict in zip(windows, results, strict=True)
+    ]
 
-    # Calculate statistics over the paddock
-    stats = composite.reduceRegion(
+
+def _reduce_paddock_stats(composite: ee.Image, geometry: ee.Geometry, scale: int) -> ee.Dictionary:
+    """Build the (lazy) mean/min/max/stdDev/count reduction of a composite over a paddock."""
+    return composite.reduceRegion(
         reducer=ee.Reducer.mean()
         .combine(ee.Reducer.minMax(), sharedInputs=True)
         .combine(ee.Reducer.stdDev(), sharedInputs=True)
@@ -547,9 +599,17 @@ def extract_paddock_ndvi(
         maxPixels=int(1e8),
     )
 
-    # Get values (returns None if no valid pixels)
-    stats_dict = stats.getInfo() or {}
 
+def _to_paddock_ndvi(
+    paddock: dict,
+    start_date: str,
+    end_date: str,
+    stats_dict: dict,
+    scale: int,
+    index: str,
+    tree_cover_pct: float | None,
+) -> PaddockNDVI:
+    """Convert a fetched stats dictionary into a PaddockNDVI result."""
     # Calculate approximate cloud-free percentage
     # (ratio of valid pixels to expected pixels based on area)
     area_ha = paddock.get("totalArea", 0)
@@ -557,15 +617,19 @@ def extract_paddock_ndvi(
     actual_pixels = stats_dict.get(f"{index}_count", 0) or 0
     cloud_free_pct = (actual_pixels / expected_pixels * 100) if expected_pixels > 0 else 0
 
+    def stat(name: str) -> float | None:
+        value = stats_dict.get(f"{index}_{name}")
+        return round(value, INDEX_DECIMALS) if value is not None else None
+
     return PaddockNDVI(
         paddock_id=paddock["id"],
         paddock_name=paddock.get("name", "Unknown"),
         date_start=start_date,
         date_end=end_date,
-        ndvi_mean=stats_dict.get(f"{index}_mean"),
-        ndvi_min=stats_dict.get(f"{index}_min"),
-        ndvi_max=stats_dict.get(f"{index}_max"),
-        ndvi_stddev=stats_dict.get(f"{index}_stdDev"),
+        ndvi_mean=stat("mean"),
+        ndvi_min=stat("min"),
+        ndvi_max=stat("max"),
+        ndvi_stddev=stat("stdDev"),
         pixel_count=actual_pixels,
         cloud_free_pct=round(cloud_free_pct, 1),
         tree_cover_pct=tree_cover_pct,
@@ -61,7 +61,7 @@ async def main():
     # Save results
     output_file = get_cache_dir() / "ndvi_results.json"
     with open(output_file, "w") as f:
-        json.dump(results, f, indent=2)
+        json.dump(results, f, separators=(",", ":"))
     print(f"\nResults saved to {output_file}")
 
     # Summary statistics
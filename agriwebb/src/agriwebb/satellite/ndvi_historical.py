@@ -34,58 +34,94 @@ class NDVIHistoricalData(TypedDict):
     paddocks: dict[str, PaddockNDVIData]
 
 
-async def fetch_paddock_history(paddock: dict, start_year: int = 2018) -> list[dict]:
-    """Fetch monthly NDVI history for a single paddock."""
-    results = []
-    current_year = date.today().year
-    current_month = date.today().month
-
-    for year in range(start_year, current_year + 1):
+def month_schedule(start_year: int = 2018, today: date | None = None) -> list[tuple[date, date, int, int]]:
+    """Build the (start, end, year, month) list of months from start_year through today.
+
+    Computed once per run and shared by every paddock, so the per-paddock loop
+    does no date arithmetic.
+    """
+    today = today or date.today()
+    months = []
+    for year in range(start_year, today.year + 1):
         for month in range(1, 13):
             # Skip future months
-            if year == current_year and month > current_month:
+            if (year, month) > (today.year, today.month):
                 break
-
             start = date(year, month, 1)
             # End of month
             if month == 12:
                 end = date(year + 1, 1, 1) - timedelta(days=1)
             else:
                 end = date(year, month + 1, 1) - timedelta(days=1)
+            months.append((start, end, year, month))
+    return months
+
+
+async def fetch_paddock_history(
+    paddock: dict,
+    months: list[tuple[date, date, int, int]],
+    cached: list[dict] | None = None,
+    cached_at: date | None = None,
+) -> list[dict]:
+    """Fetch monthly NDVI history for a single paddock.
+
+    `months` comes from `month_schedule()`. A month in `cached` (a previous
+    history for this paddock, fetched on `cached_at`) is reused instead of
+    queried again only if it was already settled when fetched: it ended
+    before the month preceding `cached_at`, since late scenes can still land
+    in the current and previous month. Failed months, and everything when
+    `cached_at` is unknown, are always fetched.
+    """
+    results = []
 
-            try:
-                result = satellite.extract_paddock_ndvi(
-                    paddock,
-                    start.isoformat(),
-                    end.isoformat(),
-                    scale=30,
-                )
-
-                results.append(
-                    {
-                        "date": start.isoformat(),
-                        "year": year,
-                        "month": month,
-                        "ndvi_mean": result["ndvi_mean"],
-                        "ndvi_stddev": result["ndvi_stddev"],
-                        "pixel_count": result["pixel_count"],
-                        "cloud_free_pct": result["cloud_free_pct"],
-                    }
-                )
-
-            except Exception as e:
-                results.append(
-                    {
-                        "date": start.isoformat(),
-                        "year": year,
-                        "month": month,
-                        "ndvi_mean": None,
-                        "ndvi_stddev": None,
-                        "pixel_count": 0,
-                        "cloud_free_pct": 0,
-                        "error": str(e),
-                    }
-                )
+    reusable = {}
+    if cached and cached_at:
+        prev_month = cached_at.replace(day=1) - timedelta(days=1)
+        settled_before = prev_month.replace(day=1)
+        reusable = {
+            (r["year"], r["month"]): r
+            for r in cached
+            if "error" not in r and date(r["year"], r["month"], 1) < settled_before
+        }
+
+    for start, end, year, month in months:
+        if (year, month) in reusable:
+            results.append(reusable[(year, month)])
+            continue
+
+        try:
+            result = satellite.extract_paddock_ndvi(
+                paddock,
+                start.isoformat(),
+                end.isoformat(),
+                scale=30,
+            )
+
+            results.append(
+                {
+                    "date": start.isoformat(),
+                    "year": year,
+                    "month": month,
+                    "ndvi_mean": result["ndvi_mean"],
+                    "ndvi_stddev": result["ndvi_stddev"],
+                    "pixel_count": result["pixel_count"],
+                    "cloud_free_pct": result["cloud_free_pct"],
+                }
+            )
+
+        except Exception as e:
+            results.append(
+                {
+                    "date": start.isoformat(),
+                    "year": year,
+                    "month": month,
+                    "ndvi_mean": None,
+                    "ndvi_stddev": None,
+                    "pixel_count": 0,
+                    "cloud_free_pct": 0,
+                    "error": str(e),
+                }
+            )
 
     return results
 
@@ -98,6 +134,18 @@ async def main():
 
     # Ensure cache directory exists
     get_cache_dir().mkdir(parents=True, exist_ok=True)
+    output_file = get_cache_dir() / "ndvi_historical.json"
+
+    # Previously fetched months are reused rather than re-queried
+    existing_paddocks = {}
+    existing_fetched_at = None
+    if output_file.exists():
+        with open(output_file) as f:
+            existing = json.load(f)
+        existing_paddocks = existing.get("paddocks", {})
+        if existing.get("fetched_at"):
+            existing_fetched_at = date.fromisoformat(existing["fetched_at"])
+        print(f"Reusing cached history for {len(existing_paddocks)} paddocks")
 
     # Initialize GEE
     print("Initializing Google Earth Engine...")
@@ -109,6 +157,8 @@ async def main():
     print(f"Found {len(paddocks)} paddocks")
     print()
 
+    months = month_schedule(start_year=2018)
+
     # Fetch historical data for each paddock
     all_data: NDVIHistoricalData = {
         "fetched_at": date.today().isoformat(),
@@ -128,7 +178,8 @@ async def main():
             continue
 
         try:
-            history = await fetch_paddock_history(paddock)
+            cached = existing_paddocks.get(pid, {}).get("history")
+            history = await fetch_paddock_history(paddock, months, cached=cached, cached_at=existing_fetched_at)
             valid_count = sum(1 for r in history if r["ndvi_mean"] is not None)
             print(f"{valid_count} months of data")
 
@@ -143,9 +194,8 @@ async def main():
             print(f"error: {e}")
 
     # Save to cache
-    output_file = get_cache_dir() / "ndvi_historical.json"
     with open(output_file, "w") as f:
-        json.dump(all_data, f, indent=2)
+        json.dump(all_data, f, separators=(",", ":"))
 
     print()
     print(f"Data saved to: {output_file}")
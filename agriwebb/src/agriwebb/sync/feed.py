@@ -11,22 +11,27 @@ Usage:
     uv run python -m agriwebb.sync_foo              # Show current FOO estimates
     uv run python -m agriwebb.sync_foo --sync       # Push to AgriWebb
     uv run python -m agriwebb.sync_foo --dry-run    # Show what would be pushed
+    uv run python -m agriwebb.sync_foo --sync --force  # Re-push already-synced values
     uv run python -m agriwebb.sync_foo --no-grazing-adjust  # Skip grazing correction
+    uv run python -m agriwebb.sync_foo --top 10     # Only list the 10 highest-FOO paddocks
 """
 
 import argparse
 import asyncio
+import heapq
 import json
-from datetime import date
+from collections.abc import Iterable
+from datetime import date, timedelta
 
 from agriwebb.core import get_cache_dir
 from agriwebb.data.grazing import PaddockConsumption, calculate_paddock_consumption, load_farm_data, load_fields
 from agriwebb.pasture import add_feed_on_offer_batch, add_standing_dry_matter_batch
 from agriwebb.pasture.biomass import (
     EXPECTED_UNCERTAINTY,
-    adjust_foo_for_grazing,
+    calculate_grazing_correction,
     get_season,
     ndvi_to_standing_dry_matter,
+    select_sdm_model,
 )
 from agriwebb.satellite.moss import get_all_paddock_moss
 
@@ -37,21 +42,46 @@ def load_ndvi_data() -> list[dict]:
     if not ndvi_path.exists():
         raise FileNotFoundError(f"NDVI data not found at {ndvi_path}")
 
-    with open(ndvi_path) as f:
-        return json.load(f)
+    return json.loads(ndvi_path.read_bytes())
 
 
 def load_field_mapping() -> dict[str, str]:
     """Load paddock name to field ID mapping."""
     fields_path = get_cache_dir() / "fields.json"
-    with open(fields_path) as f:
-        data = json.load(f)
+    data = json.loads(fields_path.read_bytes())
 
     if isinstance(data, list):
         return {f["name"]: f["id"] for f in data}
     return {f["name"]: f["id"] for f in data.get("fields", [])}
 
 
+# Quality flags that make a FOO estimate unfit to push to AgriWebb
+BLOCKING_QUALITY_FLAGS = frozenset({"negative_ndvi", "ndvi_over_1"})
+
+# Values already pushed, keyed "<kind>|<field_id>|<date>", so re-runs skip them.
+# AgriWebb only accepts FOO/SDM from the last 14 days, so older keys are pruned.
+SYNC_LEDGER_FILE = "foo_sync_ledger.json"
+SYNC_LEDGER_RETENTION_DAYS = 14
+
+
+def load_sync_ledger() -> dict[str, float]:
+    """Load the ledger of FOO/SDM values already pushed to AgriWebb."""
+    ledger_path = get_cache_dir() / SYNC_LEDGER_FILE
+    if not ledger_path.exists():
+        return {}
+    return json.loads(ledger_path.read_bytes())
+
+
+def save_sync_ledger(ledger: dict[str, float]) -> None:
+    """Save the sync ledger, keeping only the recent entries AgriWebb still accepts."""
+    cutoff = (date.today() - timedelta(days=SYNC_LEDGER_RETENTION_DAYS)).isoformat()
+    recent = {key: value for key, value in ledger.items() if key.rsplit("|", 1)[1] >= cutoff}
+
+    get_cache_dir().mkdir(parents=True, exist_ok=True)
+    with open(get_cache_dir() / SYNC_LEDGER_FILE, "w") as f:
+        json.dump(recent, f, separators=(",", ":"))
+
+
 def get_grazing_consumption() -> dict[str, PaddockConsumption]:
     """
     Get current grazing consumption by paddock.
@@ -70,7 +100,7 @@ def get_grazing_consumption() -> dict[str, PaddockConsumption]:
 
 
 def calculate_foo_from_ndvi(
-    ndvi_data: list[dict],
+    ndvi_data: Iterable[dict],
     reference_date: date | None = None,
     apply_grazing_adjustment: bool = True,
     apply_moss_adjustment: bool = False,  # Disabled by default - requires manual calibration
@@ -79,7 +109,8 @@ def calculate_foo_from_ndvi(
     Calculate FOO (Feed on Offer) from NDVI data.
 
     Args:
-        ndvi_data: List of NDVI records per paddock
+        ndvi_data: NDVI records per paddock. Any iterable works; records
+            are consumed in a single pass, so a generator can be streamed in.
         reference_date: Date for seasonal model selection
         apply_grazing_adjustment: If True, adjust FOO based on grazing pressure
         apply_moss_adjustment: If True, adjust FOO based on estimated moss cover
@@ -90,7 +121,11 @@ def calculate_foo_from_ndvi(
     if reference_date is None:
         reference_date = date.today()
 
-    month = reference_date.month
+    # Resolve per-run constants once rather than per paddock
+    model = select_sdm_model(reference_date.month)
+    utilization = 0.75  # Typical: 70-85% of SDM is usable feed; conservative estimate
+    record_date = reference_date.isoformat()
+    sdm_uncertainty = EXPECTED_UNCERTAINTY["sdm_error_kg_ha"]
     results = []
 
     # Get grazing consumption data if adjustment is enabled
@@ -104,6 +139,23 @@ def calculate_foo_from_ndvi(
         except Exception as e:
             print(f"Warning: Could not load moss data: {e}")
 
+    # Pre-index (pressure, correction) and (fraction, correction) per paddock so
+    # the loop below is a single lookup with a default for ungrazed/moss-free paddocks
+    grazing_by_paddock = {}
+    for pid, consumption in grazing_data.items():
+        if consumption:
+            pressure = consumption.get("intake_per_ha_kg_day", 0)
+            grazing_by_paddock[pid] = (pressure, calculate_grazing_correction(pressure))
+    # No animals currently grazing - use base correction (0.85)
+    no_grazing = (0.0, calculate_grazing_correction(0) if apply_grazing_adjustment else 1.0)
+
+    moss_by_paddock = {
+        pid: (estimate.get("moss_fraction", 0), estimate.get("correction_factor", 1.0))
+        for pid, estimate in moss_data.items()
+        if estimate
+    }
+    no_moss = (0.0, 1.0)
+
     for record in ndvi_data:
         paddock_id = record.get("paddock_id", "")
         paddock_name = record.get("paddock_name", "Unknown")
@@ -135,36 +187,20 @@ def calculate_foo_from_ndvi(
             quality_flags.append("high_tree_cover")
 
         # Convert to SDM
-        sdm, model = ndvi_to_standing_dry_matter(ndvi, month=month)
+        sdm, _ = ndvi_to_standing_dry_matter(ndvi, model=model)
 
         # Estimate FOO as percentage of SDM (utilization factor)
-        # Typical: 70-85% of SDM is usable feed
-        utilization = 0.75  # Conservative estimate
         foo_raw = sdm * utilization
 
-        # Apply grazing pressure adjustment
-        grazing_pressure = 0.0
-        grazing_correction = 1.0
-        consumption = grazing_data.get(paddock_id)
-
+        # Apply grazing pressure adjustment (same rounding as adjust_foo_for_grazing)
+        grazing_pressure, grazing_correction = grazing_by_paddock.get(paddock_id, no_grazing)
         if apply_grazing_adjustment:
-            if consumption:
-                grazing_pressure = consumption.get("intake_per_ha_kg_day", 0)
-                foo_after_grazing, grazing_correction = adjust_foo_for_grazing(foo_raw, grazing_pressure)
-            else:
-                # No animals currently grazing - use base correction (0.85)
-                foo_after_grazing, grazing_correction = adjust_foo_for_grazing(foo_raw, 0)
+            foo_after_grazing = round(foo_raw * grazing_correction, 0)
         else:
             foo_after_grazing = foo_raw
 
         # Apply moss adjustment
-        moss_fraction = 0.0
-        moss_correction = 1.0
-        moss_estimate = moss_data.get(paddock_id)
-
-        if moss_estimate:
-            moss_fraction = moss_estimate.get("moss_fraction", 0)
-            moss_correction = moss_estimate.get("correction_factor", 1.0)
+        moss_fraction, moss_correction = moss_by_paddock.get(paddock_id, no_moss)
 
         # High moss coverage flag
         if moss_fraction > 0.25:
@@ -181,17 +217,17 @@ def calculate_foo_from_ndvi(
                 "ndvi": round(ndvi, 3),
                 "ndvi_std": round(ndvi_std, 3),
                 "tree_cover_pct": tree_cover_pct,
-                "sdm_kg_ha": round(sdm, 0),
+                "sdm_kg_ha": sdm,  # Already rounded by ndvi_to_standing_dry_matter
                 "foo_raw_kg_ha": round(foo_raw, 0),  # Before any adjustment
                 "foo_kg_ha": round(foo_final, 0),  # After all adjustments
-                "grazing_pressure_kg_ha_day": round(grazing_pressure, 1),
+                "grazing_pressure_kg_ha_day": grazing_pressure,  # Rounded in calculate_paddock_consumption
                 "grazing_correction": grazing_correction,
                 "moss_fraction": round(moss_fraction, 2),
                 "moss_correction": moss_correction,
                 "model": model.name,
                 "quality_flags": quality_flags,
-                "date": reference_date.isoformat(),
-                "uncertainty_kg_ha": EXPECTED_UNCERTAINTY["sdm_error_kg_ha"],
+                "date": record_date,
+                "uncertainty_kg_ha": sdm_uncertainty,
             }
         )
 
@@ -202,22 +238,25 @@ async def sync_foo_to_agriwebb(
     foo_data: list[dict],
     dry_run: bool = False,
     push_sdm: bool = False,
+    force: bool = False,
 ) -> dict:
     """
     Push FOO/SDM data to AgriWebb.
 
+    Values already pushed for the same field and date (per the local sync
+    ledger) are skipped unless force is specified.
+
     Args:
         foo_data: FOO records from calculate_foo_from_ndvi()
         dry_run: If True, don't actually push
         push_sdm: If True, push SDM instead of FOO
+        force: If True, push every record even if already synced
 
     Returns:
         Sync result
     """
     # Filter out low-quality records
-    good_records = [
-        r for r in foo_data if "negative_ndvi" not in r["quality_flags"] and "ndvi_over_1" not in r["quality_flags"]
-    ]
+    good_records = [r for r in foo_data if BLOCKING_QUALITY_FLAGS.isdisjoint(r["quality_flags"])]
 
     print(f"\nRecords to sync: {len(good_records)} of {len(foo_data)}")
     print(f"Skipped: {len(foo_data) - len(good_records)} (quality issues)")
@@ -225,14 +264,19 @@ async def sync_foo_to_agriwebb(
     if not good_records:
         return {"error": "No valid records to sync"}
 
-    records = [
-        {
-            "field_id": r["paddock_id"],
-            "foo_kg_ha" if not push_sdm else "sdm_kg_ha": r["foo_kg_ha" if not push_sdm else "sdm_kg_ha"],
-            "record_date": r["date"],
-        }
-        for r in good_records
-    ]
+    kind, value_key = ("sdm", "sdm_kg_ha") if push_sdm else ("foo", "foo_kg_ha")
+    ledger = load_sync_ledger()
+
+    records = []
+    skipped_count = 0
+    for r in good_records:
+        if not force and ledger.get(f"{kind}|{r['paddock_id']}|{r['date']}") == r[value_key]:
+            skipped_count += 1
+            continue
+        records.append({"field_id": r["paddock_id"], value_key: r[value_key], "record_date": r["date"]})
+
+    if skipped_count:
+        print(f"Unchanged: {skipped_count} (already synced, skipping)")
 
     if dry_run:
         print("\n[DRY RUN] Would push:")
@@ -240,7 +284,11 @@ async def sync_foo_to_agriwebb(
             print(f"  {r}")
         if len(records) > 10:
             print(f"  ... and {len(records) - 10} more")
-        return {"dry_run": True, "records": len(records)}
+        return {"dry_run": True, "records": len(records), "skipped": skipped_count}
+
+    if not records:
+        print("No records need updating.")
+        return {"pushed": 0, "skipped": skipped_count}
 
     print("\nPushing to AgriWebb...")
     if push_sdm:
@@ -248,6 +296,12 @@ async def sync_foo_to_agriwebb(
     else:
         result = await add_feed_on_offer_batch(records, source="IOT")
 
+    # Only reached on success; API errors raise before the ledger is touched
+    for r in records:
+        ledger[f"{kind}|{r['field_id']}|{r['record_date']}"] = r[value_key]
+    save_sync_ledger(ledger)
+    print(f"Completed: {len(records)} records synced")
+
     return result
 
 
@@ -268,6 +322,11 @@ async def main():
         action="store_true",
         help="Show what would be pushed without pushing",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Push all records, even if already synced",
+    )
     parser.add_argument(
         "--no-grazing-adjust",
         action="store_true",
@@ -278,7 +337,15 @@ async def main():
         action="store_true",
         help="Skip moss/evergreen adjustment",
     )
+    parser.add_argument(
+        "--top",
+        type=int,
+        metavar="N",
+        help="Only display the N paddocks with the highest FOO",
+    )
     args = parser.parse_args()
+    if args.top is not None and args.top < 1:
+        parser.error("--top must be a positive integer")
 
     apply_grazing = not args.no_grazing_adjust
     apply_moss = False  # Moss correction disabled - requires manual calibration
@@ -317,9 +384,14 @@ async def main():
         print(f"{'Paddock':<25} {'NDVI':>7} {'SDM':>8} {'FOO':>8} {'Flags'}")
         print("-" * 70)
 
-    # Sort by adjusted FOO descending
-    sorted_foo = sorted(foo_data, key=lambda x: x["foo_kg_ha"], reverse=True)
+    # Sort by adjusted FOO descending (partial selection when only the top N are shown)
+    if args.top and args.top < len(foo_data):
+        sorted_foo = heapq.nlargest(args.top, foo_data, key=lambda x: x["foo_kg_ha"])
+    else:
+        sorted_foo = sorted(foo_data, key=lambda x: x["foo_kg_ha"], reverse=True)
 
+    # Build the table and print it in one call rather than one print per paddock
+    lines = []
     for r in sorted_foo:
         flags = ",".join(r["quality_flags"]) if r["quality_flags"] else "ok"
         tree_pct = f"{r['tree_cover_pct']:.0f}%" if r.get("tree_cover_pct") is not None else "-"
@@ -327,7 +399,7 @@ async def main():
         if apply_grazing:
             grz = r.get("grazing_pressure_kg_ha_day", 0)
             grz_corr = r.get("grazing_correction", 1.0)
-            print(
+            lines.append(
                 f"{r['paddock_name']:<25} "
                 f"{r['ndvi']:>6.3f} "
                 f"{tree_pct:>6} "
@@ -338,9 +410,14 @@ async def main():
                 f"{flags}"
             )
         else:
-            print(
+            lines.append(
                 f"{r['paddock_name']:<25} {r['ndvi']:>7.3f} {r['sdm_kg_ha']:>6.0f}   {r['foo_kg_ha']:>6.0f}   {flags}"
             )
+    if lines:
+        print("\n".join(lines))
+
+    if len(sorted_foo) < len(foo_data):
+        print(f"... and {len(foo_data) - len(sorted_foo)} more paddocks")
 
     # Summary stats
     valid = [r for r in foo_data if not r["quality_flags"]]
@@ -362,13 +439,10 @@ async def main():
             foo_data,
             dry_run=args.dry_run,
             push_sdm=args.sdm,
+            force=args.force,
         )
-        if not args.dry_run:
-            if "errors" in str(result):
-                print(f"Sync failed: {result}")
-            else:
-                valid_count = len([r for r in foo_data if "negative_ndvi" not in r["quality_flags"]])
-                print(f"Sync complete: {valid_count} records pushed")
+        if not args.dry_run and "errors" in str(result):
+            print(f"Sync failed: {result}")
 
 
 def cli():
@@ -55,6 +55,46 @@ def get_minimum_cloud_free_pixels(window_size: int) -> int:
         return 10  # Very lenient for winter long windows
 
 
+async def fetch_windows_ndvi(
+    paddocks: list[dict],
+    windows: list[tuple[date, date]],
+    concurrency: int,
+) -> list[dict[str, float]]:
+    """
+    Fetch mean NDVI for every paddock over several composite windows.
+
+    Each paddock is a single Earth Engine round-trip covering all windows.
+    The blocking calls run in worker threads, at most ``concurrency`` at once.
+
+    Args:
+        paddocks: AgriWebb paddock dicts (those without geometry are skipped)
+        windows: List of (start, end) composite windows
+        concurrency: Maximum number of Earth Engine requests in flight
+
+    Returns:
+        One dict per window of paddock_id -> NDVI mean, for paddocks with valid pixels
+    """
+    sem = asyncio.Semaphore(concurrency)
+    iso_windows = [(start.isoformat(), end.isoformat()) for start, end in windows]
+
+    async def fetch(p: dict) -> list:
+        async with sem:
+            return await asyncio.to_thread(satellite.extract_paddock_ndvi_multi, p, iso_windows, scale=30)
+
+    targets = [p for p in paddocks if p.get("geometry")]
+    results = await asyncio.gather(*(fetch(p) for p in targets), return_exceptions=True)
+
+    ndvi = [{} for _ in windows]
+    for p, result in zip(targets, results, strict=True):
+        if isinstance(result, Exception):
+            print(f"  Warning: {p['name']}: {result}")
+            continue
+        for window_ndvi, window_result in zip(ndvi, result, strict=True):
+            if window_result["ndvi_mean"] is not None:
+                window_ndvi[p["id"]] = window_result["ndvi_mean"]
+    return ndvi
+
+
 async def main(
     dry_run: bool = False,
     window_size: int | None = None,
@@ -99,34 +139,16 @@ async def main(
     print(f"Current period:  {current_start} to {current_end}")
     print()
 
-    # Fetch NDVI for both periods
-    print("Fetching NDVI for previous period...")
-    previous_ndvi = {}
-    for p in paddocks:
-        if not p.get("geometry"):
-            continue
-        try:
-            result = satellite.extract_paddock_ndvi(p, previous_start.isoformat(), previous_end.isoformat(), scale=30)
-            if result["ndvi_mean"] is not None:
-                previous_ndvi[p["id"]] = result["ndvi_mean"]
-        except Exception as e:
-            print(f"  Warning: {p['name']}: {e}")
-
-    print(f"  Got NDVI for {len(previous_ndvi)} paddocks")
+    # Fetch NDVI for both periods (one request per paddock, run concurrently)
+    print("Fetching NDVI for previous and current periods...")
+    previous_ndvi, current_ndvi = await fetch_windows_ndvi(
+        paddocks,
+        [(previous_start, previous_end), (current_start, current_end)],
+        concurrency=settings.gee_max_concurrent_requests,
+    )
 
-    print("Fetching NDVI for current period...")
-    current_ndvi = {}
-    for p in paddocks:
-        if not p.get("geometry"):
-            continue
-        try:
-            result = satellite.extract_paddock_ndvi(p, current_start.isoformat(), current_end.isoformat(), scale=30)
-            if result["ndvi_mean"] is not None:
-                current_ndvi[p["id"]] = result["ndvi_mean"]
-        except Exception as e:
-            print(f"  Warning: {p['name']}: {e}")
-
-    print(f"  Got NDVI for {len(current_ndvi)} paddocks")
+    print(f"  Previous period: got NDVI for {len(previous_ndvi)} paddocks")
+    print(f"  Current period:  got NDVI for {len(current_ndvi)} paddocks")
     print()
 
     # Calculate growth rates
@@ -139,12 +161,13 @@ async def main(
     current_month = current_end.month
     previous_month = previous_end.month
 
+    lines = []
     for p in paddocks:
         pid = p["id"]
         name = p["name"]
 
         if pid not in previous_ndvi or pid not in current_ndvi:
-            print(f"{name:<30} {'N/A':>10} {'N/A':>10} {'skipped':>12}")
+            lines.append(f"{name:<30} {'N/A':>10} {'N/A':>10} {'skipped':>12}")
             continue
 
         ndvi_prev = previous_ndvi[pid]
@@ -158,7 +181,7 @@ async def main(
             month_previous=previous_month,
         )
 
-        print(f"{name:<30} {ndvi_prev:>10.3f} {ndvi_curr:>10.3f} {growth_rate:>+10.1f} kg")
+        lines.append(f"{name:<30} {ndvi_prev:>10.3f} {ndvi_curr:>10.3f} {growth_rate:>+10.1f} kg")
 
         records.append(
             {
@@ -171,6 +194,9 @@ async def main(
             }
         )
 
+    # Print the table in one call rather than one print per paddock
+    if lines:
+        print("\n".join(lines))
     print()
     print(f"Calculated growth rates for {len(records)} paddocks")
     print(f"Uncertainty: ±{EXPECTED_UNCERTAINTY['growth_rate_error_kg_ha_day']} kg DM/ha/day")
@@ -1,5 +1,10 @@
 """AgriWebb API functions for weather/rainfall data."""
 
+import asyncio
+from functools import lru_cache
+
+import httpx
+
 from agriwebb.core.config import settings
 from agriwebb.core.timestamps import to_timestamp_ms
 
@@ -43,6 +48,9 @@ mutation AddRainfall($farmId: String!, $sensorId: String!, $value: Float!, $time
 }
 """
 
+# Rainfall records sent per aliased bulk mutation request
+RAINFALL_BATCH_SIZE = 100
+
 RAINFALLS_QUERY = """
 query GetRainfalls($farmId: String!, $sensorId: String!) {
   rainfalls(filter: {
@@ -59,6 +67,44 @@ query GetRainfalls($farmId: String!, $sensorId: String!) {
 }
 """
 
+RAINFALLS_TIME_RANGE_QUERY = """
+query GetRainfallsFiltered($farmId: String!, $sensorId: String!, $startTime: Float!, $endTime: Float!) {
+  rainfalls(filter: {
+    farmId: { _eq: $farmId }
+    sensorId: { _eq: $sensorId }
+    time: { _gte: $startTime, _lte: $endTime }
+  }) {
+    id
+    time
+    value
+    unit
+    mode
+    sensorId
+  }
+}
+"""
+
+# Open bounds for RAINFALLS_TIME_RANGE_QUERY when only one end of the range is
+# given, so a single static query covers start-only, end-only and both.
+RAINFALLS_MIN_TIME_MS = 0
+RAINFALLS_MAX_TIME_MS = to_timestamp_ms("9999-12-31")
+
+
+@lru_cache(maxsize=8)
+def _bulk_rainfall_mutation(n: int) -> str:
+    """Build a mutation with n aliased addRainfalls fields (r0..r{n-1}).
+
+    Each alias takes its own $v{i}/$t{i} variables so the document text only
+    depends on n and can be reused across chunks.
+    """
+    var_defs = "".join(f", $v{i}: Float!, $t{i}: Timestamp!" for i in range(n))
+    fields = "\n".join(
+        f"  r{i}: addRainfalls(input: {{ unit: mm, value: $v{i}, farmId: $farmId, "
+        f"sensorId: $sensorId, time: $t{i}, mode: cumulative }}) {{ rainfalls {{ time mode }} }}"
+        for i in range(n)
+    )
+    return f"mutation AddRainfallBulk($farmId: String!, $sensorId: String!{var_defs}) {{\n{fields}\n}}"
+
 
 # =============================================================================
 # API Functions
@@ -129,6 +175,75 @@ async def add_rainfall(
     return await graphql_with_retry(ADD_RAINFALL_MUTATION, variables)
 
 
+async def add_rainfall_bulk(
+    records: list[tuple[str, float]],
+    sensor_id: str | None = None,
+) -> list[dict]:
+    """
+    Add many rainfall records using aliased mutations.
+
+    Records are sent RAINFALL_BATCH_SIZE at a time, one request per chunk,
+    instead of one request per day. A chunk is sent once and never retried:
+    aliases that committed before a failure (or alongside partial `errors`)
+    would be duplicated. Instead the chunk's date range is re-queried and
+    only the records whose time and value did not land are sent again, once.
+
+    Args:
+        records: List of (date_str, precipitation_inches) tuples
+        sensor_id: Optional sensor ID (defaults to config value)
+
+    Returns:
+        AgriWebb API responses, one per chunk
+
+    Raises:
+        AgriWebbAPIError: If records are still missing after the resend
+    """
+    from agriwebb.core.client import AgriWebbAPIError, GraphQLError, graphql_once
+
+    sensor = sensor_id or settings.agriwebb_weather_sensor_id
+    if not sensor:
+        raise ValueError("No sensor ID configured. Run 'python -m agriwebb.setup' first.")
+
+    def to_mm(precipitation_inches: float) -> float:
+        return round(precipitation_inches * 25.4, 2)
+
+    async def send(chunk: list[tuple[str, float]]) -> dict:
+        variables: dict = {
+            "farmId": settings.agriwebb_farm_id,
+            "sensorId": sensor,
+        }
+        for i, (date_str, precipitation_inches) in enumerate(chunk):
+            variables[f"v{i}"] = to_mm(precipitation_inches)
+            variables[f"t{i}"] = to_timestamp_ms(date_str)
+        return await graphql_once(_bulk_rainfall_mutation(len(chunk)), variables)
+
+    async def push_chunk(chunk: list[tuple[str, float]]) -> dict:
+        try:
+            return await send(chunk)
+        except (GraphQLError, httpx.HTTPError) as first_error:
+            dates = [date_str for date_str, _ in chunk]
+            existing = await get_rainfalls(sensor, start_date=min(dates), end_date=max(dates))
+            # Match on value as well as time: updates and --force pushes target
+            # days that already hold an older record at the same timestamp
+            landed = {(r.get("time"), round(r["value"], 2)) for r in existing if r.get("value") is not None}
+            missing = [
+                (date_str, inches)
+                for date_str, inches in chunk
+                if (to_timestamp_ms(date_str), to_mm(inches)) not in landed
+            ]
+            if not missing:
+                return {"data": {}}
+            try:
+                return await send(missing)
+            except (GraphQLError, httpx.HTTPError) as e:
+                raise AgriWebbAPIError(
+                    f"Bulk rainfall push failed for {len(missing)} records ({first_error}; then {e})"
+                ) from e
+
+    chunks = [records[i : i + RAINFALL_BATCH_SIZE] for i in range(0, len(records), RAINFALL_BATCH_SIZE)]
+    return list(await asyncio.gather(*(push_chunk(chunk) for chunk in chunks)))
+
+
 async def get_rainfalls(
     sensor_id: str | None = None,
     start_date: str | None = None,
@@ -136,9 +251,8 @@ async def get_rainfalls(
 ) -> list[dict]:
     """Get rainfall records for a sensor.
 
-    Note:
-        Date filtering is not yet supported with variables due to complex
-        filter syntax. Currently returns all records for the sensor.
+    Both the unfiltered and time-filtered cases use static query documents;
+    a missing start or end date is sent as an open bound.
     """
     from agriwebb.core.client import graphql_with_retry
 
@@ -146,46 +260,15 @@ async def get_rainfalls(
     if not sensor:
         raise ValueError("No sensor ID configured.")
 
+    variables = {
+        "farmId": settings.agriwebb_farm_id,
+        "sensorId": sensor,
+    }
     if start_date or end_date:
-        # Build parameterized time-filtered query
-        var_defs = ["$farmId: String!", "$sensorId: String!"]
-        time_filter_parts = []
-        variables = {
-            "farmId": settings.agriwebb_farm_id,
-            "sensorId": sensor,
-        }
-        if start_date:
-            var_defs.append("$startTime: Float!")
-            time_filter_parts.append("_gte: $startTime")
-            variables["startTime"] = to_timestamp_ms(start_date)
-        if end_date:
-            var_defs.append("$endTime: Float!")
-            time_filter_parts.append("_lte: $endTime")
-            variables["endTime"] = to_timestamp_ms(end_date)
-        time_filter = f", time: {{ {', '.join(time_filter_parts)} }}" if time_filter_parts else ""
-
-        query = f"""
-        query GetRainfallsFiltered({", ".join(var_defs)}) {{
-          rainfalls(filter: {{
-            farmId: {{ _eq: $farmId }}
-            sensorId: {{ _eq: $sensorId }}
-            {time_filter}
-          }}) {{
-            id
-            time
-            value
-            unit
-            mode
-            sensorId
-          }}
-        }}
-        """
-        result = await graphql_with_retry(query, variables)
+        variables["startTime"] = to_timestamp_ms(start_date) if start_date else RAINFALLS_MIN_TIME_MS
+        variables["endTime"] = to_timestamp_ms(end_date) if end_date else RAINFALLS_MAX_TIME_MS
+        result = await graphql_with_retry(RAINFALLS_TIME_RANGE_QUERY, variables)
     else:
-        variables = {
-            "farmId": settings.agriwebb_farm_id,
-            "sensorId": sensor,
-        }
         result = await graphql_with_retry(RAINFALLS_QUERY, variables)
 
     return result.get("data", {}).get("rainfalls", [])
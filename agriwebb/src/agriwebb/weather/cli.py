@@ -9,10 +9,11 @@ AgriWebb integration and user-facing commands.
 
 import argparse
 import asyncio
+from collections import Counter
 from datetime import UTC, date, datetime, timedelta
 from typing import TypedDict
 
-from agriwebb.core import get_cache_dir, get_farm_today, settings
+from agriwebb.core import close_graphql_client, close_http_client, get_cache_dir, get_farm_today, settings
 from agriwebb.weather import api as weather_api
 from agriwebb.weather import ncei, openmeteo
 
@@ -155,14 +156,15 @@ def _print_sync_table(
     force: bool = False,
 ) -> None:
     """Print the sync status table."""
-    print(f"\n{'Date':<12} {'Source':<12} {'Precip':>8} {'Status':<12}")
-    print("-" * 48)
+    lines = [f"\n{'Date':<12} {'Source':<12} {'Precip':>8} {'Status':<12}", "-" * 48]
     for record in weather_data:
         status = _get_record_status(record, existing_by_date, force)
-        print(
+        lines.append(
             f"{record['date']:<12} {record.get('source', 'unknown'):<12} "
             f'{record["precipitation_inches"]:>7.2f}" {status}'
         )
+    # One print for the whole table rather than one per day
+    print("\n".join(lines))
 
 
 # =============================================================================
@@ -211,19 +213,26 @@ async def cmd_sync(args: argparse.Namespace) -> None:
     print(f"Syncing rainfall from {start_date} to {end_date}...")
     print(f"Sources: NOAA station {settings.ncei_station_id} + Open-Meteo")
 
-    # Fetch weather data from both sources
-    all_weather = await ncei.fetch_combined_precipitation(start_date, end_date)
-    noaa_count = sum(1 for w in all_weather if w.get("source") == "noaa")
-    openmeteo_count = sum(1 for w in all_weather if w.get("source") == "open-meteo")
-    print(f"Retrieved {len(all_weather)} days: {noaa_count} from NOAA, {openmeteo_count} from Open-Meteo")
+    # Fetch weather data and existing records (unless --force) concurrently;
+    # they hit different hosts and neither depends on the other.
+    if force:
+        all_weather = await ncei.fetch_combined_precipitation(start_date, end_date)
+        existing_rainfalls: list[dict] = []
+    else:
+        all_weather, existing_rainfalls = await asyncio.gather(
+            ncei.fetch_combined_precipitation(start_date, end_date),
+            weather_api.get_rainfalls(start_date=str(start_date), end_date=str(end_date)),
+        )
+    source_counts = Counter(w.get("source", "unknown") for w in all_weather)
+    print(
+        f"Retrieved {len(all_weather)} days: {source_counts['noaa']} from NOAA, "
+        f"{source_counts['open-meteo']} from Open-Meteo"
+    )
 
-    # Fetch existing records (unless --force)
     existing_by_date: dict[str, float] = {}
     if not force:
-        print("\nFetching existing AgriWebb records...")
-        existing_rainfalls = await weather_api.get_rainfalls(start_date=str(start_date), end_date=str(end_date))
         existing_by_date = _build_existing_rainfall_lookup(existing_rainfalls)
-        print(f"Found {len(existing_by_date)} existing records in date range")
+        print(f"\nFound {len(existing_by_date)} existing AgriWebb records in date range")
     else:
         print("\n--force specified, pushing all records")
 
@@ -253,8 +262,7 @@ async def cmd_sync(args: argparse.Namespace) -> None:
 
     # Push to AgriWebb
     print("\nPushing to AgriWebb...")
-    for record in records_to_push:
-        await weather_api.add_rainfall(record["date"], record["precipitation_inches"])
+    await weather_api.add_rainfall_bulk([(r["date"], r["precipitation_inches"]) for r in records_to_push])
 
     print(f"Completed: {len(records_to_push)} records synced")
 
@@ -270,13 +278,12 @@ async def cmd_list(args: argparse.Namespace) -> None:
 
     print(f"Found {len(rainfalls)} rainfall records.")
 
-    # Sort by time and show summary
-    sorted_rainfalls = sorted(rainfalls, key=lambda x: x.get("time", 0))
-    if sorted_rainfalls:
-        first = sorted_rainfalls[0]
-        last = sorted_rainfalls[-1]
-        first_date = datetime.fromtimestamp(first["time"] / 1000, tz=UTC).date()
-        last_date = datetime.fromtimestamp(last["time"] / 1000, tz=UTC).date()
+    # Only the endpoints are shown, so take min/max rather than sorting;
+    # records without a time are left out of the range
+    times = [r["time"] for r in rainfalls if r.get("time") is not None]
+    if times:
+        first_date = datetime.fromtimestamp(min(times) / 1000, tz=UTC).date()
+        last_date = datetime.fromtimestamp(max(times) / 1000, tz=UTC).date()
         print(f"Date range: {first_date} to {last_date}")
 
     print("\nNOTE: AgriWebb API does not support deleting rainfall records.")
@@ -292,73 +299,86 @@ async def cmd_cache(args: argparse.Namespace) -> None:
     print("=" * 60)
     print()
 
-    # Step 1: Open-Meteo (comprehensive historical + forecast)
-    print("Fetching Open-Meteo data (historical + forecast)...")
-    data = await openmeteo.update_weather_cache(refresh=refresh)
+    # Open-Meteo (historical + forecast) and NOAA/NCEI station data are
+    # independent hosts, so fetch both at once. NOAA status lines are
+    # collected and printed afterwards so the two outputs don't interleave.
+    print("Fetching Open-Meteo (historical + forecast) and NOAA station data...")
+    data, noaa_messages = await asyncio.gather(
+        openmeteo.update_weather_cache(refresh=refresh),
+        update_noaa_cache(refresh=refresh),
+    )
+    print()
+
+    print("Open-Meteo:")
     print(f"  Cached {data['daily_records']} days")
     print(f"  Date range: {data['daily_data'][0]['date']} to {data['daily_data'][-1]['date']}")
     print()
 
-    # Step 2: NOAA/NCEI station data
-    # Smart caching: only fetch what's missing unless refresh=True
-    print("Fetching NOAA station data...")
-    await update_noaa_cache(refresh=refresh)
+    print("NOAA station data:")
+    for message in noaa_messages:
+        print(f"  {message}")
 
     print()
     print("Cache complete!")
 
 
-async def update_noaa_cache(refresh: bool = False) -> None:
-    """Update NOAA weather cache smartly."""
+async def update_noaa_cache(refresh: bool = False) -> list[str]:
+    """Update NOAA weather cache smartly.
+
+    Smart caching: only fetch what's missing unless refresh=True.
+
+    Returns:
+        Status messages describing what was fetched, for the caller to print
+    """
     import json
 
-    cache_path = get_cache_dir() / "noaa_weather.json"
+    messages: list[str] = []
+
+    cache_path = get_cache_dir() / ncei.NOAA_CACHE_FILE
     # Use yesterday in farm's local timezone
     end_date = await get_farm_today() - timedelta(days=1)
 
-    # Load existing cache
-    existing_dates = set()
+    # Load existing cache once; the merge below reuses the parsed records
+    existing_records: dict[str, dict] = {}
     if not refresh and cache_path.exists():
-        with open(cache_path) as f:
-            existing = json.load(f)
-        existing_dates = {r["date"] for r in existing.get("records", [])}
-        if existing_dates:
-            latest = max(existing_dates)
-            print(f"  Cache has data through {latest}")
+        existing = json.loads(cache_path.read_bytes())
+        existing_records = {r["date"]: r for r in existing.get("records", [])}
+    existing_dates = existing_records.keys()
+    if existing_dates:
+        latest = max(existing_dates)
+        messages.append(f"Cache has data through {latest}")
 
     if refresh or not existing_dates:
         # Full fetch: 2 years
         start_date = end_date - timedelta(days=730)
-        print(f"  Fetching full history ({start_date} to {end_date})...")
+        messages.append(f"Fetching full history ({start_date} to {end_date})...")
     else:
         # Incremental: from latest cached date
         latest_date = date.fromisoformat(max(existing_dates))
         # NOAA data has ~6 day lag, so start from 7 days before latest to catch updates
         start_date = latest_date - timedelta(days=7)
         if start_date >= end_date:
-            print("  Cache is up to date")
-            return
-        print(f"  Fetching updates ({start_date} to {end_date})...")
+            messages.append("Cache is up to date")
+            return messages
+        messages.append(f"Fetching updates ({start_date} to {end_date})...")
 
     try:
         noaa_data = await ncei.fetch_ncei_date_range(start_date, end_date)
         if noaa_data:
             if not refresh and existing_dates:
-                # Merge with existing
-                with open(cache_path) as f:
-                    existing = json.load(f)
-                existing_records = {r["date"]: r for r in existing.get("records", [])}
-                # Update/add new records
-                for record in noaa_data:
-                    existing_records[record["date"]] = record
-                noaa_data = sorted(existing_records.values(), key=lambda x: x["date"])
-
-            ncei.save_weather_json(noaa_data, "noaa_weather.json")
-            print(f"  Cached {len(noaa_data)} days from NOAA")
+                # Merge with existing; update/add new records
+                existing_records.update((r["date"], r) for r in noaa_data)
+                # Keys are the ISO dates, so sorting them orders the records
+                noaa_data = [existing_records[d] for d in sorted(existing_records)]
+
+            ncei.save_weather_json(noaa_data, ncei.NOAA_CACHE_FILE)
+            messages.append(f"Cached {len(noaa_data)} days from NOAA")
         else:
-            print("  No NOAA data available")
+            messages.append("No NOAA data available")
     except Exception as e:
-        print(f"  Warning: Could not fetch NOAA data: {e}")
+        messages.append(f"Warning: Could not fetch NOAA data: {e}")
+
+    return messages
 
 
 async def cli_main() -> None:
@@ -417,7 +437,11 @@ Examples:
     }
 
     if args.command in commands:
-        await commands[args.command](args)
+        try:
+            await commands[args.command](args)
+        finally:
+            await close_http_client()
+            await close_graphql_client()
     else:
         parser.print_help()
 
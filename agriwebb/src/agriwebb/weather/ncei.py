@@ -10,35 +10,40 @@ Uses two data sources:
 Strategy: Use Open-Meteo for recent days, overwrite with NOAA when available.
 """
 
+import asyncio
 import json
+import os
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
-from agriwebb.core import get_cache_dir, http_get_with_retry, settings
+from agriwebb.core import get_cache_dir, get_farm_timezone, get_farm_today, http_get_with_retry, settings
 from agriwebb.weather import openmeteo
 
 NCEI_API_URL = "https://www.ncei.noaa.gov/access/services/data/v1"
 
-
-async def fetch_ncei_precipitation(target_date: date) -> dict | None:
-    """Fetch precipitation data from NOAA/NCEI for a specific date."""
-    params = {
-        "dataset": "daily-summaries",
-        "stations": settings.ncei_station_id,
-        "dataTypes": "PRCP,TMAX,TMIN",
-        "startDate": target_date.isoformat(),
-        "endDate": target_date.isoformat(),
-        "format": "json",
-        "units": "standard",
-    }
-
-    response = await http_get_with_retry(NCEI_API_URL, params=params, timeout=30)
-    data = response.json()
-
-    if not data:
-        return None
-
-    record = data[0]
+# Query parameters shared by every daily-summaries request; the station and
+# date range are added per call
+NCEI_QUERY_PARAMS = {
+    "dataset": "daily-summaries",
+    "dataTypes": "PRCP,TMAX,TMIN",
+    "format": "json",
+    "units": "standard",
+}
+
+# Long ranges are split into spans of this many days, fetched concurrently.
+# NCEI rate-limits to ~5 requests/second, so keep only a few in flight.
+NCEI_MAX_DAYS_PER_REQUEST = 366
+NCEI_MAX_CONCURRENT_REQUESTS = 4
+
+# Station cache written by `agriwebb-weather cache`. Daily summaries older than
+# NCEI_SETTLED_DAYS no longer change, so syncs reuse cached copies of those
+# days instead of downloading them again.
+NOAA_CACHE_FILE = "noaa_weather.json"
+NCEI_SETTLED_DAYS = 7
+
+
+def _parse_ncei_record(record: dict) -> dict:
+    """Normalize one NCEI daily-summaries record."""
     return {
         "date": record.get("DATE"),
         "station": record.get("STATION"),
@@ -48,36 +53,103 @@ async def fetch_ncei_precipitation(target_date: date) -> dict | None:
     }
 
 
-async def fetch_ncei_date_range(start_date: date, end_date: date) -> list[dict]:
-    """Fetch precipitation data from NOAA/NCEI for a date range."""
+async def fetch_ncei_precipitation(target_date: date) -> dict | None:
+    """Fetch precipitation data from NOAA/NCEI for a specific date.
+
+    For more than one day use fetch_ncei_date_range(), which returns the
+    whole range from a single request.
+    """
+    records = await fetch_ncei_date_range(target_date, target_date, timeout=30)
+    return records[0] if records else None
+
+
+async def fetch_ncei_date_range(start_date: date, end_date: date, timeout: int = 60) -> list[dict]:
+    """Fetch precipitation data from NOAA/NCEI for a date range.
+
+    Ranges up to NCEI_MAX_DAYS_PER_REQUEST days are a single request; longer
+    ones are split into spans fetched concurrently and returned in date order.
+    """
+    spans = []
+    span_start = start_date
+    while span_start <= end_date:
+        span_end = min(span_start + timedelta(days=NCEI_MAX_DAYS_PER_REQUEST - 1), end_date)
+        spans.append((span_start, span_end))
+        span_start = span_end + timedelta(days=1)
+
+    if len(spans) <= 1:
+        return await _fetch_ncei_span(start_date, end_date, timeout)
+
+    sem = asyncio.Semaphore(NCEI_MAX_CONCURRENT_REQUESTS)
+
+    async def fetch(span: tuple[date, date]) -> list[dict]:
+        async with sem:
+            return await _fetch_ncei_span(*span, timeout)
+
+    chunks = await asyncio.gather(*(fetch(span) for span in spans))
+    return [record for chunk in chunks for record in chunk]
+
+
+async def _load_settled_noaa_cache(start_date: date, end_date: date) -> dict[str, dict]:
+    """Return cached station records in start..end that were final when fetched.
+
+    A record is settled only if its date is at least NCEI_SETTLED_DAYS before
+    the cache's generated_at (in the farm's timezone), so a preliminary value
+    cached a few days after the fact is never reused. Only records for the
+    configured station are used; a missing, unreadable or undated cache
+    yields an empty dict.
+    """
+    try:
+        cached = json.loads((get_cache_dir() / NOAA_CACHE_FILE).read_bytes())
+        generated = datetime.fromisoformat(cached["generated_at"])
+    except OSError, ValueError, KeyError, TypeError:
+        return {}
+    if cached.get("station_id") != settings.ncei_station_id:
+        return {}
+
+    if generated.tzinfo is None:
+        generated = generated.replace(tzinfo=UTC)
+    fetched_on = min(generated.astimezone(await get_farm_timezone()).date(), await get_farm_today())
+    settled_end = min(end_date, fetched_on - timedelta(days=NCEI_SETTLED_DAYS))
+    start_str, end_str = start_date.isoformat(), settled_end.isoformat()
+    return {r["date"]: r for r in cached.get("records", []) if start_str <= r["date"] <= end_str}
+
+
+async def _fetch_ncei_using_cache(start_date: date, end_date: date) -> list[dict]:
+    """Fetch a NOAA range, downloading only the days not settled in the cache.
+
+    Cached settled days are reused up to the first day the cache lacks (a gap
+    or the end of its settled span); everything from there to end_date is
+    fetched in one range request.
+    """
+    cached = await _load_settled_noaa_cache(start_date, end_date)
+
+    records = []
+    fetch_start = start_date
+    while fetch_start <= end_date and fetch_start.isoformat() in cached:
+        records.append(cached[fetch_start.isoformat()])
+        fetch_start += timedelta(days=1)
+
+    if fetch_start <= end_date:
+        records.extend(await fetch_ncei_date_range(fetch_start, end_date))
+    return records
+
+
+async def _fetch_ncei_span(start_date: date, end_date: date, timeout: int) -> list[dict]:
+    """Fetch one NCEI daily-summaries request covering start_date..end_date."""
     params = {
-        "dataset": "daily-summaries",
+        **NCEI_QUERY_PARAMS,
         "stations": settings.ncei_station_id,
-        "dataTypes": "PRCP,TMAX,TMIN",
         "startDate": start_date.isoformat(),
         "endDate": end_date.isoformat(),
-        "format": "json",
-        "units": "standard",
     }
 
-    response = await http_get_with_retry(NCEI_API_URL, params=params, timeout=60)
+    response = await http_get_with_retry(NCEI_API_URL, params=params, timeout=timeout)
     data = response.json()
 
     if not data:
         return []
 
-    results = []
-    for record in data:
-        results.append(
-            {
-                "date": record.get("DATE"),
-                "station": record.get("STATION"),
-                "precipitation_inches": float(record.get("PRCP", 0) or 0),
-                "temp_max_f": float(record.get("TMAX")) if record.get("TMAX") else None,
-                "temp_min_f": float(record.get("TMIN")) if record.get("TMIN") else None,
-            }
-        )
-    return results
+    return [_parse_ncei_record(record) for record in data]
 
 
 async def fetch_openmeteo_precipitation(
@@ -107,10 +179,11 @@ async def fetch_openmeteo_precipitation(
         include_past_days=min(days_back, 92),  # API limit
     )
 
+    start_str, end_str = start_date.isoformat(), end_date.isoformat()
     results = []
     for record in data:
         record_date = record["date"]
-        if start_date.isoformat() <= record_date <= end_date.isoformat():
+        if start_str <= record_date <= end_str:
             # Convert mm to inches
             precip_mm = record.get("precip_mm", 0) or 0
             precip_inches = precip_mm / 25.4
@@ -151,13 +224,24 @@ async def fetch_combined_precipitation(
 
     Returns:
         List of weather records, with source indicated
+
+    Raises:
+        Exception: The NOAA error, if both sources fail
     """
-    # Fetch from both sources
-    noaa_data = await fetch_ncei_date_range(start_date, end_date)
-    try:
-        openmeteo_data = await fetch_openmeteo_precipitation(start_date, end_date)
-    except Exception as e:
-        print(f"Warning: Open-Meteo unavailable ({e}), using NOAA data only")
+    # Fetch from both sources concurrently; they are independent hosts, and
+    # either one failing still leaves the other's records to combine
+    noaa_data, openmeteo_data = await asyncio.gather(
+        _fetch_ncei_using_cache(start_date, end_date),
+        fetch_openmeteo_precipitation(start_date, end_date),
+        return_exceptions=True,
+    )
+    if isinstance(noaa_data, BaseException) and isinstance(openmeteo_data, BaseException):
+        raise noaa_data
+    if isinstance(noaa_data, BaseException):
+        print(f"Warning: NOAA unavailable ({noaa_data}), using Open-Meteo data only")
+        noaa_data = []
+    if isinstance(openmeteo_data, BaseException):
+        print(f"Warning: Open-Meteo unavailable ({openmeteo_data}), using NOAA data only")
         openmeteo_data = []
 
     # Index NOAA data by date
@@ -166,21 +250,20 @@ async def fetch_combined_precipitation(
     # Index Open-Meteo data by date
     openmeteo_by_date = {r["date"]: r for r in openmeteo_data}
 
-    # Combine: prefer NOAA, fall back to Open-Meteo
+    # Combine: prefer NOAA, fall back to Open-Meteo. ISO date keys sort
+    # chronologically, so walk the union of dates present instead of every
+    # calendar day in the range; dates with no data from either source are skipped.
+    start_str, end_str = start_date.isoformat(), end_date.isoformat()
     results = []
-    current = start_date
-    while current <= end_date:
-        date_str = current.isoformat()
-
+    for date_str in sorted(noaa_by_date.keys() | openmeteo_by_date.keys()):
+        if not start_str <= date_str <= end_str:
+            continue
         if date_str in noaa_by_date:
             record = noaa_by_date[date_str]
             record["source"] = "noaa"
             results.append(record)
-        elif date_str in openmeteo_by_date:
+        else:
             results.append(openmeteo_by_date[date_str])
-        # else: no data from either source for this date
-
-        current += timedelta(days=1)
 
     return results
 
@@ -196,14 +279,27 @@ def log_weather(weather: dict, agriwebb_response: dict | None = None) -> Path:
         "logged_at": datetime.now(UTC).isoformat(),
     }
 
-    with log_file.open("a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    # One compact line per entry, appended with a single unbuffered write(2).
+    # O_APPEND keeps concurrent appenders from interleaving partial lines.
+    line = json.dumps(log_entry, separators=(",", ":")) + "\n"
+    fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
 
     return log_file
 
 
-def save_weather_json(weather_data: list[dict], filename: str = "weather_history.json") -> Path:
-    """Save all weather data to a comprehensive JSON file."""
+def save_weather_json(
+    weather_data: list[dict],
+    filename: str = "weather_history.json",
+    pretty: bool = False,
+) -> Path:
+    """Save all weather data to a comprehensive JSON file.
+
+    Written as compact JSON unless pretty=True, which indents it for reading.
+    """
     get_cache_dir().mkdir(exist_ok=True)
     json_file = get_cache_dir() / filename
 
@@ -214,7 +310,10 @@ def save_weather_json(weather_data: list[dict], filename: str = "weather_history
         "records": weather_data,
     }
 
-    with json_file.open("w") as f:
-        json.dump(output, f, indent=2)
+    # Serialize in one pass and write once; json.dump issues a write per chunk
+    if pretty:
+        json_file.write_text(json.dumps(output, indent=2))
+    else:
+        json_file.write_text(json.dumps(output, separators=(",", ":")))
 
     return json_file
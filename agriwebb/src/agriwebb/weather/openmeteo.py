@@ -7,8 +7,10 @@ Open-Meteo is free, requires no API key, and includes ET₀ (reference evapotran
 API Documentation: https://open-meteo.com/en/docs
 """
 
+import asyncio
 import json
 from datetime import date, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import TypedDict
 
@@ -25,6 +27,11 @@ from agriwebb.core.units import (
 HISTORICAL_API = "https://archive-api.open-meteo.com/v1/archive"
 FORECAST_API = "https://api.open-meteo.com/v1/forecast"
 
+# Long archive ranges (a full backfill reaches back to 2018) are split into
+# spans of this many days and fetched concurrently, a few at a time
+HISTORICAL_MAX_DAYS_PER_REQUEST = 366
+HISTORICAL_MAX_CONCURRENT_REQUESTS = 4
+
 # Default location (San Juan Islands, WA)
 DEFAULT_LAT = 48.501762
 DEFAULT_LON = -123.042906
@@ -59,6 +66,9 @@ async def fetch_historical(
     """
     Fetch historical weather data from Open-Meteo archive.
 
+    Ranges longer than HISTORICAL_MAX_DAYS_PER_REQUEST are split into spans
+    fetched concurrently and returned in date order.
+
     Args:
         start_date: Start date
         end_date: End date (inclusive)
@@ -68,6 +78,28 @@ async def fetch_historical(
     Returns:
         List of daily weather records
     """
+    spans = []
+    span_start = start_date
+    while span_start <= end_date:
+        span_end = min(span_start + timedelta(days=HISTORICAL_MAX_DAYS_PER_REQUEST - 1), end_date)
+        spans.append((span_start, span_end))
+        span_start = span_end + timedelta(days=1)
+
+    if len(spans) <= 1:
+        return await _fetch_historical_span(start_date, end_date, lat, lon)
+
+    sem = asyncio.Semaphore(HISTORICAL_MAX_CONCURRENT_REQUESTS)
+
+    async def fetch(span: tuple[date, date]) -> list[DailyWeather]:
+        async with sem:
+            return await _fetch_historical_span(*span, lat, lon)
+
+    chunks = await asyncio.gather(*(fetch(span) for span in spans))
+    return [record for chunk in chunks for record in chunk]
+
+
+async def _fetch_historical_span(start_date: date, end_date: date, lat: float, lon: float) -> list[DailyWeather]:
+    """Fetch one Open-Meteo archive request covering start_date..end_date."""
     params = {
         "latitude": lat,
         "longitude": lon,
@@ -94,20 +126,18 @@ async def fetch_historical(
     precip = daily.get("precipitation_sum", [])
     et0 = daily.get("et0_fao_evapotranspiration", [])
 
-    results = []
-    for i, d in enumerate(dates):
-        results.append(
-            DailyWeather(
-                date=d,
-                temp_mean_c=temp_mean[i] if temp_mean[i] is not None else 0,
-                temp_max_c=temp_max[i] if temp_max[i] is not None else 0,
-                temp_min_c=temp_min[i] if temp_min[i] is not None else 0,
-                precip_mm=precip[i] if precip[i] is not None else 0,
-                et0_mm=et0[i] if et0[i] is not None else 0,
-            )
+    # Walk the parallel columns together rather than indexing each one per day
+    return [
+        DailyWeather(
+            date=d,
+            temp_mean_c=t_mean if t_mean is not None else 0,
+            temp_max_c=t_max if t_max is not None else 0,
+            temp_min_c=t_min if t_min is not None else 0,
+            precip_mm=p if p is not None else 0,
+            et0_mm=e if e is not None else 0,
         )
-
-    return results
+        for d, t_max, t_min, t_mean, p, e in zip(dates, temp_max, temp_min, temp_mean, precip, et0, strict=True)
+    ]
 
 
 async def fetch_forecast(
@@ -155,17 +185,17 @@ async def fetch_forecast(
     et0 = daily.get("et0_fao_evapotranspiration", [])
 
     results = []
-    for i, d in enumerate(dates):
-        t_max = temp_max[i] if temp_max[i] is not None else 0
-        t_min = temp_min[i] if temp_min[i] is not None else 0
+    for d, t_max, t_min, p, e in zip(dates, temp_max, temp_min, precip, et0, strict=True):
+        t_max = t_max if t_max is not None else 0
+        t_min = t_min if t_min is not None else 0
         results.append(
             DailyWeather(
                 date=d,
                 temp_mean_c=round((t_max + t_min) / 2, 1),
                 temp_max_c=t_max,
                 temp_min_c=t_min,
-                precip_mm=precip[i] if precip[i] is not None else 0,
-                et0_mm=et0[i] if et0[i] is not None else 0,
+                precip_mm=p if p is not None else 0,
+                et0_mm=e if e is not None else 0,
             )
         )
 
@@ -225,54 +255,55 @@ def get_climatology_for_dates(
     Returns:
         List of DailyWeather records with historical averages
     """
-    from collections import defaultdict
-
-    # Calculate day-of-year averages from historical data
-    doy_data: dict[int, dict] = defaultdict(
-        lambda: {"temps": [], "precip": [], "et0": [], "temp_max": [], "temp_min": []}
-    )
-
+    # Accumulate per-day-of-year running sums in one pass over the history:
+    # [count, temp_mean, temp_max, temp_min, precip, et0]
+    doy_sums: dict[int, list[float]] = {}
     for record in weather_data:
         try:
-            d = date.fromisoformat(record["date"])
-            doy = d.timetuple().tm_yday
-            doy_data[doy]["temps"].append(record.get("temp_mean_c", 10))
-            doy_data[doy]["temp_max"].append(record.get("temp_max_c", 15))
-            doy_data[doy]["temp_min"].append(record.get("temp_min_c", 5))
-            doy_data[doy]["precip"].append(record.get("precip_mm", 0))
-            doy_data[doy]["et0"].append(record.get("et0_mm", 2))
-        except (ValueError, KeyError):
+            doy = date.fromisoformat(record["date"]).timetuple().tm_yday
+        except ValueError, KeyError:
             continue
+        sums = doy_sums.get(doy)
+        if sums is None:
+            sums = doy_sums[doy] = [0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        sums[0] += 1
+        sums[1] += record.get("temp_mean_c", 10)
+        sums[2] += record.get("temp_max_c", 15)
+        sums[3] += record.get("temp_min_c", 5)
+        sums[4] += record.get("precip_mm", 0)
+        sums[5] += record.get("et0_mm", 2)
+
+    # Rounded averages per day-of-year, computed once each however many
+    # requested dates share that day-of-year
+    doy_averages: dict[int, tuple[float, float, float, float, float]] = {}
+    for doy, (count, temp, temp_max, temp_min, precip, et0) in doy_sums.items():
+        doy_averages[doy] = (
+            round(temp / count, 1),
+            round(temp_max / count, 1),
+            round(temp_min / count, 1),
+            round(precip / count, 1),
+            round(et0 / count, 2),
+        )
+    # Fallback to reasonable defaults for days with no history
+    default_averages = (10.0, 15.0, 5.0, 2.0, 2.0)
 
     # Generate synthetic records for requested dates
     results = []
-    current = start_date
-    while current <= end_date:
-        doy = current.timetuple().tm_yday
-        data = doy_data.get(doy)
-
-        if data and data["temps"]:
-            avg_temp = sum(data["temps"]) / len(data["temps"])
-            avg_temp_max = sum(data["temp_max"]) / len(data["temp_max"])
-            avg_temp_min = sum(data["temp_min"]) / len(data["temp_min"])
-            avg_precip = sum(data["precip"]) / len(data["precip"])
-            avg_et0 = sum(data["et0"]) / len(data["et0"])
-        else:
-            # Fallback to reasonable defaults
-            avg_temp, avg_temp_max, avg_temp_min = 10.0, 15.0, 5.0
-            avg_precip, avg_et0 = 2.0, 2.0
-
+    for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        current = date.fromordinal(ordinal)
+        avg_temp, avg_temp_max, avg_temp_min, avg_precip, avg_et0 = doy_averages.get(
+            current.timetuple().tm_yday, default_averages
+        )
         results.append(
             DailyWeather(
                 date=current.isoformat(),
-                temp_mean_c=round(avg_temp, 1),
-                temp_max_c=round(avg_temp_max, 1),
-                temp_min_c=round(avg_temp_min, 1),
-                precip_mm=round(avg_precip, 1),
-                et0_mm=round(avg_et0, 2),
+                temp_mean_c=avg_temp,
+                temp_max_c=avg_temp_max,
+                temp_min_c=avg_temp_min,
+                precip_mm=avg_precip,
+                et0_mm=avg_et0,
             )
         )
-        current += timedelta(days=1)
 
     return results
 
@@ -285,8 +316,7 @@ def load_cached_weather(cache_path: Path | None = None) -> WeatherData | None:
     if not cache_path.exists():
         return None
 
-    with open(cache_path) as f:
-        return json.load(f)
+    return json.loads(cache_path.read_bytes())
 
 
 def save_weather_cache(data: WeatherData, cache_path: Path | None = None) -> Path:
@@ -296,8 +326,9 @@ def save_weather_cache(data: WeatherData, cache_path: Path | None = None) -> Pat
 
     cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(cache_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Compact, serialized once and written once: multi-year caches are
+    # thousands of records and only ever read back by code
+    cache_path.write_text(json.dumps(data, separators=(",", ":")))
 
     return cache_path
 
@@ -315,7 +346,7 @@ async def update_weather_cache(
     - Loads existing cache (unless refresh=True)
     - Fetches any missing historical days
     - Adds recent days and forecast
-    - Saves updated cache
+    - Saves updated cache (skipped when nothing new was merged)
 
     Args:
         lat: Latitude
@@ -337,54 +368,69 @@ async def update_weather_cache(
     yesterday = today - timedelta(days=1)
 
     if cached:
-        # Find the latest date in cache
-        existing_dates = {d["date"] for d in cached["daily_data"]}
-        latest_cached = max(existing_dates)
+        # Index cached records by date so each merge below is a dict lookup
+        # rather than a scan of the whole history
+        daily_data = cached["daily_data"]
+        index_by_date = {d["date"]: i for i, d in enumerate(daily_data)}
+        latest_cached = max(index_by_date)
         latest_date = date.fromisoformat(latest_cached)
 
-        # Fetch missing historical days (archive API is ~5 days behind)
+        # Missing historical days (archive API is ~5 days behind)
         archive_end = today - timedelta(days=5)
-        if latest_date < archive_end:
-            print(f"Fetching historical data from {latest_date + timedelta(days=1)} to {archive_end}...")
-            new_historical = await fetch_historical(latest_date + timedelta(days=1), archive_end, lat, lon)
-            # Merge new historical data
-            for record in new_historical:
-                if record["date"] not in existing_dates:
-                    cached["daily_data"].append(record)
-                    existing_dates.add(record["date"])
-
-        # Fetch recent + forecast (covers gap between archive and today)
-        print(f"Fetching recent days and {min(forecast_days, 16)}-day forecast...")
-        try:
-            recent_forecast = await fetch_forecast(
-                days=forecast_days,
-                lat=lat,
-                lon=lon,
-                include_past_days=14,  # Overlap to fill any gaps
-            )
-        except Exception as e:
-            print(f"Warning: Forecast API unavailable ({e}), using cached data")
-            recent_forecast = []
+        archive_start = latest_date + timedelta(days=1)
+
+        async def fetch_new_historical() -> list[DailyWeather]:
+            if archive_start > archive_end:
+                return []
+            print(f"Fetching historical data from {archive_start} to {archive_end}...")
+            return await fetch_historical(archive_start, archive_end, lat, lon)
+
+        # Recent + forecast (covers gap between archive and today)
+        async def fetch_recent_forecast() -> list[DailyWeather]:
+            print(f"Fetching recent days and {min(forecast_days, 16)}-day forecast...")
+            try:
+                return await fetch_forecast(
+                    days=forecast_days,
+                    lat=lat,
+                    lon=lon,
+                    include_past_days=14,  # Overlap to fill any gaps
+                )
+            except Exception as e:
+                print(f"Warning: Forecast API unavailable ({e}), using cached data")
+                return []
+
+        # The archive and forecast endpoints are independent; fetch both at once
+        new_historical, recent_forecast = await asyncio.gather(fetch_new_historical(), fetch_recent_forecast())
+
+        # Track whether anything changed so an up-to-date cache isn't rewritten
+        dirty = False
+
+        # Merge new historical data
+        for record in new_historical:
+            if record["date"] not in index_by_date:
+                index_by_date[record["date"]] = len(daily_data)
+                daily_data.append(record)
+                dirty = True
 
         # Merge, preferring existing historical data over forecast for past dates
+        yesterday_str = yesterday.isoformat()
         for record in recent_forecast:
-            record_date = date.fromisoformat(record["date"])
-            if record["date"] not in existing_dates:
-                cached["daily_data"].append(record)
-                existing_dates.add(record["date"])
-            elif record_date > yesterday:
+            i = index_by_date.get(record["date"])
+            if i is None:
+                index_by_date[record["date"]] = len(daily_data)
+                daily_data.append(record)
+                dirty = True
+            elif record["date"] > yesterday_str and daily_data[i] != record:
                 # Update forecast days
-                for i, existing in enumerate(cached["daily_data"]):
-                    if existing["date"] == record["date"]:
-                        cached["daily_data"][i] = record
-                        break
-
-        # Sort by date
-        cached["daily_data"].sort(key=lambda x: x["date"])
-        cached["fetched_at"] = datetime.now().isoformat()
-        cached["daily_records"] = len(cached["daily_data"])
-
-        save_weather_cache(cached, cache_path)
+                daily_data[i] = record
+                dirty = True
+
+        if dirty:
+            # Sort by date
+            daily_data.sort(key=itemgetter("date"))
+            cached["fetched_at"] = datetime.now().isoformat()
+            cached["daily_records"] = len(daily_data)
+            save_weather_cache(cached, cache_path)
         return cached
 
     else:
@@ -395,23 +441,23 @@ async def update_weather_cache(
         start = date(2018, 1, 1)
         archive_end = today - timedelta(days=5)
 
-        historical = await fetch_historical(start, archive_end, lat, lon)
-
-        # Fetch recent + forecast
-        recent_forecast = await fetch_forecast(
-            days=forecast_days,
-            lat=lat,
-            lon=lon,
-            include_past_days=14,
+        # Fetch history and recent + forecast concurrently
+        historical, recent_forecast = await asyncio.gather(
+            fetch_historical(start, archive_end, lat, lon),
+            fetch_forecast(
+                days=forecast_days,
+                lat=lat,
+                lon=lon,
+                include_past_days=14,
+            ),
         )
 
-        # Combine
-        all_dates = {d["date"] for d in historical}
+        # Combine, keyed by date so archive records win over forecast overlap
+        by_date = {d["date"]: d for d in historical}
         for record in recent_forecast:
-            if record["date"] not in all_dates:
-                historical.append(record)
+            by_date.setdefault(record["date"], record)
 
-        historical.sort(key=lambda x: x["date"])
+        historical = sorted(by_date.values(), key=itemgetter("date"))
 
         data: WeatherData = {
             "location": {
@@ -474,17 +520,24 @@ def _get_weekly_summary(days: list[DailyWeather]) -> dict:
     if not days:
         return {}
 
-    temps = [d["temp_mean_c"] for d in days]
-    temp_highs = [d["temp_max_c"] for d in days]
-    temp_lows = [d["temp_min_c"] for d in days]
-    precip = [d["precip_mm"] for d in days]
+    temp_total = precip_total = 0.0
+    temp_high = float("-inf")
+    temp_low = float("inf")
+    precip_days = 0
+    for d in days:
+        temp_total += d["temp_mean_c"]
+        temp_high = max(temp_high, d["temp_max_c"])
+        temp_low = min(temp_low, d["temp_min_c"])
+        precip_total += d["precip_mm"]
+        if d["precip_mm"] >= 0.1:
+            precip_days += 1
 
     return {
-        "temp_avg_c": sum(temps) / len(temps),
-        "temp_high_c": max(temp_highs),
-        "temp_low_c": min(temp_lows),
-        "precip_total_mm": sum(precip),
-        "precip_days": sum(1 for p in precip if p >= 0.1),
+        "temp_avg_c": temp_total / len(days),
+        "temp_high_c": temp_high,
+        "temp_low_c": temp_low,
+        "precip_total_mm": precip_total,
+        "precip_days": precip_days,
         "days": len(days),
     }
 
@@ -544,22 +597,28 @@ async def show_weather_forecast(days: int = 7) -> None:
         print("Source: Open-Meteo weather forecast")
 
 
+# Short weekday names indexed by date.weekday()
+_DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
 def _print_daily_forecast(forecast: list[DailyWeather], api_days: int) -> None:
     """Print daily forecast details."""
     print(f"\n{'Date':<12} {'Day':<10} {'High/Low':<14} {'Precip':<10} {'Conditions'}")
     print("-" * 60)
 
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
     today = date.today()
+    tomorrow = today + timedelta(days=1)
 
+    # Rows are collected and written with a single print
+    lines = []
     for i, day in enumerate(forecast):
         d = date.fromisoformat(day["date"])
-        day_name = day_names[d.weekday()]
+        day_name = _DAY_NAMES[d.weekday()]
 
         # Mark today/tomorrow
         if d == today:
             day_name = "TODAY"
-        elif d == today + timedelta(days=1):
+        elif d == tomorrow:
             day_name = "Tomorrow"
 
         temp_range = format_temp_range(day["temp_min_c"], day["temp_max_c"])
@@ -569,18 +628,21 @@ def _print_daily_forecast(forecast: list[DailyWeather], api_days: int) -> None:
         # Mark climatology days
         marker = "" if i < api_days else " *"
 
-        print(f"{day['date']:<12} {day_name:<10} {temp_range:<14} {precip:<10} {conditions}{marker}")
+        lines.append(f"{day['date']:<12} {day_name:<10} {temp_range:<14} {precip:<10} {conditions}{marker}")
+    print("\n".join(lines))
 
 
 def _print_weekly_forecast(forecast: list[DailyWeather], api_days: int, total_days: int) -> None:
     """Print weekly summary forecast for longer horizons."""
+    # Parse each date once; both the weekly and monthly groupings reuse it
+    dates = [date.fromisoformat(day["date"]) for day in forecast]
+
     # Group into weeks
     weeks = []
     current_week = []
     week_start = None
 
-    for i, day in enumerate(forecast):
-        d = date.fromisoformat(day["date"])
+    for i, (day, d) in enumerate(zip(forecast, dates, strict=True)):
         if week_start is None:
             week_start = d
 
@@ -603,6 +665,7 @@ def _print_weekly_forecast(forecast: list[DailyWeather], api_days: int, total_da
     print(f"\n{'Period':<20} {'Avg Temp':<12} {'High/Low':<14} {'Precip':<12} {'Source'}")
     print("-" * 70)
 
+    lines = []
     running_days = 0
     for week in weeks:
         summary = _get_weekly_summary(week["days"])
@@ -622,7 +685,8 @@ def _print_weekly_forecast(forecast: list[DailyWeather], api_days: int, total_da
         high_low = format_temp_range(summary["temp_low_c"], summary["temp_high_c"])
         precip = format_precip_summary(summary["precip_total_mm"], summary["precip_days"])
 
-        print(f"{period:<20} {avg_temp:<12} {high_low:<14} {precip:<12} {source}")
+        lines.append(f"{period:<20} {avg_temp:<12} {high_low:<14} {precip:<12} {source}")
+    print("\n".join(lines))
 
     # Print monthly outlook for 90-day forecasts
     if total_days >= 60:
@@ -634,20 +698,20 @@ def _print_weekly_forecast(forecast: list[DailyWeather], api_days: int, total_da
         from collections import defaultdict
 
         monthly: dict[str, list] = defaultdict(list)
-        for day in forecast:
-            d = date.fromisoformat(day["date"])
-            month_key = d.strftime("%B %Y")
-            monthly[month_key].append(day)
+        for day, d in zip(forecast, dates, strict=True):
+            monthly[d.strftime("%B %Y")].append(day)
 
         print(f"{'Month':<16} {'Avg Temp':<12} {'Typical Range':<14} {'Expected Precip'}")
         print("-" * 60)
 
+        lines = []
         for month, days in monthly.items():
             summary = _get_weekly_summary(days)
             avg_temp = format_temp(summary["temp_avg_c"])
             temp_range = format_temp_range(summary["temp_low_c"], summary["temp_high_c"])
             precip = format_precip(summary["precip_total_mm"], decimals=1)
-            print(f"{month:<16} {avg_temp:<12} {temp_range:<14} {precip} over {summary['days']}d")
+            lines.append(f"{month:<16} {avg_temp:<12} {temp_range:<14} {precip} over {summary['days']}d")
+        print("\n".join(lines))
 
 
 # CLI interface
@@ -28,6 +28,7 @@ The cache format is:
 
 import json
 from datetime import date, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import TypedDict
 
@@ -180,7 +181,7 @@ async def update_paddock_weather_cache(
                             daily_data[j] = record
                             break
 
-            daily_data.sort(key=lambda x: x["date"])
+            daily_data.sort(key=itemgetter("date"))
 
             result["paddocks"][name] = PaddockWeatherEntry(
                 paddock_id=meta.get("paddock_id", ""),
@@ -34,6 +34,7 @@ from agriwebb.pasture.biomass import (
     lai_to_standing_dry_matter,
     ndre_to_lai,
     ndvi_to_standing_dry_matter,
+    select_sdm_model,
 )
 
 # =============================================================================
@@ -108,6 +109,22 @@ class TestSeasonalModels:
 class TestNdviToStandingDryMatter:
     """Tests for the main NDVI-to-SDM conversion function."""
 
+    def test_preselected_model_matches_month_dispatch(self):
+        """Passing select_sdm_model(month) gives the same result as passing month."""
+        for index in ("NDVI", "EVI", "NDRE"):
+            for month in range(1, 13):
+                model = select_sdm_model(month, index)
+                for ndvi in (0.05, 0.3, 0.6, 0.9):
+                    assert ndvi_to_standing_dry_matter(ndvi, model=model) == ndvi_to_standing_dry_matter(
+                        ndvi, month=month, index=index
+                    )
+        assert select_sdm_model(None) is ANNUAL_MODEL
+
+    def test_select_sdm_model_rejects_unknown_index(self):
+        """Unknown vegetation indices raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown vegetation index"):
+            select_sdm_model(4, "SAVI")
+
     def test_zero_ndvi_returns_zero(self):
         """NDVI of 0 is below all min_ndvi thresholds, returns 0."""
         sdm, model = ndvi_to_standing_dry_matter(0.0, month=4)
@@ -461,6 +478,56 @@ class TestEdgeCases:
         assert adjusted < foo_raw
         assert adjusted > 0
 
+    def test_feed_sync_foo_matches_pipeline(self, monkeypatch):
+        """calculate_foo_from_ndvi agrees with the per-step NDVI -> FOO pipeline."""
+        from datetime import date
+
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_grazing_consumption", lambda: {})
+
+        records = [{"paddock_id": f"p{i}", "ndvi_mean": ndvi} for i, ndvi in enumerate([-0.1, 0.05, 0.4, 0.7, 1.2])]
+        results = feed.calculate_foo_from_ndvi(records, date(2026, 4, 15))
+
+        for record, result in zip(records, results, strict=True):
+            ndvi = min(max(record["ndvi_mean"], 0), 0.8)
+            sdm, model = ndvi_to_standing_dry_matter(ndvi, month=4)
+            foo, correction = adjust_foo_for_grazing(sdm * 0.75, 0)
+            assert result["sdm_kg_ha"] == sdm
+            assert result["foo_kg_ha"] == foo
+            assert result["grazing_correction"] == correction
+            assert result["model"] == model.name
+            assert result["date"] == "2026-04-15"
+
+    def test_feed_sync_foo_applies_per_paddock_grazing(self, monkeypatch):
+        """Grazed paddocks get their own correction; others get the ungrazed base."""
+        from datetime import date
+
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_grazing_consumption", lambda: {"p1": {"intake_per_ha_kg_day": 94.0}})
+
+        records = [{"paddock_id": "p0", "ndvi_mean": 0.6}, {"paddock_id": "p1", "ndvi_mean": 0.6}]
+        ungrazed, grazed = feed.calculate_foo_from_ndvi(records, date(2026, 4, 15))
+
+        assert (ungrazed["grazing_pressure_kg_ha_day"], ungrazed["grazing_correction"]) == (0.0, 0.85)
+        assert grazed["grazing_pressure_kg_ha_day"] == 94.0
+        expected = adjust_foo_for_grazing(grazed["sdm_kg_ha"] * 0.75, 94.0)
+        assert (grazed["foo_kg_ha"], grazed["grazing_correction"]) == expected
+
+    def test_feed_sync_foo_accepts_streamed_records(self, monkeypatch):
+        """calculate_foo_from_ndvi consumes any iterable of records in one pass."""
+        from datetime import date
+
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_grazing_consumption", lambda: {})
+
+        records = [{"paddock_id": f"p{i}", "ndvi_mean": 0.5} for i in range(3)]
+        streamed = feed.calculate_foo_from_ndvi(iter(records), date(2026, 4, 15))
+
+        assert streamed == feed.calculate_foo_from_ndvi(records, date(2026, 4, 15))
+
     def test_uncertainty_constants_documented(self):
         """Expected uncertainty values are documented."""
         assert EXPECTED_UNCERTAINTY["sdm_error_kg_ha"] == 260
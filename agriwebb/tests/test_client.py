@@ -1,7 +1,11 @@
 """Tests for the AgriWebb client module."""
 
+import asyncio
+from pathlib import Path
+
 import httpx
 import pytest
+import respx
 
 from agriwebb.core import client
 from agriwebb.core.client import AgriWebbAPIError
@@ -39,6 +43,88 @@ class TestGraphQL:
         with pytest.raises(httpx.HTTPStatusError):
             await client.graphql("{ farms { id } }")
 
+    async def test_graphql_reuses_pooled_client(self, mock_agriwebb):
+        """Verify consecutive queries share one client until it is closed."""
+        mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json={"data": {}}))
+
+        await client.graphql("{ farms { id } }")
+        first = client._graphql_client
+        await client.graphql("{ farms { id } }")
+
+        assert client._graphql_client is first
+        await client.close_graphql_client()
+        assert first.is_closed
+        assert client._graphql_client is None
+
+
+class TestHttpGetWithRetry:
+    """Tests for the http_get_with_retry function."""
+
+    async def test_reuses_pooled_client(self):
+        """Verify external GETs share one client until it is closed."""
+        with respx.mock(base_url="https://example.com") as mock:
+            mock.get("/data").mock(return_value=httpx.Response(200, json={}))
+
+            await client.http_get_with_retry("https://example.com/data")
+            first = client._http_client
+            await client.http_get_with_retry("https://example.com/data")
+
+            assert client._http_client is first
+            assert mock.calls.call_count == 2
+
+        await client.close_http_client()
+        assert first.is_closed
+        assert client._http_client is None
+
+
+class TestGraphQLWithRetry:
+    """Tests for the graphql_with_retry function."""
+
+    async def test_bounds_concurrent_requests(self, mock_agriwebb, monkeypatch):
+        """Verify all callers share one in-flight request limit."""
+        monkeypatch.setattr(client.settings, "agriwebb_max_concurrent_requests", 2)
+        monkeypatch.setattr(client, "_request_semaphore", None)
+        in_flight = 0
+        peak = 0
+
+        async def slow_response(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"data": {}})
+
+        mock_agriwebb.post("/v2").mock(side_effect=slow_response)
+
+        await asyncio.gather(*[client.graphql_with_retry("{ farms { id } }") for _ in range(6)])
+
+        assert peak == 2
+
+    async def test_retries_rate_limited_request_after_retry_after(self, mock_agriwebb):
+        """Verify an HTTP 429 is retried instead of failing the push outright."""
+        route = mock_agriwebb.post("/v2").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}, text="Too Many Requests"),
+                httpx.Response(200, json={"data": {"ok": True}}),
+            ]
+        )
+
+        result = await client.graphql_with_retry("{ farms { id } }")
+
+        assert result == {"data": {"ok": True}}
+        assert route.call_count == 2
+
+    def test_parses_retry_after_forms(self):
+        """Verify delta-seconds and HTTP-date Retry-After values are understood."""
+        assert client._parse_retry_after(httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+        assert (
+            client._parse_retry_after(httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+            == 0.0
+        )
+        assert client._parse_retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+        assert client._parse_retry_after(httpx.Response(429)) is None
+
 
 class TestGetFarm:
     """Tests for the get_farm function."""
@@ -84,6 +170,65 @@ class TestGetFarmLocation:
             client.settings.agriwebb_farm_id = original_farm_id
 
 
+class TestGetFarmTimezone:
+    """Tests for the get_farm_timezone function."""
+
+    async def test_persists_timezone_between_runs(self, mock_agriwebb, sample_farm_response, tmp_path, monkeypatch):
+        """Verify the farm lookup result is written to disk and reused by a fresh process."""
+        route = mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json=sample_farm_response))
+        monkeypatch.setattr(client, "get_cache_dir", lambda: tmp_path)
+        monkeypatch.setattr(client.settings, "tz", None)
+        monkeypatch.setattr(client.settings, "agriwebb_farm_id", "test-farm-id")
+        monkeypatch.setattr(client, "_cached_farm_tz", None)
+
+        first = await client.get_farm_timezone()
+        monkeypatch.setattr(client, "_cached_farm_tz", None)  # simulate a new CLI invocation
+        second = await client.get_farm_timezone()
+
+        assert str(first) == str(second) == "America/Los_Angeles"
+        assert route.call_count == 1
+        assert (tmp_path / client.FARM_TZ_CACHE_FILE).exists()
+
+    async def test_unwritable_cache_dir_does_not_fail_lookup(self, mock_agriwebb, sample_farm_response, monkeypatch):
+        """Verify a cache write failure still returns the looked-up timezone."""
+        mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json=sample_farm_response))
+        monkeypatch.setattr(client, "get_cache_dir", lambda: Path("/nonexistent/agriwebb-cache"))
+        monkeypatch.setattr(client.settings, "tz", None)
+        monkeypatch.setattr(client.settings, "agriwebb_farm_id", "test-farm-id")
+        monkeypatch.setattr(client, "_cached_farm_tz", None)
+
+        tz = await client.get_farm_timezone()
+
+        assert str(tz) == "America/Los_Angeles"
+
+    async def test_cache_dir_creation_failure_does_not_fail_lookup(
+        self, mock_agriwebb, sample_farm_response, monkeypatch
+    ):
+        """Verify get_cache_dir() failing on read and write still returns the looked-up timezone."""
+
+        def unavailable_cache_dir():
+            raise PermissionError("read-only file system")
+
+        mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json=sample_farm_response))
+        monkeypatch.setattr(client, "get_cache_dir", unavailable_cache_dir)
+        monkeypatch.setattr(client.settings, "tz", None)
+        monkeypatch.setattr(client.settings, "agriwebb_farm_id", "test-farm-id")
+        monkeypatch.setattr(client, "_cached_farm_tz", None)
+
+        tz = await client.get_farm_timezone()
+
+        assert str(tz) == "America/Los_Angeles"
+
+    async def test_ignores_cache_for_other_farm(self, tmp_path, monkeypatch):
+        """Verify a cached timezone recorded for a different farm is not used."""
+        import json
+
+        (tmp_path / client.FARM_TZ_CACHE_FILE).write_text(json.dumps({"farm_id": "other", "time_zone": "UTC"}))
+        monkeypatch.setattr(client, "get_cache_dir", lambda: tmp_path)
+
+        assert client._read_cached_farm_tz_name() is None
+
+
 class TestAddRainfall:
     """Tests for the add_rainfall function."""
 
@@ -145,6 +290,137 @@ class TestAddRainfall:
             client.settings.agriwebb_weather_sensor_id = original
 
 
+class TestAddRainfallBulk:
+    """Tests for the add_rainfall_bulk function."""
+
+    async def test_sends_aliased_mutations_per_chunk(self, mock_agriwebb, monkeypatch):
+        """Verify records are sent as aliased mutations, one request per chunk."""
+        import json
+
+        monkeypatch.setattr(weather_api, "RAINFALL_BATCH_SIZE", 2)
+        route = mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json={"data": {}}))
+
+        responses = await weather_api.add_rainfall_bulk([("2026-01-15", 1.0), ("2026-01-16", 0.5), ("2026-01-17", 0.0)])
+
+        assert len(responses) == 2
+        assert route.call_count == 2
+        bodies = [json.loads(call.request.content) for call in route.calls]
+        first, second = sorted(bodies, key=lambda b: len(b["variables"]), reverse=True)
+        assert "r0: addRainfalls" in first["query"]
+        assert "r1: addRainfalls" in first["query"]
+        assert first["variables"]["v0"] == 25.4
+        assert first["variables"]["v1"] == 12.7
+        assert "r1:" not in second["query"]
+        assert second["variables"]["v0"] == 0.0
+
+    async def test_failed_chunk_resends_only_missing_records(self, mock_agriwebb):
+        """Verify a failed chunk is not retried whole; only records that did not land are resent."""
+        import json
+
+        from agriwebb.core.timestamps import to_timestamp_ms
+
+        route = mock_agriwebb.post("/v2").mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={
+                        "data": {"r0": {"rainfalls": [{"time": 1}]}, "r1": None},
+                        "errors": [{"message": "Internal Server Error"}],
+                    },
+                ),
+                httpx.Response(
+                    200,
+                    json={"data": {"rainfalls": [{"id": "x", "time": to_timestamp_ms("2026-01-15"), "value": 25.4}]}},
+                ),
+                httpx.Response(200, json={"data": {"r0": {"rainfalls": []}}}),
+            ]
+        )
+
+        await weather_api.add_rainfall_bulk([("2026-01-15", 1.0), ("2026-01-16", 0.5)])
+
+        assert route.call_count == 3
+        resend = json.loads(route.calls[2].request.content)
+        assert "r1:" not in resend["query"]
+        assert resend["variables"]["t0"] == to_timestamp_ms("2026-01-16")
+        assert resend["variables"]["v0"] == 12.7
+
+    async def test_server_error_is_not_resent_when_records_landed(self, mock_agriwebb):
+        """Verify a 5xx after commit does not duplicate records that already exist."""
+        from agriwebb.core.timestamps import to_timestamp_ms
+
+        route = mock_agriwebb.post("/v2").mock(
+            side_effect=[
+                httpx.Response(502, text="Bad Gateway"),
+                httpx.Response(
+                    200,
+                    json={"data": {"rainfalls": [{"id": "x", "time": to_timestamp_ms("2026-01-15"), "value": 25.4}]}},
+                ),
+            ]
+        )
+
+        responses = await weather_api.add_rainfall_bulk([("2026-01-15", 1.0)])
+
+        assert route.call_count == 2
+        assert responses == [{"data": {}}]
+
+    async def test_failed_update_is_resent_when_only_old_value_exists(self, mock_agriwebb):
+        """Verify an update is not mistaken for landed because an older record shares its timestamp."""
+        import json
+
+        from agriwebb.core.timestamps import to_timestamp_ms
+
+        route = mock_agriwebb.post("/v2").mock(
+            side_effect=[
+                httpx.Response(503, text="Service Unavailable"),
+                httpx.Response(
+                    200,
+                    json={
+                        "data": {
+                            "rainfalls": [
+                                {"id": "old", "time": to_timestamp_ms("2026-01-15"), "value": 5.08},
+                                {"id": "new", "time": to_timestamp_ms("2026-01-16"), "value": 12.7},
+                            ]
+                        }
+                    },
+                ),
+                httpx.Response(200, json={"data": {"r0": {"rainfalls": []}}}),
+            ]
+        )
+
+        await weather_api.add_rainfall_bulk([("2026-01-15", 1.0), ("2026-01-16", 0.5)])
+
+        assert route.call_count == 3
+        resend = json.loads(route.calls[2].request.content)
+        assert "r1:" not in resend["query"]
+        assert resend["variables"]["t0"] == to_timestamp_ms("2026-01-15")
+        assert resend["variables"]["v0"] == 25.4
+
+    async def test_raises_when_resend_fails(self, mock_agriwebb):
+        """Verify a failing resend surfaces an error instead of retrying again."""
+        route = mock_agriwebb.post("/v2").mock(
+            side_effect=[
+                httpx.Response(500, text="boom"),
+                httpx.Response(200, json={"data": {"rainfalls": []}}),
+                httpx.Response(500, text="boom"),
+            ]
+        )
+
+        with pytest.raises(AgriWebbAPIError, match="1 records"):
+            await weather_api.add_rainfall_bulk([("2026-01-15", 1.0)])
+        assert route.call_count == 3
+
+    async def test_raises_without_sensor_id(self, mock_agriwebb):
+        """Verify error raised when no sensor ID configured."""
+        original = client.settings.agriwebb_weather_sensor_id
+        client.settings.agriwebb_weather_sensor_id = None
+
+        try:
+            with pytest.raises(ValueError, match="No sensor ID configured"):
+                await weather_api.add_rainfall_bulk([("2026-01-15", 0.5)])
+        finally:
+            client.settings.agriwebb_weather_sensor_id = original
+
+
 class TestCreateRainGauge:
     """Tests for the create_rain_gauge function."""
 
@@ -586,3 +586,167 @@ class TestFieldsToSoilsIntegration:
             lat, lon = centroid
             assert -90 <= lat <= 90
             assert -180 <= lon <= 180
+
+
+class TestNDVIHistoryFetching:
+    """Tests for incremental monthly NDVI history fetching."""
+
+    async def test_reuses_completed_cached_months(self, monkeypatch):
+        """Verify settled cached months are reused and failed/recent months re-fetched."""
+        from datetime import date
+
+        from agriwebb.satellite import ndvi_historical
+
+        calls = []
+
+        def fake_extract(paddock, start, end, scale=30):
+            calls.append(start)
+            return {"ndvi_mean": 0.5, "ndvi_stddev": 0.1, "pixel_count": 10, "cloud_free_pct": 90}
+
+        monkeypatch.setattr(ndvi_historical.satellite, "extract_paddock_ndvi", fake_extract)
+
+        today = date(2025, 5, 20)
+        cached = [
+            {"date": "2024-01-01", "year": 2024, "month": 1, "ndvi_mean": 0.7},
+            {"date": "2024-02-01", "year": 2024, "month": 2, "ndvi_mean": None, "error": "timeout"},
+            {"date": "2025-04-01", "year": 2025, "month": 4, "ndvi_mean": 0.3},
+            {"date": "2025-05-01", "year": 2025, "month": 5, "ndvi_mean": 0.2},
+        ]
+
+        months = ndvi_historical.month_schedule(start_year=2024, today=today)
+        history = await ndvi_historical.fetch_paddock_history({"id": "p1"}, months, cached=cached, cached_at=today)
+
+        assert len(history) == 17
+        assert history[0] is cached[0]
+        assert "2024-01-01" not in calls
+        assert "2024-02-01" in calls
+        assert "2025-04-01" in calls
+        assert "2025-05-01" in calls
+        assert len(calls) == len(history) - 1
+
+    async def test_refetches_months_cached_before_rollover(self, monkeypatch):
+        """Verify months that were current or previous when cached are re-fetched after rollover."""
+        from datetime import date
+
+        from agriwebb.satellite import ndvi_historical
+
+        calls = []
+
+        def fake_extract(paddock, start, end, scale=30):
+            calls.append(start)
+            return {"ndvi_mean": 0.5, "ndvi_stddev": 0.1, "pixel_count": 10, "cloud_free_pct": 90}
+
+        monkeypatch.setattr(ndvi_historical.satellite, "extract_paddock_ndvi", fake_extract)
+
+        # Cached mid-March, when March was in progress and February still settling
+        cached = [
+            {"date": "2025-01-01", "year": 2025, "month": 1, "ndvi_mean": 0.6},
+            {"date": "2025-02-01", "year": 2025, "month": 2, "ndvi_mean": 0.5},
+            {"date": "2025-03-01", "year": 2025, "month": 3, "ndvi_mean": 0.1},
+        ]
+        months = ndvi_historical.month_schedule(start_year=2025, today=date(2025, 6, 5))
+        history = await ndvi_historical.fetch_paddock_history(
+            {"id": "p1"}, months, cached=cached, cached_at=date(2025, 3, 15)
+        )
+
+        assert history[0] is cached[0]
+        assert calls == ["2025-02-01", "2025-03-01", "2025-04-01", "2025-05-01", "2025-06-01"]
+        assert history[2]["ndvi_mean"] == 0.5
+
+    async def test_no_reuse_without_cache_date(self, monkeypatch):
+        """Verify a cache with no fetch date is not trusted."""
+        from datetime import date
+
+        from agriwebb.satellite import ndvi_historical
+
+        calls = []
+
+        def fake_extract(paddock, start, end, scale=30):
+            calls.append(start)
+            return {"ndvi_mean": 0.5, "ndvi_stddev": 0.1, "pixel_count": 10, "cloud_free_pct": 90}
+
+        monkeypatch.setattr(ndvi_historical.satellite, "extract_paddock_ndvi", fake_extract)
+
+        cached = [{"date": "2024-01-01", "year": 2024, "month": 1, "ndvi_mean": 0.7}]
+        months = ndvi_historical.month_schedule(start_year=2024, today=date(2024, 6, 1))
+        await ndvi_historical.fetch_paddock_history({"id": "p1"}, months, cached=cached)
+
+        assert len(calls) == len(months)
+
+    def test_month_schedule_stops_at_current_month(self):
+        """Verify the schedule covers whole months up to and including today's month."""
+        from datetime import date
+
+        from agriwebb.satellite import ndvi_historical
+
+        months = ndvi_historical.month_schedule(start_year=2024, today=date(2025, 2, 10))
+
+        assert len(months) == 14
+        assert months[0] == (date(2024, 1, 1), date(2024, 1, 31), 2024, 1)
+        assert months[1][1] == date(2024, 2, 29)
+        assert months[-1] == (date(2025, 2, 1), date(2025, 2, 28), 2025, 2)
+
+
+class TestGrowthRateNDVIFetching:
+    """Tests for concurrent per-paddock NDVI fetching in the growth-rate sync."""
+
+    async def test_fetch_windows_ndvi_is_bounded_and_skips_failures(self, monkeypatch):
+        """Verify one call per paddock covers all windows, bounded and failure-tolerant."""
+        import threading
+        import time
+        from datetime import date
+
+        from agriwebb.sync import growth_rates
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        calls = []
+
+        def fake_extract_multi(paddock, windows, scale=30):
+            nonlocal in_flight, peak
+            with lock:
+                calls.append((paddock["id"], windows))
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            if paddock["id"] == "bad":
+                raise RuntimeError("no imagery")
+            if paddock["id"] == "empty":
+                return [{"ndvi_mean": None}, {"ndvi_mean": 0.3}]
+            return [{"ndvi_mean": 0.5}, {"ndvi_mean": 0.6}]
+
+        monkeypatch.setattr(growth_rates.satellite, "extract_paddock_ndvi_multi", fake_extract_multi)
+
+        geometry = {"type": "Polygon", "coordinates": []}
+        paddocks = [{"id": f"p{i}", "name": f"P{i}", "geometry": geometry} for i in range(6)]
+        paddocks += [
+            {"id": "bad", "name": "Bad", "geometry": geometry},
+            {"id": "empty", "name": "Empty", "geometry": geometry},
+            {"id": "nogeo", "name": "No Geometry"},
+        ]
+        windows = [(date(2026, 1, 1), date(2026, 1, 31)), (date(2026, 1, 31), date(2026, 3, 2))]
+
+        previous, current = await growth_rates.fetch_windows_ndvi(paddocks, windows, concurrency=3)
+
+        assert previous == {f"p{i}": 0.5 for i in range(6)}
+        assert current == {**{f"p{i}": 0.6 for i in range(6)}, "empty": 0.3}
+        assert len(calls) == 8
+        assert calls[0][1] == [("2026-01-01", "2026-01-31"), ("2026-01-31", "2026-03-02")]
+        assert 1 < peak <= 3
+
+    def test_paddock_index_stats_are_quantized(self):
+        """Verify index statistics are kept to INDEX_DECIMALS and missing stats stay None."""
+        from agriwebb.satellite import gee
+
+        stats = {"NDVI_mean": 0.623456789, "NDVI_min": 0.1, "NDVI_max": None, "NDVI_count": 10}
+        result = gee._to_paddock_ndvi(
+            {"id": "p1", "totalArea": 1.0}, "2026-01-01", "2026-01-31", stats, 30, "NDVI", None
+        )
+
+        assert result["ndvi_mean"] == 0.6235
+        assert result["ndvi_min"] == 0.1
+        assert result["ndvi_max"] is None
+        assert result["ndvi_stddev"] is None
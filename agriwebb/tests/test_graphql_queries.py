@@ -9,6 +9,7 @@ Tested functions:
   - client.update_map_feature() — mutation with f-string interpolation
   - weather_api.get_rainfalls() — date-filtered query path
   - pasture_api.get_pasture_growth_rates() — date-filtered query path
+  - pasture_api.add_*_batch() — chunked add-mutations
 """
 
 import json
@@ -690,3 +691,43 @@ class TestGetPastureGrowthRatesDateFilter:
         assert "time" in query
         assert "value" in query
         assert "fieldId" in query
+
+
+# =============================================================================
+# add_*_batch() — Chunked Mutation Tests
+# =============================================================================
+
+
+class TestAddBatchChunking:
+    """Test that large pasture pushes are split into bounded mutations."""
+
+    async def test_small_push_is_single_mutation(self, mock_agriwebb):
+        """Pushes within MUTATION_BATCH_SIZE go out as one unchanged request."""
+        response = {"data": {"addFeedOnOffers": {"feedOnOffers": [{"id": "foo1"}]}}}
+        route = mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json=response))
+
+        result = await pasture_api.add_feed_on_offer_batch(
+            [{"field_id": "f1", "foo_kg_ha": 1200, "record_date": "2026-04-01"}]
+        )
+
+        assert route.call_count == 1
+        assert result == response
+
+    async def test_large_push_is_chunked_and_merged(self, mock_agriwebb, monkeypatch):
+        """Larger pushes are split into chunks whose created records are merged in order."""
+        monkeypatch.setattr(pasture_api, "MUTATION_BATCH_SIZE", 2)
+
+        def echo(request):
+            inputs = json.loads(request.content)["variables"]["input"]
+            rates = [{"id": r["fieldId"], "time": r["time"], "value": r["value"]} for r in inputs]
+            return httpx.Response(200, json={"data": {"addPastureGrowthRates": {"pastureGrowthRates": rates}}})
+
+        route = mock_agriwebb.post("/v2").mock(side_effect=echo)
+        records = [{"field_id": f"f{i}", "growth_rate": 10.0 + i, "record_date": "2026-04-01"} for i in range(5)]
+
+        result = await pasture_api.add_pasture_growth_rates_batch(records)
+
+        assert route.call_count == 3
+        assert [len(json.loads(c.request.content)["variables"]["input"]) for c in route.calls] == [2, 2, 1]
+        rates = result["data"]["addPastureGrowthRates"]["pastureGrowthRates"]
+        assert [r["id"] for r in rates] == [f"f{i}" for i in range(5)]
@@ -16,6 +16,8 @@ from agriwebb.data.grazing import (
     # Functions
     get_latest_weight,
     get_wean_date,
+    load_farm_data,
+    load_fields,
 )
 
 
@@ -495,3 +497,39 @@ class TestIntakeCalculations:
 
         # Default lamb weight is 30 kg, intake is 4.5% = 1.35 kg
         assert 1.0 < intake["total_intake_kg"] < 2.0
+
+
+class TestLoadCachedFarmData:
+    """Tests for loading the animals.json cache."""
+
+    def test_parses_file_once_until_it_changes(self, tmp_path, monkeypatch):
+        """Farm data and fields share one parse, and a rewrite is picked up."""
+        import json
+        import os
+
+        from agriwebb.data import grazing
+
+        cache_path = tmp_path / "animals.json"
+        cache_path.write_text(json.dumps({"animals": [], "fields": [{"id": "f1", "name": "North", "totalArea": 2.0}]}))
+
+        parses = 0
+        real_load = json.load
+
+        def counting_load(f):
+            nonlocal parses
+            parses += 1
+            return real_load(f)
+
+        monkeypatch.setattr(grazing.json, "load", counting_load)
+        grazing._read_cache_json.cache_clear()
+
+        assert load_farm_data(cache_path)["animals"] == []
+        assert load_fields(cache_path) == {"f1": {"id": "f1", "name": "North", "area_ha": 2.0}}
+        assert parses == 1
+
+        cache_path.write_text(json.dumps({"animals": [{"animalId": "a1"}], "fields": []}))
+        stat = cache_path.stat()
+        os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_farm_data(cache_path)["animals"] == [{"animalId": "a1"}]
+        assert parses == 2
@@ -1,5 +1,7 @@
 """Tests for the livestock module."""
 
+import json
+
 import httpx
 import pytest
 
@@ -305,6 +307,36 @@ class TestGetMobs:
         assert result[0]["animalCount"] == 25
 
 
+class TestRecordQueries:
+    """Tests for the per-farm record queries (weights, treatments, pregnancies)."""
+
+    async def test_passes_ids_as_variables(self, mock_agriwebb):
+        """Verify farm and animal IDs are sent as variables, not inlined in the query."""
+        route = mock_agriwebb.post("/v2").mock(
+            return_value=httpx.Response(200, json={"data": {"weightRecords": [{"id": "w1"}]}})
+        )
+
+        result = await livestock.get_weights(animal_id="animal-42")
+
+        body = json.loads(route.calls[0].request.content)
+        assert result == [{"id": "w1"}]
+        assert body["variables"] == {"farmId": "test-farm-id", "animalId": "animal-42"}
+        assert "animal-42" not in body["query"]
+        assert "$animalId" in body["query"]
+
+    async def test_omits_animal_filter_when_not_given(self, mock_agriwebb):
+        """Verify no animalId variable or filter is sent for farm-wide queries."""
+        route = mock_agriwebb.post("/v2").mock(
+            return_value=httpx.Response(200, json={"data": {"treatmentRecords": []}})
+        )
+
+        await livestock.get_treatments()
+
+        body = json.loads(route.calls[0].request.content)
+        assert body["variables"] == {"farmId": "test-farm-id"}
+        assert "filter" not in body["query"]
+
+
 class TestFormatLineageTree:
     """Tests for the format_lineage_tree function."""
 
@@ -354,3 +386,184 @@ class TestSummarizeAnimals:
         assert result["by_breed"]["Hereford"] == 1
         assert result["by_sex"]["FEMALE"] == 2
         assert result["by_status"]["onFarm"] == 2
+
+
+def _cache_api(animals: list[dict], records: dict[str, list[dict]] | None = None, fail_batches: bool = False):
+    """Build a respx side effect that answers the cache download queries."""
+    records = records or {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        query = body["query"]
+        variables = body.get("variables") or {}
+        if "GetAnimals" in query:
+            skip = variables.get("skip", 0)
+            limit = variables.get("limit", len(animals))
+            return httpx.Response(200, json={"data": {"animals": animals[skip : skip + limit]}})
+        if "GetFields" in query:
+            return httpx.Response(200, json={"data": {"fields": [{"id": "f1", "name": "North"}]}})
+        if "GetRecordsBatch" in query:
+            if fail_batches:
+                return httpx.Response(200, json={"errors": [{"message": "Query too complex"}]})
+            aliased = {k: records.get(v, []) for k, v in variables.items() if k != "farmId"}
+            return httpx.Response(200, json={"data": aliased})
+        return httpx.Response(200, json={"data": {"records": records.get(variables.get("animalId"), [])}})
+
+    return handler
+
+
+class TestInternStrings:
+    """Tests for interning repeated enum-like strings."""
+
+    def test_interns_nested_enum_values(self):
+        """Verify equal enum-like values share one object and other strings are untouched."""
+        records = json.loads(
+            '[{"recordType": "WeighRecord", "weight": {"value": 40, "unit": "kg"}, "recordId": "r1"},'
+            ' {"recordType": "WeighRecord", "weight": {"value": 41, "unit": "kg"}, "recordId": "r2"}]'
+        )
+
+        livestock._intern_strings(records)
+
+        assert records[0]["recordType"] is records[1]["recordType"]
+        assert records[0]["weight"]["unit"] is records[1]["weight"]["unit"]
+        assert records[0]["recordId"] == "r1"
+
+
+class TestFetchAllAnimalsForCache:
+    """Tests for paginated animal download."""
+
+    async def test_fetches_pages_concurrently_in_order(self, mock_agriwebb, monkeypatch):
+        """Verify pages after the first are fetched in waves and stitched back in order."""
+        monkeypatch.setattr(livestock, "PAGINATION_DELAY", 0)
+        animals = [make_animal(f"a{i}", f"T{i}") for i in range(7)]
+        route = mock_agriwebb.post("/v2").mock(side_effect=_cache_api(animals))
+
+        result = await livestock._fetch_all_animals_for_cache(page_size=2)
+
+        assert [a["animalId"] for a in result] == [f"a{i}" for i in range(7)]
+        # First page, then one wave of MAX_CONCURRENT_REQUESTS pages
+        assert route.call_count == 1 + livestock.MAX_CONCURRENT_REQUESTS
+
+    async def test_single_short_page(self, mock_agriwebb):
+        """Verify a short first page ends pagination without further requests."""
+        animals = [make_animal("a1", "T1")]
+        route = mock_agriwebb.post("/v2").mock(side_effect=_cache_api(animals))
+
+        result = await livestock._fetch_all_animals_for_cache(page_size=2)
+
+        assert len(result) == 1
+        assert route.call_count == 1
+
+
+class TestCacheAllAnimals:
+    """Tests for the cache_all_animals download."""
+
+    async def test_builds_lookup_indices(self, mock_agriwebb, tmp_path):
+        """Verify id/name/vid/eid indices point at the right animal positions."""
+        animals = [
+            make_animal("a1", "TAG1", name="Daisy", eid="982000111"),
+            make_animal("a2", "TAG2"),
+            {**make_animal("a3"), "identity": None},
+        ]
+        mock_agriwebb.post("/v2").mock(side_effect=_cache_api(animals))
+
+        data = await livestock.cache_all_animals(tmp_path / "animals.json", with_indices=True)
+
+        indices = data["indices"]
+        assert indices["by_id"] == {"a1": 0, "a2": 1, "a3": 2}
+        assert indices["by_name"] == {"daisy": 0}
+        assert indices["by_vid"] == {"tag1": 0, "tag2": 1}
+        assert indices["by_eid"] == {"982000111": 0}
+        assert (tmp_path / "animals.json").exists()
+
+    async def test_omits_indices_by_default(self, mock_agriwebb, tmp_path):
+        """Verify the indices block is only written when requested."""
+        mock_agriwebb.post("/v2").mock(side_effect=_cache_api([make_animal("a1", "TAG1")]))
+
+        data = await livestock.cache_all_animals(tmp_path / "animals.json")
+
+        assert "indices" not in data
+        assert "indices" not in json.loads((tmp_path / "animals.json").read_text())
+
+    async def test_writes_compact_json_unless_pretty(self, mock_agriwebb, tmp_path):
+        """Verify the cache file is compact by default and indented with pretty=True."""
+        mock_agriwebb.post("/v2").mock(side_effect=_cache_api([make_animal("a1", "TAG1")]))
+
+        compact = await livestock.cache_all_animals(tmp_path / "compact.json")
+        await livestock.cache_all_animals(tmp_path / "pretty.json", pretty=True)
+
+        compact_text = (tmp_path / "compact.json").read_text()
+        assert "\n" not in compact_text
+        assert json.loads(compact_text)["animals"] == compact["animals"]
+        assert "\n  " in (tmp_path / "pretty.json").read_text()
+
+    async def test_fetches_records_in_aliased_batches(self, mock_agriwebb, tmp_path, monkeypatch):
+        """Verify records are fetched several animals per request and mapped back by alias."""
+        monkeypatch.setattr(livestock, "RECORDS_BATCH_SIZE", 2)
+        animals = [make_animal(f"a{i}", f"T{i}") for i in range(3)]
+        records = {"a0": [{"recordId": "r0"}], "a2": [{"recordId": "r2a"}, {"recordId": "r2b"}]}
+        route = mock_agriwebb.post("/v2").mock(side_effect=_cache_api(animals, records))
+
+        data = await livestock.cache_all_animals(tmp_path / "animals.json")
+
+        record_calls = [c for c in route.calls if b"GetRecords" in c.request.content]
+        assert len(record_calls) == 2
+        assert [len(a["records"]) for a in data["animals"]] == [1, 0, 2]
+        assert data["summary"]["total_records"] == 3
+
+    async def test_falls_back_to_single_animal_queries(self, mock_agriwebb, tmp_path):
+        """Verify a failed batch is retried one animal at a time."""
+        animals = [make_animal("a1", "T1"), make_animal("a2", "T2")]
+        records = {"a2": [{"recordId": "r1"}]}
+        mock_agriwebb.post("/v2").mock(side_effect=_cache_api(animals, records, fail_batches=True))
+
+        data = await livestock.cache_all_animals(tmp_path / "animals.json")
+
+        assert [len(a["records"]) for a in data["animals"]] == [0, 1]
+
+    async def test_extracts_unique_management_groups(self, mock_agriwebb, tmp_path):
+        """Verify management groups are deduplicated by ID and empty groups skipped."""
+        group = {"managementGroupId": "g1", "name": "Ewes", "species": "SHEEP"}
+        animals = [
+            {**make_animal("a1", "T1"), "managementGroup": group},
+            {**make_animal("a2", "T2"), "managementGroup": group},
+            {**make_animal("a3", "T3"), "managementGroup": {"managementGroupId": None}},
+        ]
+        mock_agriwebb.post("/v2").mock(side_effect=_cache_api(animals))
+
+        data = await livestock.cache_all_animals(tmp_path / "animals.json")
+
+        assert data["management_groups"] == [group]
+
+    async def test_workers_finish_before_client_closes(self, mock_agriwebb, tmp_path, monkeypatch):
+        """Verify one worker failing does not close the shared client under the others."""
+        import asyncio
+
+        monkeypatch.setattr(livestock, "RECORDS_BATCH_SIZE", 1)
+        monkeypatch.setattr(livestock, "MAX_CONCURRENT_REQUESTS", 3)
+        animals = [make_animal(f"a{i}", f"T{i}") for i in range(3)]
+        mock_agriwebb.post("/v2").mock(side_effect=_cache_api(animals))
+        in_flight = 0
+        in_flight_at_close = []
+
+        async def fake_batch(animal_ids):
+            nonlocal in_flight
+            in_flight += 1
+            try:
+                if animal_ids == ["a0"]:
+                    raise RuntimeError("boom")
+                await asyncio.sleep(0.01)
+                return {animal_id: [] for animal_id in animal_ids}
+            finally:
+                in_flight -= 1
+
+        async def fake_close():
+            in_flight_at_close.append(in_flight)
+
+        monkeypatch.setattr(livestock, "_fetch_animal_records_batch", fake_batch)
+        monkeypatch.setattr(livestock, "close_graphql_client", fake_close)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await livestock.cache_all_animals(tmp_path / "animals.json")
+
+        assert in_flight_at_close == [0]
@@ -1,6 +1,6 @@
 """Tests for Open-Meteo weather API integration."""
 
-from datetime import date
+from datetime import date, timedelta
 
 import pytest
 import respx
@@ -97,6 +97,37 @@ class TestFetchHistorical:
         request = route.calls[0].request
         assert "45" in str(request.url)
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_historical_splits_long_ranges(self):
+        """Long ranges are fetched as one archive request per span."""
+        route = respx.get(HISTORICAL_API).mock(
+            side_effect=lambda request: Response(
+                200,
+                json={
+                    "daily": {
+                        "time": [request.url.params["start_date"]],
+                        "temperature_2m_max": [10.0],
+                        "temperature_2m_min": [2.0],
+                        "temperature_2m_mean": [6.0],
+                        "precipitation_sum": [1.0],
+                        "et0_fao_evapotranspiration": [0.5],
+                    }
+                },
+            )
+        )
+
+        result = await fetch_historical(start_date=date(2020, 1, 1), end_date=date(2022, 6, 30))
+
+        assert route.call_count == 3
+        spans = sorted((c.request.url.params["start_date"], c.request.url.params["end_date"]) for c in route.calls)
+        assert spans == [
+            ("2020-01-01", "2020-12-31"),
+            ("2021-01-01", "2022-01-01"),
+            ("2022-01-02", "2022-06-30"),
+        ]
+        assert [r["date"] for r in result] == ["2020-01-01", "2021-01-01", "2022-01-02"]
+
 
 class TestFetchForecast:
     """Tests for forecast fetching."""
@@ -214,6 +245,105 @@ class TestUpdateWeatherCache:
         assert "location" in result
 
 
+class TestUpdateWeatherCacheMerge:
+    """Tests for merging forecast data into an existing cache."""
+
+    @respx.mock
+    async def test_forecast_replaces_future_days_only(self, tmp_path):
+        """Verify past cached days are kept, future days are replaced and new days appended."""
+        from datetime import timedelta
+
+        from agriwebb.weather.openmeteo import save_weather_cache
+
+        today = date.today()
+        past, future, new = (today - timedelta(days=2)), (today + timedelta(days=1)), (today + timedelta(days=2))
+        cache_path = save_weather_cache(
+            {
+                "location": {"lat": DEFAULT_LAT, "lon": DEFAULT_LON, "name": "Test"},
+                "fetched_at": "",
+                "daily_records": 2,
+                "daily_data": [
+                    {"date": past.isoformat(), "precip_mm": 1.0},
+                    {"date": future.isoformat(), "precip_mm": 1.0},
+                ],
+            },
+            tmp_path / "weather.json",
+        )
+        forecast = {
+            "daily": {
+                "time": [past.isoformat(), future.isoformat(), new.isoformat()],
+                "temperature_2m_max": [10.0, 10.0, 10.0],
+                "temperature_2m_min": [4.0, 4.0, 4.0],
+                "precipitation_sum": [9.0, 9.0, 9.0],
+                "et0_fao_evapotranspiration": [1.0, 1.0, 1.0],
+            }
+        }
+        respx.get(FORECAST_API).mock(return_value=Response(200, json=forecast))
+
+        result = await update_weather_cache(cache_path=cache_path)
+
+        assert [(d["date"], d["precip_mm"]) for d in result["daily_data"]] == [
+            (past.isoformat(), 1.0),
+            (future.isoformat(), 9.0),
+            (new.isoformat(), 9.0),
+        ]
+        assert result["daily_records"] == 3
+
+    @respx.mock
+    async def test_unchanged_cache_is_not_rewritten(self, tmp_path):
+        """Verify the cache file is left alone when the fetch adds nothing new."""
+        from datetime import timedelta
+
+        from agriwebb.weather.openmeteo import save_weather_cache
+
+        past = (date.today() - timedelta(days=2)).isoformat()
+        cache_path = save_weather_cache(
+            {
+                "location": {"lat": DEFAULT_LAT, "lon": DEFAULT_LON, "name": "Test"},
+                "fetched_at": "2026-01-15T00:00:00",
+                "daily_records": 1,
+                "daily_data": [{"date": past, "precip_mm": 1.0}],
+            },
+            tmp_path / "weather.json",
+        )
+        before = cache_path.read_bytes()
+        forecast = {
+            "daily": {
+                "time": [past],
+                "temperature_2m_max": [10.0],
+                "temperature_2m_min": [4.0],
+                "precipitation_sum": [9.0],
+                "et0_fao_evapotranspiration": [1.0],
+            }
+        }
+        respx.get(FORECAST_API).mock(return_value=Response(200, json=forecast))
+
+        result = await update_weather_cache(cache_path=cache_path)
+
+        assert result["fetched_at"] == "2026-01-15T00:00:00"
+        assert cache_path.read_bytes() == before
+
+
+class TestWeatherCacheFile:
+    """Tests for load_cached_weather / save_weather_cache."""
+
+    def test_round_trips_compact_json(self, tmp_path):
+        """Verify the cache is written compactly and loads back unchanged."""
+        from agriwebb.weather.openmeteo import load_cached_weather, save_weather_cache
+
+        data = {
+            "location": {"lat": DEFAULT_LAT, "lon": DEFAULT_LON, "name": "Test"},
+            "fetched_at": "2026-01-15T00:00:00",
+            "daily_records": 1,
+            "daily_data": [{"date": "2026-01-14", "temp_mean_c": 5.0, "precip_mm": 1.2}],
+        }
+
+        path = save_weather_cache(data, tmp_path / "weather.json")
+
+        assert "\n" not in path.read_text()
+        assert load_cached_weather(path) == data
+
+
 class TestDailyWeatherTypedDict:
     """Tests for DailyWeather structure."""
 
@@ -235,6 +365,100 @@ class TestDailyWeatherTypedDict:
         assert record["et0_mm"] == 1.5
 
 
+class TestGetClimatologyForDates:
+    """Tests for day-of-year climatology estimates."""
+
+    def test_averages_history_by_day_of_year(self):
+        """Verify each date gets the mean of the same day-of-year across years, or defaults."""
+        from agriwebb.weather.openmeteo import get_climatology_for_dates
+
+        history = [
+            {
+                "date": "2023-03-01",
+                "temp_mean_c": 8.0,
+                "temp_max_c": 12.0,
+                "temp_min_c": 4.0,
+                "precip_mm": 3.0,
+                "et0_mm": 1.0,
+            },
+            {
+                "date": "2025-03-01",
+                "temp_mean_c": 10.0,
+                "temp_max_c": 14.0,
+                "temp_min_c": 6.0,
+                "precip_mm": 0.0,
+                "et0_mm": 1.5,
+            },
+            {"date": "not-a-date", "temp_mean_c": 99.0},
+        ]
+
+        result = get_climatology_for_dates(date(2027, 3, 1), date(2027, 3, 2), history)
+
+        assert result[0] == {
+            "date": "2027-03-01",
+            "temp_mean_c": 9.0,
+            "temp_max_c": 13.0,
+            "temp_min_c": 5.0,
+            "precip_mm": 1.5,
+            "et0_mm": 1.25,
+        }
+        assert result[1]["date"] == "2027-03-02"
+        assert (result[1]["temp_mean_c"], result[1]["precip_mm"], result[1]["et0_mm"]) == (10.0, 2.0, 2.0)
+
+
+class TestGetWeeklySummary:
+    """Tests for the weekly forecast summary."""
+
+    def test_summarizes_week(self):
+        """Verify averages, extremes, totals and wet-day count come from one week of days."""
+        from agriwebb.weather.openmeteo import _get_weekly_summary
+
+        days = [
+            {"date": "2026-03-02", "temp_mean_c": 6.0, "temp_max_c": 9.0, "temp_min_c": 2.0, "precip_mm": 4.0},
+            {"date": "2026-03-03", "temp_mean_c": 8.0, "temp_max_c": 12.0, "temp_min_c": 3.5, "precip_mm": 0.05},
+            {"date": "2026-03-04", "temp_mean_c": 10.0, "temp_max_c": 11.0, "temp_min_c": 5.0, "precip_mm": 0.1},
+        ]
+
+        assert _get_weekly_summary(days) == {
+            "temp_avg_c": 8.0,
+            "temp_high_c": 12.0,
+            "temp_low_c": 2.0,
+            "precip_total_mm": pytest.approx(4.15),
+            "precip_days": 2,
+            "days": 3,
+        }
+        assert _get_weekly_summary([]) == {}
+
+
+class TestPrintWeeklyForecast:
+    """Tests for the weekly and monthly forecast tables."""
+
+    def test_weeks_end_on_sunday_and_months_group(self, capsys):
+        """Verify weeks break after each Sunday and the monthly outlook groups by calendar month."""
+        from agriwebb.weather.openmeteo import _print_weekly_forecast
+
+        # Thursday 2026-01-29 through Wednesday 2026-02-11
+        forecast = [
+            {
+                "date": (date(2026, 1, 29) + timedelta(days=i)).isoformat(),
+                "temp_mean_c": 5.0,
+                "temp_max_c": 8.0,
+                "temp_min_c": 2.0,
+                "precip_mm": 1.0,
+            }
+            for i in range(14)
+        ]
+
+        _print_weekly_forecast(forecast, api_days=7, total_days=60)
+        out = capsys.readouterr().out
+
+        assert "Jan 29 - Feb 01" in out
+        assert "Feb 02 - Feb 08" in out
+        assert "Feb 09 - Feb 11" in out
+        assert "over 3d" in out  # January 2026
+        assert "over 11d" in out  # February 2026
+
+
 class TestAPIEndpoints:
     """Tests for API endpoint configuration."""
 
@@ -172,12 +172,10 @@ class TestUpdatePaddockWeatherCache:
     @respx.mock
     @pytest.mark.asyncio
     async def test_survives_one_paddock_error(self, isolated_cache, mock_historical, mock_forecast):
-        # First call succeeds, second fails
-        call_count = [0]
-
+        # First paddock succeeds, second fails (the archive backfill may span
+        # several requests, so pick the failing paddock by latitude)
         def side_effect(request):
-            call_count[0] += 1
-            if call_count[0] <= 2:  # First paddock: historical + forecast
+            if request.url.params["latitude"] == "48.5":
                 return Response(200, json=mock_historical if "archive" in str(request.url) else mock_forecast)
             return Response(500, text="boom")
 
@@ -1,9 +1,12 @@
 """Tests for pasture growth model."""
 
+import json
 from datetime import date
 
+import httpx
 import pytest
 
+from agriwebb.core import AgriWebbAPIError
 from agriwebb.pasture.growth import (
     MOISTURE_OPTIMAL,
     MOISTURE_STRESS_POINT,
@@ -680,6 +683,110 @@ class TestFilterChangedGrowthRecords:
         assert "Paddock B" not in pushed_names  # Unchanged
 
 
+class TestSyncFooToAgriWebb:
+    """Tests for skipping already-synced FOO values."""
+
+    @staticmethod
+    def _foo_record(paddock_id, foo, record_date):
+        return {"paddock_id": paddock_id, "foo_kg_ha": foo, "date": record_date, "quality_flags": []}
+
+    async def test_skips_values_already_pushed(self, mock_agriwebb, tmp_path, monkeypatch):
+        """Only new or changed values are pushed on a re-run."""
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_cache_dir", lambda: tmp_path)
+        route = mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json={"data": {}}))
+        today = date.today().isoformat()
+
+        await feed.sync_foo_to_agriwebb([self._foo_record("f1", 1200.0, today), self._foo_record("f2", 900.0, today)])
+        await feed.sync_foo_to_agriwebb([self._foo_record("f1", 1200.0, today), self._foo_record("f2", 950.0, today)])
+
+        assert route.call_count == 2
+        pushed = json.loads(route.calls[1].request.content)["variables"]["input"]
+        assert [r["fieldId"] for r in pushed] == ["f2"]
+
+        result = await feed.sync_foo_to_agriwebb(
+            [self._foo_record("f1", 1200.0, today), self._foo_record("f2", 950.0, today)]
+        )
+        assert result == {"pushed": 0, "skipped": 2}
+        assert route.call_count == 2
+
+    async def test_blocking_quality_flags_are_not_pushed(self, mock_agriwebb, tmp_path, monkeypatch):
+        """Records flagged negative_ndvi or ndvi_over_1 are dropped; other flags are pushed."""
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_cache_dir", lambda: tmp_path)
+        route = mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json={"data": {}}))
+        today = date.today().isoformat()
+        records = [
+            {**self._foo_record("f1", 0.0, today), "quality_flags": ["negative_ndvi"]},
+            {**self._foo_record("f2", 2000.0, today), "quality_flags": ["ndvi_over_1"]},
+            {**self._foo_record("f3", 500.0, today), "quality_flags": ["near_bare", "high_tree_cover"]},
+        ]
+
+        await feed.sync_foo_to_agriwebb(records)
+
+        pushed = json.loads(route.calls[0].request.content)["variables"]["input"]
+        assert [r["fieldId"] for r in pushed] == ["f3"]
+
+    async def test_force_pushes_everything(self, mock_agriwebb, tmp_path, monkeypatch):
+        """--force ignores the ledger."""
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_cache_dir", lambda: tmp_path)
+        route = mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json={"data": {}}))
+        records = [self._foo_record("f1", 1200.0, date.today().isoformat())]
+
+        await feed.sync_foo_to_agriwebb(records)
+        await feed.sync_foo_to_agriwebb(records, force=True)
+
+        assert route.call_count == 2
+
+    async def test_failed_push_is_not_recorded(self, mock_agriwebb, tmp_path, monkeypatch):
+        """Records are retried on the next run if AgriWebb rejected them."""
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_cache_dir", lambda: tmp_path)
+        mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json={"errors": [{"message": "nope"}]}))
+
+        with pytest.raises(AgriWebbAPIError):
+            await feed.sync_foo_to_agriwebb([self._foo_record("f1", 1200.0, date.today().isoformat())])
+
+        assert feed.load_sync_ledger() == {}
+
+    def test_ledger_prunes_old_entries(self, tmp_path, monkeypatch):
+        """Entries older than AgriWebb's acceptance window are dropped on save."""
+        from datetime import timedelta
+
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(feed, "get_cache_dir", lambda: tmp_path)
+        today = date.today()
+        old = (today - timedelta(days=feed.SYNC_LEDGER_RETENTION_DAYS + 1)).isoformat()
+
+        feed.save_sync_ledger({f"foo|f1|{old}": 1.0, f"foo|f1|{today.isoformat()}": 2.0})
+
+        assert feed.load_sync_ledger() == {f"foo|f1|{today.isoformat()}": 2.0}
+
+
+class TestFeedCli:
+    """Tests for sync-foo argument handling."""
+
+    @pytest.mark.parametrize("top", ["0", "-3"])
+    async def test_rejects_non_positive_top(self, monkeypatch, capsys, top):
+        """--top must be at least 1 rather than slicing the table from the end."""
+        import sys
+
+        from agriwebb.sync import feed
+
+        monkeypatch.setattr(sys, "argv", ["sync-foo", "--top", top])
+
+        with pytest.raises(SystemExit):
+            await feed.main()
+
+        assert "--top must be a positive integer" in capsys.readouterr().err
+
+
 class TestGrowthValuesMatch:
     """Tests for the _growth_values_match helper function."""
 
@@ -753,3 +860,54 @@ class TestBuildExistingGrowthLookup:
 
         assert lookup[("f1", "2024-01-15")] == 25.0
         assert lookup[("f1", "2024-01-16")] == 28.0
+
+
+class TestUpdateNdviCacheSmart:
+    """Tests for incremental NDVI cache updates in the pasture cache command."""
+
+    async def test_reuses_months_settled_when_cached(self, tmp_path, monkeypatch, capsys):
+        """Months settled at the cache's fetched_at are not fetched from GEE again."""
+        import importlib
+
+        from agriwebb.satellite import gee
+
+        # agriwebb.pasture re-exports the cli() entry point, shadowing the module
+        pasture_cli = importlib.import_module("agriwebb.pasture.cli")
+
+        cached_history = [
+            {"date": f"2018-{m:02d}-01", "year": 2018, "month": m, "ndvi_mean": 0.6} for m in range(1, 13)
+        ]
+        (tmp_path / "ndvi_historical.json").write_text(
+            json.dumps(
+                {
+                    "fetched_at": "2019-03-15",
+                    "start_year": 2018,
+                    "paddock_count": 1,
+                    "paddocks": {"p1": {"name": "North", "history": cached_history}},
+                }
+            )
+        )
+        calls = []
+
+        def fake_extract(paddock, start, end, scale=30):
+            calls.append(start)
+            return {"ndvi_mean": 0.5, "ndvi_stddev": 0.1, "pixel_count": 10, "cloud_free_pct": 90}
+
+        async def fake_today():
+            return date(2019, 4, 10)
+
+        async def fake_fields(min_area_ha=0):
+            return [{"id": "p1", "name": "North", "geometry": {"type": "Polygon", "coordinates": []}}]
+
+        monkeypatch.setattr(pasture_cli, "get_cache_dir", lambda: tmp_path)
+        monkeypatch.setattr(pasture_cli, "get_farm_today", fake_today)
+        monkeypatch.setattr(pasture_cli, "get_fields", fake_fields)
+        monkeypatch.setattr(gee, "initialize", lambda project=None: None)
+        monkeypatch.setattr(gee, "extract_paddock_ndvi", fake_extract)
+
+        await pasture_cli.update_ndvi_cache_smart()
+
+        # Cached mid-March 2019: all of 2018 was settled; Jan-Apr 2019 are fetched
+        assert calls == ["2019-01-01", "2019-02-01", "2019-03-01", "2019-04-01"]
+        saved = json.loads((tmp_path / "ndvi_historical.json").read_text())
+        assert saved["paddocks"]["p1"]["history"][:12] == cached_history
@@ -33,6 +33,13 @@ class TestToTimestampMs:
         ts = to_timestamp_ms(date(1970, 1, 1))
         assert ts == 12 * 3600 * 1000  # 43200000
 
+    def test_repeated_dates_are_memoized(self):
+        """Converting the same date twice should hit the cache."""
+        to_timestamp_ms.cache_clear()
+        to_timestamp_ms("2024-01-15")
+        to_timestamp_ms("2024-01-15")
+        assert to_timestamp_ms.cache_info().hits == 1
+
     def test_import_from_weather_api(self):
         """The weather.api module should re-export the shared utility."""
         from agriwebb.weather.api import to_timestamp_ms as weather_ts
@@ -125,6 +125,16 @@ class TestLogWeather:
         # Verify it's a valid ISO timestamp (contains T separator)
         assert "T" in entry["logged_at"]
 
+    def test_log_weather_writes_compact_lines(self, tmp_path, monkeypatch):
+        """Verify each entry is a single compact JSON line."""
+        monkeypatch.setattr(weather, "get_cache_dir", lambda: tmp_path)
+
+        weather.log_weather({"date": "2026-01-15", "precipitation_inches": 0.25}, {"data": {}})
+
+        line = (tmp_path / "weather_log.jsonl").read_text()
+        assert line.endswith("\n")
+        assert line.startswith('{"date":"2026-01-15","precipitation_inches":0.25,')
+
 
 class TestFetchNceiDateRange:
     """Tests for the fetch_ncei_date_range function."""
@@ -185,6 +195,22 @@ class TestFetchNceiDateRange:
         assert result[0]["temp_max_f"] is None
         assert result[0]["temp_min_f"] is None
 
+    async def test_splits_long_ranges_into_ordered_spans(self, mock_ncei):
+        """Verify multi-year ranges are fetched as contiguous spans and merged in order."""
+
+        def echo_span(request):
+            return httpx.Response(
+                200, json=[{"DATE": request.url.params["startDate"], "STATION": "USW00094276", "PRCP": "0.1"}]
+            )
+
+        route = mock_ncei.get("/access/services/data/v1").mock(side_effect=echo_span)
+
+        result = await weather.fetch_ncei_date_range(date(2024, 1, 1), date(2025, 12, 31))
+
+        spans = sorted((c.request.url.params["startDate"], c.request.url.params["endDate"]) for c in route.calls)
+        assert spans == [("2024-01-01", "2024-12-31"), ("2025-01-01", "2025-12-31")]
+        assert [r["date"] for r in result] == ["2024-01-01", "2025-01-01"]
+
 
 class TestSaveWeatherJson:
     """Tests for the save_weather_json function."""
@@ -227,6 +253,19 @@ class TestSaveWeatherJson:
 
         assert path.name == "custom.json"
 
+    def test_writes_compact_json_unless_pretty(self, tmp_path, monkeypatch):
+        """Verify the file is compact by default and indented when pretty=True."""
+        monkeypatch.setattr(weather, "get_cache_dir", lambda: tmp_path)
+        weather_data = [{"date": "2026-01-15", "precipitation_inches": 0.25}]
+
+        compact = weather.save_weather_json(weather_data, filename="compact.json").read_text()
+        pretty = weather.save_weather_json(weather_data, filename="pretty.json", pretty=True).read_text()
+
+        assert "\n" not in compact
+        assert '"records":[{' in compact
+        assert json.loads(compact)["records"] == json.loads(pretty)["records"]
+        assert "\n  " in pretty
+
 
 class TestGetRainfalls:
     """Tests for the get_rainfalls function in client module."""
@@ -277,6 +316,19 @@ class TestGetRainfalls:
         body = route.calls[0].request.content.decode()
         assert "sensorId" in body
 
+    async def test_date_filters_use_static_query(self, mock_agriwebb):
+        """Verify start-only and ranged filters send the same query text with variables."""
+        route = mock_agriwebb.post("/v2").mock(return_value=httpx.Response(200, json={"data": {"rainfalls": []}}))
+
+        await weather_api.get_rainfalls(start_date="2026-01-01")
+        await weather_api.get_rainfalls(start_date="2026-01-01", end_date="2026-01-31")
+
+        first, second = (json.loads(call.request.content) for call in route.calls)
+        assert first["query"] == second["query"] == weather_api.RAINFALLS_TIME_RANGE_QUERY
+        assert first["variables"]["startTime"] == second["variables"]["startTime"]
+        assert first["variables"]["endTime"] == weather_api.RAINFALLS_MAX_TIME_MS
+        assert second["variables"]["endTime"] < weather_api.RAINFALLS_MAX_TIME_MS
+
 
 class TestRainfallIntegration:
     """Integration tests for the full rainfall flow."""
@@ -579,3 +631,183 @@ class TestCalculateTotalDays:
         from agriwebb.weather.cli import _calculate_total_days
 
         assert _calculate_total_days(None, None, None) == 0
+
+
+class TestUpdateNoaaCache:
+    """Tests for the update_noaa_cache function."""
+
+    async def test_returns_messages_instead_of_printing(self, tmp_path, monkeypatch, capsys):
+        """Verify status lines are returned so cmd_cache can print them after gathering."""
+        import importlib
+
+        # agriwebb.weather re-exports the cli() entry point, shadowing the module
+        weather_cli = importlib.import_module("agriwebb.weather.cli")
+
+        (tmp_path / "noaa_weather.json").write_text(json.dumps({"records": [{"date": "2026-01-21"}]}))
+
+        async def fake_today():
+            return date(2026, 1, 15)
+
+        monkeypatch.setattr(weather_cli, "get_cache_dir", lambda: tmp_path)
+        monkeypatch.setattr(weather_cli, "get_farm_today", fake_today)
+
+        messages = await weather_cli.update_noaa_cache()
+
+        assert messages == ["Cache has data through 2026-01-21", "Cache is up to date"]
+        assert capsys.readouterr().out == ""
+
+
+class TestCmdList:
+    """Tests for the list command."""
+
+    async def test_skips_records_without_time(self, monkeypatch, capsys):
+        """Verify a rainfall with no time is left out of the date range instead of failing."""
+        import argparse
+        import importlib
+
+        weather_cli = importlib.import_module("agriwebb.weather.cli")
+
+        async def fake_get_rainfalls():
+            return [{"id": "r0", "value": 1.0}, {"time": 1705406400000}, {"time": 1705320000000}]
+
+        monkeypatch.setattr(weather_cli.weather_api, "get_rainfalls", fake_get_rainfalls)
+
+        await weather_cli.cmd_list(argparse.Namespace())
+
+        out = capsys.readouterr().out
+        assert "Found 3 rainfall records." in out
+        assert "Date range: 2024-01-15 to 2024-01-16" in out
+
+
+class TestFetchCombinedPrecipitation:
+    """Tests for the fetch_combined_precipitation function."""
+
+    async def test_fetches_sources_concurrently(self, monkeypatch):
+        """Verify NOAA and Open-Meteo are requested at the same time and NOAA wins per date."""
+        import asyncio
+
+        started = []
+
+        async def fake_noaa(start, end):
+            started.append("noaa")
+            await asyncio.sleep(0.01)
+            assert "open-meteo" in started
+            return [{"date": "2026-01-01", "precipitation_inches": 0.1}]
+
+        async def fake_openmeteo(start, end):
+            started.append("open-meteo")
+            await asyncio.sleep(0.01)
+            return [
+                {"date": "2026-01-01", "precipitation_inches": 0.5, "source": "open-meteo"},
+                {"date": "2026-01-02", "precipitation_inches": 0.2, "source": "open-meteo"},
+            ]
+
+        monkeypatch.setattr(weather, "fetch_ncei_date_range", fake_noaa)
+        monkeypatch.setattr(weather, "fetch_openmeteo_precipitation", fake_openmeteo)
+
+        result = await weather.fetch_combined_precipitation(date(2026, 1, 1), date(2026, 1, 2))
+
+        assert [(r["date"], r["source"]) for r in result] == [("2026-01-01", "noaa"), ("2026-01-02", "open-meteo")]
+
+    async def test_falls_back_to_openmeteo_when_noaa_fails(self, monkeypatch):
+        """Verify a NOAA failure still returns the Open-Meteo records."""
+        from agriwebb.core.client import ExternalAPIError
+
+        async def failing_noaa(start, end):
+            raise ExternalAPIError("HTTP 503")
+
+        async def fake_openmeteo(start, end):
+            return [{"date": "2026-01-01", "precipitation_inches": 0.5, "source": "open-meteo"}]
+
+        monkeypatch.setattr(weather, "fetch_ncei_date_range", failing_noaa)
+        monkeypatch.setattr(weather, "fetch_openmeteo_precipitation", fake_openmeteo)
+
+        result = await weather.fetch_combined_precipitation(date(2026, 1, 1), date(2026, 1, 1))
+
+        assert [r["source"] for r in result] == ["open-meteo"]
+
+    async def test_raises_when_both_sources_fail(self, monkeypatch):
+        """Verify an error is raised rather than returning nothing when both sources fail."""
+        from agriwebb.core.client import ExternalAPIError
+
+        async def failing(start, end):
+            raise ExternalAPIError("down")
+
+        monkeypatch.setattr(weather, "fetch_ncei_date_range", failing)
+        monkeypatch.setattr(weather, "fetch_openmeteo_precipitation", failing)
+
+        with pytest.raises(ExternalAPIError):
+            await weather.fetch_combined_precipitation(date(2026, 1, 1), date(2026, 1, 1))
+
+    def _patch_station_cache(self, tmp_path, monkeypatch, records, generated_at, today):
+        """Write a NOAA station cache and pin the farm clock; returns the list of fetched ranges."""
+        from zoneinfo import ZoneInfo
+
+        (tmp_path / weather.NOAA_CACHE_FILE).write_text(
+            json.dumps(
+                {"station_id": weather.settings.ncei_station_id, "generated_at": generated_at, "records": records}
+            )
+        )
+        requested = []
+
+        async def fake_noaa(start, end):
+            requested.append((start, end))
+            return [
+                {"date": date.fromordinal(d).isoformat(), "precipitation_inches": 0.3}
+                for d in range(start.toordinal(), end.toordinal() + 1)
+            ]
+
+        async def fake_openmeteo(start, end):
+            return []
+
+        async def fake_tz():
+            return ZoneInfo("America/Los_Angeles")
+
+        async def fake_today():
+            return today
+
+        monkeypatch.setattr(weather, "get_cache_dir", lambda: tmp_path)
+        monkeypatch.setattr(weather, "get_farm_timezone", fake_tz)
+        monkeypatch.setattr(weather, "get_farm_today", fake_today)
+        monkeypatch.setattr(weather, "fetch_ncei_date_range", fake_noaa)
+        monkeypatch.setattr(weather, "fetch_openmeteo_precipitation", fake_openmeteo)
+        return requested
+
+    async def test_reuses_settled_station_cache(self, tmp_path, monkeypatch):
+        """Verify cached settled NOAA days are not downloaded again."""
+        cached = [{"date": f"2026-01-{day:02d}", "precipitation_inches": 0.1} for day in range(1, 11)]
+        requested = self._patch_station_cache(
+            tmp_path, monkeypatch, cached, "2026-01-20T18:00:00+00:00", date(2026, 1, 25)
+        )
+
+        result = await weather.fetch_combined_precipitation(date(2026, 1, 1), date(2026, 1, 11))
+
+        assert requested == [(date(2026, 1, 11), date(2026, 1, 11))]
+        assert [r["date"] for r in result] == [f"2026-01-{day:02d}" for day in range(1, 12)]
+        assert [r["precipitation_inches"] for r in result[:10]] == [0.1] * 10
+
+    async def test_refetches_days_that_were_preliminary_when_cached(self, tmp_path, monkeypatch):
+        """Verify settledness is judged from the cache's fetch time, not today."""
+        cached = [{"date": f"2026-01-{day:02d}", "precipitation_inches": 0.1} for day in range(1, 11)]
+        # Fetched on Jan 12 farm time: only days through Jan 5 were settled then,
+        # even though every cached day is more than a week old today
+        requested = self._patch_station_cache(
+            tmp_path, monkeypatch, cached, "2026-01-12T20:00:00+00:00", date(2026, 2, 1)
+        )
+
+        result = await weather.fetch_combined_precipitation(date(2026, 1, 1), date(2026, 1, 10))
+
+        assert requested == [(date(2026, 1, 6), date(2026, 1, 10))]
+        assert [r["precipitation_inches"] for r in result] == [0.1] * 5 + [0.3] * 5
+
+    async def test_refetches_gaps_in_station_cache(self, tmp_path, monkeypatch):
+        """Verify a day missing from the cache is fetched rather than skipped."""
+        cached = [{"date": f"2026-01-{day:02d}", "precipitation_inches": 0.1} for day in range(1, 11) if day != 4]
+        requested = self._patch_station_cache(
+            tmp_path, monkeypatch, cached, "2026-01-20T18:00:00+00:00", date(2026, 1, 25)
+        )
+
+        result = await weather.fetch_combined_precipitation(date(2026, 1, 1), date(2026, 1, 10))
+
+        assert requested == [(date(2026, 1, 4), date(2026, 1, 10))]
+        assert [r["date"] for r in result] == [f"2026-01-{day:02d}" for day in range(1, 11)]